@@ -0,0 +1,56 @@
+"""per-tenant audit hash chains
+
+Revision ID: b63d1a828383
+Revises: ca250743579c
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b63d1a828383"
+down_revision: Union[str, Sequence[str], None] = "ca250743579c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1) One head row per chain ("tenant:<id>" or "global")
+    op.create_table(
+        "audit_chain_heads",
+        sa.Column("chain_key", sa.String(32), primary_key=True),
+        sa.Column("tenant_id", sa.Integer(), nullable=True),
+        sa.Column("last_hash", sa.String(64), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+    # 2) Chain membership per entry.
+    # Existing rows keep NULL = the legacy single global chain; ADD COLUMN
+    # rewrites no rows, so the immutability triggers are not involved.
+    op.add_column(
+        "authorization_audit_logs",
+        sa.Column("chain_key", sa.String(32), nullable=True),
+    )
+    op.create_index(
+        "ix_auth_audit_chain",
+        "authorization_audit_logs",
+        ["chain_key", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_auth_audit_chain", table_name="authorization_audit_logs")
+    op.drop_column("authorization_audit_logs", "chain_key")
+    op.drop_table("audit_chain_heads")
@@ -0,0 +1,59 @@
+"""audit chain head sequence numbers
+
+Revision ID: a718d151f8e5
+Revises: b63d1a828383
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a718d151f8e5"
+down_revision: Union[str, Sequence[str], None] = "b63d1a828383"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1) Head sequence, backfilled with the current chain length
+    op.add_column(
+        "audit_chain_heads",
+        sa.Column("seq", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE audit_chain_heads
+        SET seq = (
+            SELECT COUNT(*)
+            FROM authorization_audit_logs
+            WHERE authorization_audit_logs.chain_key = audit_chain_heads.chain_key
+        )
+        """
+    )
+
+    # 2) Per-entry position. Existing rows stay NULL (the table is
+    # append-only, so they can't be backfilled); the verifier orders
+    # them first, by id.
+    op.add_column(
+        "authorization_audit_logs",
+        sa.Column("chain_seq", sa.BigInteger(), nullable=True),
+    )
+    op.create_index(
+        "ux_auth_audit_chain_seq",
+        "authorization_audit_logs",
+        ["chain_key", "chain_seq"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ux_auth_audit_chain_seq", table_name="authorization_audit_logs")
+    op.drop_column("authorization_audit_logs", "chain_seq")
+    op.drop_column("audit_chain_heads", "seq")
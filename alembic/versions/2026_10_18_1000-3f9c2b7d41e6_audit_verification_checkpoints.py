@@ -0,0 +1,44 @@
+"""audit verification checkpoints
+
+Revision ID: 3f9c2b7d41e6
+Revises: a718d151f8e5
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2b7d41e6"
+down_revision: Union[str, Sequence[str], None] = "a718d151f8e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "audit_verification_checkpoints",
+        sa.Column("chain_key", sa.String(length=32), nullable=False),
+        sa.Column("last_id", sa.Integer(), nullable=False),
+        sa.Column("last_seq", sa.BigInteger(), nullable=True),
+        sa.Column("last_hash", sa.String(length=64), nullable=True),
+        sa.Column("entries_verified", sa.BigInteger(), nullable=False),
+        sa.Column("signature", sa.String(length=64), nullable=False),
+        sa.Column(
+            "verified_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("chain_key"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("audit_verification_checkpoints")
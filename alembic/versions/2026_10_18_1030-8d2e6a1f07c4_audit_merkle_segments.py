@@ -0,0 +1,60 @@
+"""audit merkle segments
+
+Revision ID: 8d2e6a1f07c4
+Revises: 3f9c2b7d41e6
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e6a1f07c4"
+down_revision: Union[str, Sequence[str], None] = "3f9c2b7d41e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "audit_merkle_segments",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("chain_key", sa.String(length=32), nullable=False),
+        sa.Column("segment_index", sa.Integer(), nullable=False),
+        sa.Column("first_id", sa.Integer(), nullable=False),
+        sa.Column("last_id", sa.Integer(), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("root", sa.String(length=64), nullable=False),
+        sa.Column("last_hash", sa.String(length=64), nullable=True),
+        sa.Column("signature", sa.String(length=64), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_audit_merkle_segment",
+        "audit_merkle_segments",
+        ["chain_key", "segment_index"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_audit_merkle_segment_range",
+        "audit_merkle_segments",
+        ["chain_key", "last_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_audit_merkle_segment_range", table_name="audit_merkle_segments")
+    op.drop_index("ux_audit_merkle_segment", table_name="audit_merkle_segments")
+    op.drop_table("audit_merkle_segments")
@@ -0,0 +1,196 @@
+"""partition authorization audit logs by month
+
+Revision ID: 5b1e9c0d7a24
+Revises: 8d2e6a1f07c4
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e9c0d7a24"
+down_revision: Union[str, Sequence[str], None] = "8d2e6a1f07c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = "authorization_audit_logs"
+OLD_TABLE_NAME = "authorization_audit_logs_unpartitioned"
+SEQUENCE_NAME = "authorization_audit_logs_id_seq"
+FUNCTION_NAME = "prevent_authorization_audit_log_modification"
+
+# Months pre-created past the current one; the maintenance job
+# (scripts/maintain_audit_partitions.py) keeps this window rolling.
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, tenant_id, permission, allowed, reason, endpoint, method, "
+    "context, chain_key, chain_seq, signature, prev_hash, entry_hash, "
+    "integrity_ok, created_at"
+)
+
+INDEXES = (
+    ("ix_auth_audit_user_tenant_time", ["user_id", "tenant_id", "created_at"]),
+    ("ix_auth_audit_tenant_time", ["tenant_id", "created_at"]),
+    ("ix_auth_audit_chain", ["chain_key", "id"]),
+    ("ix_authorization_audit_logs_tenant_id", ["tenant_id"]),
+    ("ix_authorization_audit_logs_user_id", ["user_id"]),
+)
+
+
+def _columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text(f"nextval('{SEQUENCE_NAME}'::regclass)"),
+            autoincrement=False,
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("tenant_id", sa.Integer(), nullable=True),
+        sa.Column("permission", sa.String(100), nullable=False),
+        sa.Column("allowed", sa.Boolean(), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("endpoint", sa.String(255), nullable=True),
+        sa.Column("method", sa.String(10), nullable=True),
+        sa.Column("context", sa.Text(), nullable=True),
+        sa.Column("prev_hash", sa.String(64), nullable=True),
+        sa.Column("entry_hash", sa.String(64), nullable=False),
+        sa.Column("signature", sa.String(64), nullable=False),
+        sa.Column(
+            "integrity_ok",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.true(),
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("chain_key", sa.String(32), nullable=True),
+        sa.Column("chain_seq", sa.BigInteger(), nullable=True),
+    ]
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _protect(name: str) -> None:
+    # Per partition, NOT on the parent: cloned triggers are dropped on
+    # DETACH and archived partitions must stay immutable.
+    for action in ("UPDATE", "DELETE"):
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_auth_audit_no_{action.lower()}
+            BEFORE {action} ON {name}
+            FOR EACH ROW
+            EXECUTE FUNCTION {FUNCTION_NAME}();
+            """
+        )
+
+
+def _create_partition(month: date) -> None:
+    name = f"{TABLE_NAME}_{month:%Y_%m}"
+    op.execute(
+        f"""
+        CREATE TABLE {name} PARTITION OF {TABLE_NAME}
+        FOR VALUES FROM ('{month.isoformat()} 00:00:00+00')
+        TO ('{_add_months(month, 1).isoformat()} 00:00:00+00');
+        """
+    )
+    # Fork guard, per partition (a partitioned unique index would have
+    # to include created_at); audit_chain_heads CAS still guards globally.
+    op.execute(
+        f"CREATE UNIQUE INDEX ux_{name}_chain_seq ON {name} (chain_key, chain_seq);"
+    )
+    _protect(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1) Move the heap aside; its index names are reused below
+    op.rename_table(TABLE_NAME, OLD_TABLE_NAME)
+    op.execute(f"ALTER INDEX {TABLE_NAME}_pkey RENAME TO {OLD_TABLE_NAME}_pkey;")
+    op.drop_index("ux_auth_audit_chain_seq", table_name=OLD_TABLE_NAME)
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name=OLD_TABLE_NAME)
+
+    # 2) Partitioned parent. The partition key must be part of the PK.
+    op.create_table(
+        TABLE_NAME,
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    for name, columns in INDEXES:
+        op.create_index(name, TABLE_NAME, columns)
+
+    # 3) Monthly partitions covering existing rows + the next months,
+    # and a default partition so a late maintenance run never loses writes
+    first = op.get_bind().scalar(
+        sa.text(
+            f"SELECT date_trunc('month', MIN(created_at) AT TIME ZONE 'UTC')::date "
+            f"FROM {OLD_TABLE_NAME}"
+        )
+    )
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    month = min(first or current, current)
+    while month <= _add_months(current, MONTHS_AHEAD):
+        _create_partition(month)
+        month = _add_months(month, 1)
+
+    op.execute(f"CREATE TABLE {TABLE_NAME}_default PARTITION OF {TABLE_NAME} DEFAULT;")
+    op.execute(
+        f"CREATE UNIQUE INDEX ux_{TABLE_NAME}_default_chain_seq "
+        f"ON {TABLE_NAME}_default (chain_key, chain_seq);"
+    )
+    _protect(f"{TABLE_NAME}_default")
+
+    # 4) Copy (one transaction: run in a maintenance window on big tables)
+    op.execute(
+        f"INSERT INTO {TABLE_NAME} ({COLUMNS}) SELECT {COLUMNS} FROM {OLD_TABLE_NAME};"
+    )
+    op.execute(f"ALTER SEQUENCE {SEQUENCE_NAME} OWNED BY {TABLE_NAME}.id;")
+    op.drop_table(OLD_TABLE_NAME)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # NOTE: rows in partitions detached since the upgrade are NOT merged
+    # back; re-attach them first if they must survive the downgrade.
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name=TABLE_NAME)
+    op.rename_table(TABLE_NAME, OLD_TABLE_NAME)
+    op.execute(f"ALTER INDEX {TABLE_NAME}_pkey RENAME TO {OLD_TABLE_NAME}_pkey;")
+
+    op.create_table(
+        TABLE_NAME,
+        *_columns(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        f"INSERT INTO {TABLE_NAME} ({COLUMNS}) SELECT {COLUMNS} FROM {OLD_TABLE_NAME};"
+    )
+    op.execute(f"ALTER SEQUENCE {SEQUENCE_NAME} OWNED BY {TABLE_NAME}.id;")
+    op.drop_table(OLD_TABLE_NAME)
+
+    for name, columns in INDEXES:
+        op.create_index(name, TABLE_NAME, columns)
+    op.create_index(
+        "ux_auth_audit_chain_seq",
+        TABLE_NAME,
+        ["chain_key", "chain_seq"],
+        unique=True,
+    )
+    _protect(TABLE_NAME)
@@ -0,0 +1,88 @@
+"""store refresh tokens as sha-256 digests
+
+Revision ID: c3a9f6e2b814
+Revises: 5b1e9c0d7a24
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9f6e2b814"
+down_revision: Union[str, Sequence[str], None] = "5b1e9c0d7a24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = "refresh_tokens"
+INDEX_NAME = "ix_refresh_token_digest_tenant"
+# Plaintext-era indexes; not every database has both
+OLD_INDEXES = ("ix_refresh_tokens_token", "ix_refresh_token_token_tenant")
+
+
+def _columns() -> set[str]:
+    return {c["name"] for c in sa.inspect(op.get_bind()).get_columns(TABLE_NAME)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = _columns()
+
+    # Columns the model has carried for a while but no revision added
+    if "revoked" not in columns:
+        op.add_column(
+            TABLE_NAME,
+            sa.Column(
+                "revoked", sa.Boolean(), server_default=sa.false(), nullable=False
+            ),
+        )
+    if "revoked_at" not in columns:
+        op.add_column(TABLE_NAME, sa.Column("revoked_at", sa.DateTime(timezone=True)))
+
+    # Must match app.core.security.refresh_token_digest: sha256(utf-8)
+    op.add_column(TABLE_NAME, sa.Column("token_digest", sa.LargeBinary(32)))
+    op.add_column(TABLE_NAME, sa.Column("replaced_by_digest", sa.LargeBinary(32)))
+    op.execute(
+        f"UPDATE {TABLE_NAME} SET token_digest = sha256(convert_to(token, 'UTF8'))"
+    )
+    if "replaced_by_token" in columns:
+        op.execute(
+            f"UPDATE {TABLE_NAME} "
+            "SET replaced_by_digest = sha256(convert_to(replaced_by_token, 'UTF8')) "
+            "WHERE replaced_by_token IS NOT NULL"
+        )
+        op.drop_column(TABLE_NAME, "replaced_by_token")
+
+    for name in OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_column(TABLE_NAME, "token")
+
+    op.alter_column(TABLE_NAME, "token_digest", nullable=False)
+    op.create_index(INDEX_NAME, TABLE_NAME, ["token_digest", "tenant_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Digests can't be reversed: the restored `token` holds the hex digest,
+    which no client has, so every session has to log in again.
+    """
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+
+    op.add_column(TABLE_NAME, sa.Column("token", sa.String()))
+    op.add_column(TABLE_NAME, sa.Column("replaced_by_token", sa.String()))
+    op.execute(
+        f"UPDATE {TABLE_NAME} SET token = encode(token_digest, 'hex'), "
+        "replaced_by_token = encode(replaced_by_digest, 'hex')"
+    )
+    op.alter_column(TABLE_NAME, "token", nullable=False)
+    op.create_index("ix_refresh_tokens_token", TABLE_NAME, ["token"], unique=True)
+    op.create_index("ix_refresh_token_token_tenant", TABLE_NAME, ["token", "tenant_id"])
+
+    op.drop_column(TABLE_NAME, "replaced_by_digest")
+    op.drop_column(TABLE_NAME, "token_digest")
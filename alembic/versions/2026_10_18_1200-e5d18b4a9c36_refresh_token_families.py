@@ -0,0 +1,62 @@
+"""refresh token families
+
+Revision ID: e5d18b4a9c36
+Revises: c3a9f6e2b814
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5d18b4a9c36"
+down_revision: Union[str, Sequence[str], None] = "c3a9f6e2b814"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = "refresh_tokens"
+INDEX_NAME = "ix_refresh_token_family"
+
+# Existing lineages: a fresh family per chain root (a token nothing was
+# rotated into), inherited along replaced_by_digest.
+BACKFILL_FAMILIES = """
+WITH RECURSIVE lineage (id, tenant_id, replaced_by_digest, family_id) AS (
+    SELECT r.id, r.tenant_id, r.replaced_by_digest,
+           replace(gen_random_uuid()::text, '-', '')
+    FROM refresh_tokens r
+    WHERE NOT EXISTS (
+        SELECT 1 FROM refresh_tokens p
+        WHERE p.replaced_by_digest = r.token_digest
+          AND p.tenant_id = r.tenant_id
+    )
+    UNION ALL
+    SELECT c.id, c.tenant_id, c.replaced_by_digest, l.family_id
+    FROM lineage l
+    JOIN refresh_tokens c
+      ON c.token_digest = l.replaced_by_digest
+     AND c.tenant_id = l.tenant_id
+)
+UPDATE refresh_tokens t
+SET family_id = l.family_id
+FROM lineage l
+WHERE t.id = l.id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(TABLE_NAME, sa.Column("family_id", sa.String(32)))
+    op.execute(BACKFILL_FAMILIES)
+    op.alter_column(TABLE_NAME, "family_id", nullable=False)
+    op.create_index(INDEX_NAME, TABLE_NAME, ["family_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+    op.drop_column(TABLE_NAME, "family_id")
@@ -0,0 +1,39 @@
+"""refresh token gc indexes
+
+Revision ID: 7b42d9e0c5a1
+Revises: e5d18b4a9c36
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b42d9e0c5a1"
+down_revision: Union[str, Sequence[str], None] = "e5d18b4a9c36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = "refresh_tokens"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_refresh_token_expires", TABLE_NAME, ["expires_at"])
+    op.create_index(
+        "ix_refresh_token_revoked_at",
+        TABLE_NAME,
+        ["revoked_at"],
+        postgresql_where=sa.text("revoked_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_refresh_token_revoked_at", table_name=TABLE_NAME)
+    op.drop_index("ix_refresh_token_expires", table_name=TABLE_NAME)
@@ -0,0 +1,47 @@
+"""user token epoch
+
+Revision ID: 9f3c6a2d8e15
+Revises: 7b42d9e0c5a1
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9f3c6a2d8e15"
+down_revision: Union[str, Sequence[str], None] = "7b42d9e0c5a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = "users"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns(TABLE_NAME)}
+
+    # Deactivation revokes sessions through is_active, which the model
+    # has carried without a revision creating it
+    if "is_active" not in columns:
+        op.add_column(
+            TABLE_NAME,
+            sa.Column(
+                "is_active", sa.Boolean(), server_default=sa.true(), nullable=False
+            ),
+        )
+
+    op.add_column(
+        TABLE_NAME,
+        sa.Column("token_epoch", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column(TABLE_NAME, "token_epoch")
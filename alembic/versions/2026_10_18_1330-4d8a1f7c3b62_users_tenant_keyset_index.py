@@ -0,0 +1,42 @@
+"""users tenant keyset index
+
+Revision ID: 4d8a1f7c3b62
+Revises: 9f3c6a2d8e15
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d8a1f7c3b62"
+down_revision: Union[str, Sequence[str], None] = "9f3c6a2d8e15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLE_NAME = "users"
+INDEX_NAME = "ix_users_tenant_id_id"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(INDEX_NAME, TABLE_NAME, ["tenant_id", "id"])
+
+    # Databases built from the models carry a single-column index that
+    # the composite one's prefix now covers
+    indexes = {i["name"] for i in sa.inspect(op.get_bind()).get_indexes(TABLE_NAME)}
+    if "ix_users_tenant_id" in indexes:
+        op.drop_index("ix_users_tenant_id", table_name=TABLE_NAME)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The previous models index tenant_id on its own; restore it before
+    # the composite goes so tenant lookups are never left unindexed
+    op.create_index("ix_users_tenant_id", TABLE_NAME, ["tenant_id"])
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
@@ -1,37 +1,35 @@
 # app/api/v1/auth.py
 from fastapi import APIRouter, Depends, HTTPException, Request, Body, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.core.database import get_db
-from app.models.tenant import Tenant
-from app.schemas.user import UserCreate, UserPublic
+from app.core.deps import get_current_user, get_current_user_tenant
+from app.core.password_hashing import PasswordHasherBusy
+from app.core.principal import TenantRef
+from app.core.tenant_cache import get_default_tenant
+from app.models.user import User
+from app.schemas.user import PasswordChange, UserCreate, UserPublic
 from app.schemas.token import Token
 from app.services import auth_service
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-def _get_default_tenant(db: Session) -> Optional[Tenant]:
-    return db.query(Tenant).first()
+def _get_default_tenant(db: Session) -> Optional[TenantRef]:
+    return get_default_tenant(db)
 
 
-@router.post(
-    "/register", response_model=UserPublic, status_code=status.HTTP_201_CREATED
-)
-def register(user_in: UserCreate, db: Session = Depends(get_db)):
-    tenant = _get_default_tenant(db)
-    if not tenant:
-        raise HTTPException(status_code=500, detail="No tenant available")
-
-    try:
-        return auth_service.register_user(db, tenant, user_in)
-    except auth_service.AuthError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication temporarily unavailable, retry later",
+        headers={"Retry-After": "1"},
+    )
 
 
-@router.post("/login", response_model=Token, status_code=status.HTTP_200_OK)
-async def login(request: Request, db: Session = Depends(get_db)):
+async def _read_credentials(request: Request) -> tuple[str, str]:
     content_type = request.headers.get("content-type", "")
     email = password = None
 
@@ -49,6 +47,26 @@ async def login(request: Request, db: Session = Depends(get_db)):
             status_code=422, detail="email/username and password are required"
         )
 
+    return email, password
+
+
+@router.post(
+    "/register", response_model=UserPublic, status_code=status.HTTP_201_CREATED
+)
+def register(user_in: UserCreate, db: Session = Depends(get_db)):
+    tenant = _get_default_tenant(db)
+    if not tenant:
+        raise HTTPException(status_code=500, detail="No tenant available")
+
+    try:
+        return auth_service.register_user(db, tenant, user_in)
+    except auth_service.AuthError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+
+def _login(db: Session, email: str, password: str) -> Token:
     tenant = _get_default_tenant(db)
     if not tenant:
         raise HTTPException(status_code=500, detail="No tenant available")
@@ -57,6 +75,17 @@ async def login(request: Request, db: Session = Depends(get_db)):
         return auth_service.authenticate_user(db, tenant, email, password)
     except auth_service.AuthError as e:
         raise HTTPException(status_code=401, detail=str(e))
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+
+@router.post("/login", response_model=Token, status_code=status.HTTP_200_OK)
+async def login(request: Request, db: Session = Depends(get_db)):
+    # Only the body is read on the loop; the sync Session lookups and
+    # the token insert run in the threadpool (the Argon2 verify itself
+    # on the hashing pool)
+    email, password = await _read_credentials(request)
+    return await run_in_threadpool(_login, db, email, password)
 
 
 @router.post("/refresh", response_model=Token, status_code=status.HTTP_200_OK)
@@ -74,3 +103,34 @@ def refresh_token(payload: dict = Body(...), db: Session = Depends(get_db)):
     except auth_service.AuthError as e:
         # return HTTP 401 with the same error text
         raise HTTPException(status_code=401, detail=str(e))
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+def logout_all(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    End every session of the caller, this one included.
+    """
+    auth_service.invalidate_sessions(db, current_user.id)
+
+
+@router.post("/password", response_model=Token, status_code=status.HTTP_200_OK)
+def change_password(
+    body: PasswordChange,
+    current_user: User = Depends(get_current_user),
+    tenant: TenantRef = Depends(get_current_user_tenant),
+    db: Session = Depends(get_db),
+):
+    """
+    Other sessions are ended; the returned tokens replace the caller's.
+    """
+    try:
+        return auth_service.change_password(
+            db, tenant, current_user, body.current_password, body.new_password
+        )
+    except auth_service.AuthError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+    except PasswordHasherBusy:
+        raise _hasher_busy()
@@ -0,0 +1,101 @@
+# app/api/v1/auth_async.py
+"""
+AsyncSession flavour of app.api.v1.auth, mounted instead of it when
+DATABASE_ASYNC_ENABLED is set. Same routes, payloads and errors.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request, Body, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.api.v1.auth import _hasher_busy, _read_credentials
+from app.core.database import get_async_db
+from app.core.deps import get_current_user, get_current_user_tenant
+from app.core.password_hashing import PasswordHasherBusy
+from app.core.principal import TenantRef
+from app.core.tenant_cache import get_default_tenant_async
+from app.models.user import User
+from app.schemas.user import PasswordChange, UserCreate, UserPublic
+from app.schemas.token import Token
+from app.services import auth_service_async as auth_service
+from app.services.auth_service import AuthError
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+
+async def _get_default_tenant(db: AsyncSession) -> Optional[TenantRef]:
+    return await get_default_tenant_async(db)
+
+
+@router.post(
+    "/register", response_model=UserPublic, status_code=status.HTTP_201_CREATED
+)
+async def register(user_in: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    tenant = await _get_default_tenant(db)
+    if not tenant:
+        raise HTTPException(status_code=500, detail="No tenant available")
+
+    try:
+        return await auth_service.register_user(db, tenant, user_in)
+    except AuthError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+
+@router.post("/login", response_model=Token, status_code=status.HTTP_200_OK)
+async def login(request: Request, db: AsyncSession = Depends(get_async_db)):
+    email, password = await _read_credentials(request)
+
+    tenant = await _get_default_tenant(db)
+    if not tenant:
+        raise HTTPException(status_code=500, detail="No tenant available")
+
+    try:
+        return await auth_service.authenticate_user(db, tenant, email, password)
+    except AuthError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+
+@router.post("/refresh", response_model=Token, status_code=status.HTTP_200_OK)
+async def refresh_token(
+    payload: dict = Body(...), db: AsyncSession = Depends(get_async_db)
+):
+    token = payload.get("refresh_token")
+    if not token:
+        raise HTTPException(status_code=422, detail="refresh_token is required")
+
+    tenant = await _get_default_tenant(db)
+    if not tenant:
+        raise HTTPException(status_code=500, detail="No tenant available")
+
+    try:
+        return await auth_service.refresh_tokens(db, tenant, token)
+    except AuthError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    await auth_service.invalidate_sessions(db, current_user.id)
+
+
+@router.post("/password", response_model=Token, status_code=status.HTTP_200_OK)
+async def change_password(
+    body: PasswordChange,
+    current_user: User = Depends(get_current_user),
+    tenant: TenantRef = Depends(get_current_user_tenant),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        return await auth_service.change_password(
+            db, tenant, current_user, body.current_password, body.new_password
+        )
+    except AuthError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+    except PasswordHasherBusy:
+        raise _hasher_busy()
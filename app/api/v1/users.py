@@ -1,6 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
-from app.core.deps import get_current_user
+from typing import Callable, Iterable, Iterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.deps import authorize_page, get_current_user
+from app.core.permissions import Permission
 from app.models.user import User
+from app.schemas.user import UserPublic
+from app.services import user_service
+from app.services.user_service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -10,9 +22,58 @@ def read_me(current_user: User = Depends(get_current_user)):
     return current_user
 
 
-@router.get("/")
-def list_users(current_user: User = Depends(get_current_user)):
-    return []
+@router.get("/", response_model=list[UserPublic])
+def list_users(
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    stream: bool = False,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    filter_page: Callable = Depends(authorize_page(Permission.USERS_READ)),
+):
+    """
+    One page of the caller's tenant, by id. Pass the `X-Next-Cursor`
+    response header back as `cursor` for the next page.
+
+    `stream=true` returns every remaining user as NDJSON instead,
+    fetched in batches from a server-side cursor (`limit` is ignored).
+    """
+    try:
+        if stream:
+            # Read while the body is sent: get_db closes the session
+            # only after the response (FastAPI >= 0.118)
+            batches = user_service.stream_users(
+                db, current_user.tenant_id, cursor=cursor
+            )
+            return StreamingResponse(
+                ndjson_lines(batches, filter_page),
+                media_type="application/x-ndjson",
+            )
+
+        page = user_service.list_users(
+            db, current_user.tenant_id, cursor=cursor, limit=limit
+        )
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+
+    # Rows the caller may not read are dropped (one bulk decision)
+    return filter_page(page.items)
+
+
+def ndjson_lines(
+    batches: Iterable[list], filter_page: Callable[[list], list]
+) -> Iterator[str]:
+    # Authorized and audited per batch, like a page
+    for batch in batches:
+        for row in filter_page(batch):
+            yield UserPublic.model_validate(row).model_dump_json() + "\n"
 
 
 @router.put("/{user_id}")
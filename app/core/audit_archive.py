@@ -0,0 +1,552 @@
+# app/core/audit_archive.py
+"""
+Columnar, compressed archive segments for authorization audit entries.
+
+One segment file holds one closed time range of authorization_audit_logs
+and is never modified after it is written:
+
+    MAGIC
+    row group 0: one zlib chunk per column
+    row group 1: ...
+    footer (JSON)
+    footer length (u64) + MAGIC
+
+The footer lists every chunk (offset, length, blake2b digest), per row
+group statistics (min/max of ids / tenants / users / timestamps, value
+sets of permissions and chains) and one anchor per chain: the prev_hash
+its first archived entry links to and the hash / seq of its last one.
+The footer is HMAC-signed with the audit signing key.
+
+Readers mmap the file; a scan only decompresses the columns it filters
+on, in row groups whose statistics can match, and the remaining columns
+of groups that actually have hits.
+"""
+
+import hashlib
+import hmac
+import json
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from heapq import merge
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from app.core.audit_signing import compute_signature
+
+MAGIC = b"AUDSEG1\n"
+SEGMENT_SUFFIX = ".aseg"
+FORMAT_VERSION = 1
+
+_TRAILER = struct.Struct("<Q")
+_NULL_INT = -(2**63)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Value sets larger than this are not kept in row group statistics
+_MAX_SET_STATS = 64
+
+
+class ArchivedEntry(NamedTuple):
+    id: int
+    chain_key: str | None
+    chain_seq: int | None
+    user_id: int | None
+    tenant_id: int | None
+    permission: str
+    allowed: bool
+    reason: str | None
+    endpoint: str | None
+    method: str | None
+    context: str | None
+    signature: str
+    prev_hash: str | None
+    entry_hash: str
+    integrity_ok: bool
+    created_at: datetime
+
+
+INT_COLUMNS = frozenset({"id", "chain_seq", "user_id", "tenant_id", "created_at"})
+BOOL_COLUMNS = frozenset({"allowed", "integrity_ok"})
+# Monotonic inside a segment: stored as deltas (compress to ~nothing)
+DELTA_COLUMNS = frozenset({"id", "created_at"})
+# SHA-256 / HMAC hex digests: stored as raw 32 bytes (random hex does
+# not compress below ~50%)
+DIGEST_COLUMNS = frozenset({"signature", "prev_hash", "entry_hash"})
+_DIGEST_SIZE = 32
+
+
+class ArchiveIntegrityError(Exception):
+    """
+    Segment file is truncated, forged or corrupted.
+    """
+
+
+@dataclass
+class ChainAnchor:
+    chain_key: str | None
+    first_id: int
+    first_seq: int | None
+    prev_hash: str | None
+    last_id: int
+    last_seq: int | None
+    last_hash: str
+    count: int
+
+
+# ------------------------------------------------------------------
+# Column codecs
+# ------------------------------------------------------------------
+
+
+def _to_micros(value: datetime) -> int:
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _encode(name: str, values: list) -> bytes:
+    if name == "created_at":
+        values = [_to_micros(v) for v in values]
+
+    if name in INT_COLUMNS:
+        ints = array("q", (_NULL_INT if v is None else v for v in values))
+        if name in DELTA_COLUMNS:
+            for i in range(len(ints) - 1, 0, -1):
+                ints[i] -= ints[i - 1]
+        raw = ints.tobytes()
+
+    elif name in BOOL_COLUMNS:
+        raw = bytes(2 if v is None else int(v) for v in values)
+
+    elif name in DIGEST_COLUMNS and all(_is_digest(v) for v in values):
+        raw = b"D" + b"".join(
+            b"\x00" * (_DIGEST_SIZE + 1) if v is None else b"\x01" + bytes.fromhex(v)
+            for v in values
+        )
+
+    else:
+        raw = json.dumps(values, separators=(",", ":")).encode()
+
+    return zlib.compress(raw, 6)
+
+
+def _is_digest(value: str | None) -> bool:
+    if value is None:
+        return True
+    if len(value) != 2 * _DIGEST_SIZE:
+        return False
+    try:
+        return bytes.fromhex(value).hex() == value
+    except ValueError:
+        return False
+
+
+def _decode(name: str, chunk: bytes | memoryview) -> list:
+    raw = zlib.decompress(chunk)
+
+    if name in INT_COLUMNS:
+        ints = array("q")
+        ints.frombytes(raw)
+        if name in DELTA_COLUMNS:
+            for i in range(1, len(ints)):
+                ints[i] += ints[i - 1]
+        values = [None if v == _NULL_INT else v for v in ints]
+        if name == "created_at":
+            return [_EPOCH + timedelta(microseconds=v) for v in values]
+        return values
+
+    if name in BOOL_COLUMNS:
+        return [None if b == 2 else bool(b) for b in raw]
+
+    if raw[:1] == b"D":
+        step = _DIGEST_SIZE + 1
+        return [
+            raw[i + 1 : i + step].hex() if raw[i] else None
+            for i in range(1, len(raw), step)
+        ]
+
+    return json.loads(raw)
+
+
+def _digest(chunk: bytes | memoryview) -> str:
+    return hashlib.blake2b(chunk, digest_size=16).hexdigest()
+
+
+def _footer_signature(footer: dict[str, Any]) -> str:
+    body = json.dumps(footer, sort_keys=True, separators=(",", ":"))
+    return compute_signature(
+        {
+            "kind": "archive_segment",
+            "digest": hashlib.sha256(body.encode()).hexdigest(),
+        }
+    )
+
+
+def _group_stats(columns: dict[str, list]) -> dict[str, Any]:
+    stats: dict[str, Any] = {}
+
+    for name in ("id", "tenant_id", "user_id"):
+        present = [v for v in columns[name] if v is not None]
+        stats[name] = [min(present), max(present)] if present else None
+
+    timestamps = columns["created_at"]
+    stats["created_at"] = [
+        min(timestamps).isoformat(),
+        max(timestamps).isoformat(),
+    ]
+
+    for name in ("permission", "chain_key"):
+        values = set(columns[name])
+        stats[name] = (
+            sorted(values, key=lambda v: (v is None, v or ""))
+            if len(values) <= _MAX_SET_STATS
+            else None
+        )
+
+    return stats
+
+
+# ------------------------------------------------------------------
+# Writer
+# ------------------------------------------------------------------
+
+
+def write_segment(
+    path: str | os.PathLike,
+    entries: Iterable[ArchivedEntry],
+    *,
+    start: datetime,
+    end: datetime,
+    row_group_size: int = 8192,
+) -> dict[str, Any]:
+    """
+    Write `entries` (in id order) as a new segment covering [start, end).
+    The file is written under a temporary name, fsynced, made read-only
+    and renamed into place; an existing segment is never overwritten.
+
+    Returns the signed footer.
+    """
+    path = Path(path)
+    if path.exists():
+        raise FileExistsError(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    anchors: dict[str | None, ChainAnchor] = {}
+    row_groups: list[dict[str, Any]] = []
+    row_count = 0
+
+    def flush(batch: list[ArchivedEntry], out) -> None:
+        columns = {
+            name: [getattr(e, name) for e in batch] for name in ArchivedEntry._fields
+        }
+        chunks = {}
+        for name, values in columns.items():
+            chunk = _encode(name, values)
+            chunks[name] = [out.tell(), len(chunk), _digest(chunk)]
+            out.write(chunk)
+
+        row_groups.append(
+            {"rows": len(batch), "stats": _group_stats(columns), "columns": chunks}
+        )
+
+    with open(tmp_path, "wb") as out:
+        out.write(MAGIC)
+
+        batch: list[ArchivedEntry] = []
+        for entry in entries:
+            anchor = anchors.get(entry.chain_key)
+            if anchor is None:
+                anchors[entry.chain_key] = ChainAnchor(
+                    chain_key=entry.chain_key,
+                    first_id=entry.id,
+                    first_seq=entry.chain_seq,
+                    prev_hash=entry.prev_hash,
+                    last_id=entry.id,
+                    last_seq=entry.chain_seq,
+                    last_hash=entry.entry_hash,
+                    count=1,
+                )
+            else:
+                anchor.last_id = entry.id
+                anchor.last_seq = entry.chain_seq
+                anchor.last_hash = entry.entry_hash
+                anchor.count += 1
+
+            batch.append(entry)
+            row_count += 1
+            if len(batch) >= row_group_size:
+                flush(batch, out)
+                batch = []
+
+        if batch:
+            flush(batch, out)
+
+        footer = {
+            "version": FORMAT_VERSION,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "rows": row_count,
+            "row_groups": row_groups,
+            "anchors": [vars(anchor) for anchor in anchors.values()],
+        }
+        footer["signature"] = _footer_signature(footer)
+
+        body = json.dumps(footer, separators=(",", ":")).encode()
+        out.write(body)
+        out.write(_TRAILER.pack(len(body)))
+        out.write(MAGIC)
+        out.flush()
+        os.fsync(out.fileno())
+
+    os.chmod(tmp_path, 0o444)
+    os.replace(tmp_path, path)
+    return footer
+
+
+# ------------------------------------------------------------------
+# Reader
+# ------------------------------------------------------------------
+
+
+def _overlaps(bounds: list | None, low, high) -> bool:
+    if bounds is None:
+        return True
+    return (low is None or bounds[1] >= low) and (high is None or bounds[0] <= high)
+
+
+class ArchiveSegment:
+    """
+    Memory-mapped, read-only view of one segment file.
+    The footer signature is checked on open.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        self.chunks_read = 0
+
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ArchiveIntegrityError(f"{self.path}: empty segment")
+
+        try:
+            self.footer = self._read_footer()
+        except Exception:
+            self.close()
+            raise
+
+        self.start = datetime.fromisoformat(self.footer["start"])
+        self.end = datetime.fromisoformat(self.footer["end"])
+        self.anchors = {
+            anchor["chain_key"]: ChainAnchor(**anchor)
+            for anchor in self.footer["anchors"]
+        }
+
+    def _read_footer(self) -> dict[str, Any]:
+        size = len(self._map)
+        tail = _TRAILER.size + len(MAGIC)
+        if (
+            size < len(MAGIC) + tail
+            or self._map[: len(MAGIC)] != MAGIC
+            or self._map[size - len(MAGIC) :] != MAGIC
+        ):
+            raise ArchiveIntegrityError(f"{self.path}: not an audit segment")
+
+        (length,) = _TRAILER.unpack_from(self._map, size - tail)
+        try:
+            footer = json.loads(self._map[size - tail - length : size - tail])
+        except ValueError:
+            raise ArchiveIntegrityError(f"{self.path}: unreadable footer")
+
+        signature = footer.pop("signature", "")
+        if not hmac.compare_digest(signature, _footer_signature(footer)):
+            raise ArchiveIntegrityError(f"{self.path}: bad footer signature")
+
+        return footer
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveSegment":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def rows(self) -> int:
+        return self.footer["rows"]
+
+    def _column(self, group: dict[str, Any], name: str) -> list:
+        offset, length, digest = group["columns"][name]
+        chunk = memoryview(self._map)[offset : offset + length]
+        try:
+            if not hmac.compare_digest(_digest(chunk), digest):
+                raise ArchiveIntegrityError(
+                    f"{self.path}: corrupted {name} chunk at {offset}"
+                )
+            self.chunks_read += 1
+            return _decode(name, chunk)
+        finally:
+            chunk.release()
+
+    def scan(
+        self,
+        *,
+        tenant_id: int | None = None,
+        user_id: int | None = None,
+        permission: str | None = None,
+        chain_key: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        legacy_chain: bool = False,
+    ) -> Iterator[ArchivedEntry]:
+        """
+        Entries matching every given filter, in id order.
+        Time range is [start, end). `legacy_chain` selects rows with a
+        NULL chain_key (chain_key=None means "any chain").
+        """
+        if (start is not None and start >= self.end) or (
+            end is not None and end <= self.start
+        ):
+            return
+
+        filters: dict[str, Any] = {}
+        if tenant_id is not None:
+            filters["tenant_id"] = tenant_id
+        if user_id is not None:
+            filters["user_id"] = user_id
+        if permission is not None:
+            filters["permission"] = permission
+        if chain_key is not None or legacy_chain:
+            filters["chain_key"] = chain_key
+
+        for group in self.footer["row_groups"]:
+            stats = group["stats"]
+            if not self._may_match(stats, filters, start, end):
+                continue
+
+            columns: dict[str, list] = {}
+            mask = [True] * group["rows"]
+            for name, wanted in filters.items():
+                columns[name] = values = self._column(group, name)
+                mask = [m and v == wanted for m, v in zip(mask, values)]
+            if start is not None or end is not None:
+                columns["created_at"] = stamps = self._column(group, "created_at")
+                mask = [
+                    m and (start is None or ts >= start) and (end is None or ts < end)
+                    for m, ts in zip(mask, stamps)
+                ]
+
+            if not any(mask):
+                continue
+
+            for name in ArchivedEntry._fields:
+                if name not in columns:
+                    columns[name] = self._column(group, name)
+
+            rows = zip(*(columns[name] for name in ArchivedEntry._fields))
+            for keep, row in zip(mask, rows):
+                if keep:
+                    yield ArchivedEntry(*row)
+
+    @staticmethod
+    def _may_match(stats, filters, start, end) -> bool:
+        for name in ("tenant_id", "user_id"):
+            if name in filters and not _overlaps(
+                stats[name], filters[name], filters[name]
+            ):
+                return False
+
+        for name in ("permission", "chain_key"):
+            if name in filters and stats[name] is not None:
+                if filters[name] not in stats[name]:
+                    return False
+
+        if start is not None or end is not None:
+            first, last = (datetime.fromisoformat(ts) for ts in stats["created_at"])
+            if (start is not None and last < start) or (
+                end is not None and first >= end
+            ):
+                return False
+
+        return True
+
+    def chain_entries(self, chain_key: str | None) -> Iterator[ArchivedEntry]:
+        """
+        One chain's entries, checked against the segment's anchor
+        (first link, last hash, count).
+        """
+        anchor = self.anchors.get(chain_key)
+        if anchor is None:
+            return
+
+        count = 0
+        last: ArchivedEntry | None = None
+        for entry in self.scan(chain_key=chain_key, legacy_chain=chain_key is None):
+            if count == 0 and (
+                entry.id != anchor.first_id or entry.prev_hash != anchor.prev_hash
+            ):
+                raise ArchiveIntegrityError(f"{self.path}: anchor mismatch")
+            count += 1
+            last = entry
+            yield entry
+
+        if count != anchor.count or last is None or last.entry_hash != anchor.last_hash:
+            raise ArchiveIntegrityError(f"{self.path}: anchor mismatch")
+
+
+class AuditArchive:
+    """
+    Directory of segment files, ordered by the time range they cover.
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+
+    def segment_paths(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def segments(self) -> Iterator[ArchiveSegment]:
+        for path in self.segment_paths():
+            with ArchiveSegment(path) as segment:
+                yield segment
+
+    def scan(self, **filters) -> Iterator[ArchivedEntry]:
+        for segment in self.segments():
+            yield from segment.scan(**filters)
+
+    def chain_entries(self, chain_key: str | None) -> Iterator[ArchivedEntry]:
+        """
+        One chain's archived entries across all segments, in id order.
+        """
+        opened = []
+        for path in self.segment_paths():
+            segment = ArchiveSegment(path)
+            if chain_key in segment.anchors:
+                opened.append(segment)
+            else:
+                segment.close()
+
+        try:
+            yield from merge(
+                *(segment.chain_entries(chain_key) for segment in opened),
+                key=lambda entry: entry.id,
+            )
+        finally:
+            for segment in opened:
+                segment.close()
+
+    def chain_keys(self) -> set[str | None]:
+        keys: set[str | None] = set()
+        for segment in self.segments():
+            keys.update(segment.anchors)
+        return keys
@@ -1,9 +1,19 @@
-from typing import Iterable, List
+from types import MappingProxyType
+from typing import Callable, Iterable, List, Mapping, NamedTuple
 from app.core.permissions import Permission
-from app.core.role_permissions import ROLE_PERMISSIONS
-from app.core.policies.tenant_policy import TenantIsolationPolicy, SelfAccessPolicy
+from app.core.permission_masks import (
+    mask_allows,
+    mask_for_roles,
+    permission_matches,  # noqa: F401 — public re-export
+)
+from app.core.policies.tenant_policy import (
+    BasePolicy,
+    TenantIsolationPolicy,
+    SelfAccessPolicy,
+)
+from app.core.principal import Principal, TenantRef
+from app.core import permission_masks
 from app.models.user import User
-from app.models.tenant import Tenant
 from dataclasses import dataclass
 
 
@@ -11,7 +21,7 @@ from dataclasses import dataclass
 # Policy registry: permission → list[policy]
 # ------------------------------------------------------------------
 
-POLICY_REGISTRY: dict[Permission, list] = {
+POLICY_REGISTRY: dict[Permission, list[BasePolicy]] = {
     Permission.USERS_READ: [
         TenantIsolationPolicy(),
         SelfAccessPolicy(),
@@ -56,36 +66,71 @@ class AuthorizationError(Exception):
 
 
 # ------------------------------------------------------------------
-# Permission matching (supports wildcard)
+# Policy precedence + compiled chains
 # ------------------------------------------------------------------
 
 
-def permission_matches(granted: Permission, required: Permission) -> bool:
+def apply_policy_precedence(policies: Iterable[BasePolicy]) -> List[BasePolicy]:
     """
-    Match permissions exactly or via wildcard.
+    Order policies by their declared `priority` (highest first).
+    Stable: equal priorities keep registry order.
     """
-    if granted == required:
-        return True
-    if granted.value.endswith("*"):
-        return required.value.startswith(granted.value[:-1])
-    return False
+    return sorted(policies, key=lambda policy: policy.priority, reverse=True)
 
 
-# ------------------------------------------------------------------
-# Central Authorization Resolver (ENGINE)
-# ------------------------------------------------------------------
+# (user, tenant, resource_owner_id) -> denying policy, or None if allowed
+PolicyChain = Callable[..., BasePolicy | None]
+
+
+def _allow_all(user, tenant, resource_owner_id) -> None:
+    return None
+
+
+def _compile_chain(policies: Iterable[BasePolicy]) -> PolicyChain:
+    ordered = tuple(apply_policy_precedence(policies))
+
+    if not ordered:
+        return _allow_all
 
+    checks = tuple((policy.allows, policy) for policy in ordered)
 
-def apply_policy_precedence(policies: List) -> List:
+    def evaluate(user, tenant, resource_owner_id):
+        for allows, policy in checks:
+            if not allows(
+                user=user, tenant=tenant, resource_owner_id=resource_owner_id
+            ):
+                return policy
+        return None
+
+    return evaluate
+
+
+COMPILED_POLICY_CHAINS: Mapping[Permission, PolicyChain] = MappingProxyType({})
+
+
+def compile_policy_chains() -> None:
     """
-    Organize policies based on precedence (priority) and return ordered policies.
+    Freeze POLICY_REGISTRY into precedence-ordered evaluators.
+    Runs at import and again at app startup (lifespan), so policies
+    registered before startup are picked up. Sorting never happens
+    on the request path.
     """
-    ordered_policies = sorted(
-        policies,
-        key=lambda policy: isinstance(policy, TenantIsolationPolicy),
-        reverse=True,
+    global COMPILED_POLICY_CHAINS
+
+    COMPILED_POLICY_CHAINS = MappingProxyType(
+        {
+            permission: _compile_chain(policies)
+            for permission, policies in POLICY_REGISTRY.items()
+        }
     )
-    return ordered_policies
+
+
+compile_policy_chains()
+
+
+# ------------------------------------------------------------------
+# Central Authorization Resolver (ENGINE)
+# ------------------------------------------------------------------
 
 
 @dataclass
@@ -95,83 +140,138 @@ class AuthorizationDecision:
     permission: str
     allowed: bool
     reason: str | None = None
+    resource_owner_id: int | None = None
 
 
-def resolve_permission(
-    *,
-    user: User,
-    permission: Permission,
-    tenant: Tenant | None = None,
-    resource_owner_id: int | None = None,
-) -> None:
+class AuthorizationRequest(NamedTuple):
+    permission: Permission
+    resource_owner_id: int | None = None
+
+
+def as_principal(user: Principal | User) -> Principal:
     """
-    Central authorization resolver.
-    DENY-BY-DEFAULT.
-    Flow:
-    1. Aggregate permissions from roles (RBAC)
-    2. Permission match
-    3. Policy enforcement (ABAC)
+    The engine works on Principal snapshots; an ORM User (or anything
+    with id / tenant_id / roles) is converted once, compiling its mask.
     """
-    granted_permissions: set[Permission] = set()
-    for role in user.roles:
-        granted_permissions |= ROLE_PERMISSIONS.get(role.name, set())
+    if isinstance(user, Principal):
+        return user
 
-    if not granted_permissions:
-        raise AuthorizationError(
+    role_names = tuple(role.name for role in user.roles)
+    return Principal(
+        id=user.id,
+        tenant_id=user.tenant_id,
+        role_names=role_names,
+        permission_mask=mask_for_roles(role_names),
+        mask_generation=permission_masks.MASK_GENERATION,
+    )
+
+
+def _check(
+    user: Principal,
+    granted_mask: int,
+    permission: Permission,
+    tenant: TenantRef | None,
+    resource_owner_id: int | None,
+) -> AuthorizationError | None:
+    """
+    One decision against an already-compiled principal mask.
+    Returns the error instead of raising (cheap denials in bulk).
+    """
+    if not granted_mask:
+        return AuthorizationError(
             reason="user_has_no_permissions",
             context={"user_id": user.id},
         )
 
-    if not any(permission_matches(p, permission) for p in granted_permissions):
-        raise AuthorizationError(
+    if not mask_allows(granted_mask, permission):
+        return AuthorizationError(
             reason="permission_denied",
             context={"user_id": user.id, "permission": permission.value},
         )
 
-    if permission not in POLICY_REGISTRY:
-        raise AuthorizationError(
+    chain = COMPILED_POLICY_CHAINS.get(permission)
+    if chain is None:
+        return AuthorizationError(
             reason="permission_not_registered",
             context={"permission": permission.value},
         )
 
-    policies: Iterable = POLICY_REGISTRY[permission]
-    policies = apply_policy_precedence(policies)  # Apply precedence order
-
     if tenant is None:
-        raise AuthorizationError(
+        return AuthorizationError(
             reason="tenant_required",
             context={"permission": permission.value},
         )
 
-    # Create an AuthorizationDecision object for logging purposes
-    decision = AuthorizationDecision(
-        user_id=user.id,
-        tenant_id=tenant.id,
-        permission=permission.value,
-        allowed=True,  # Initially allowed, may be modified later
-        reason="Access granted",  # Default reason if allowed
-    )
+    denied_by = chain(user, tenant, resource_owner_id)
 
-    for policy in policies:
-        allowed = policy.allows(
-            user=user, tenant=tenant, resource_owner_id=resource_owner_id
+    if denied_by is not None:
+        return AuthorizationError(
+            reason="policy_denied",
+            context={
+                "policy": denied_by.__class__.__name__,
+                "user_id": user.id,
+                "tenant_id": tenant.id,
+                "permission": permission.value,
+            },
         )
 
-        if not allowed:
-            decision.allowed = False
-            decision.reason = f"Policy {policy.__class__.__name__} denied access"
-            raise AuthorizationError(
-                reason="policy_denied",
-                context={
-                    "policy": policy.__class__.__name__,
-                    "user_id": user.id,
-                    "tenant_id": tenant.id,
-                    "permission": permission.value,
-                },
-            )
+    return None
+
 
-    # If allowed, log the decision
-    if decision.allowed:
-        decision.reason = "Access granted"
+def resolve_permission(
+    *,
+    user: Principal | User,
+    permission: Permission,
+    tenant: TenantRef | None = None,
+    resource_owner_id: int | None = None,
+) -> None:
+    """
+    Central authorization resolver.
+    DENY-BY-DEFAULT.
+    Flow:
+    1. Principal's compiled role mask (RBAC bitmask, built once per
+       principal, not per check)
+    2. Permission match (single bitwise AND)
+    3. Policy enforcement (ABAC, compiled chain)
+
+    Returns None when allowed (no allocation on the allow path);
+    raises AuthorizationError otherwise.
+    """
+    user = as_principal(user)
+
+    error = _check(user, user.current_mask, permission, tenant, resource_owner_id)
+    if error is not None:
+        raise error
+
+
+def resolve_permissions_bulk(
+    *,
+    user: Principal | User,
+    tenant: TenantRef | None,
+    requests: Iterable[AuthorizationRequest],
+) -> list[AuthorizationDecision]:
+    """
+    Evaluate many (permission, resource_owner_id) pairs for ONE
+    principal. The role mask is read once; decisions come back in
+    request order. Never raises: denials are decisions with a reason.
+    """
+    user = as_principal(user)
+    granted_mask = user.current_mask
+    tenant_id = tenant.id if tenant is not None else None
+
+    decisions = []
+    for permission, resource_owner_id in requests:
+        error = _check(user, granted_mask, permission, tenant, resource_owner_id)
+
+        decisions.append(
+            AuthorizationDecision(
+                user_id=user.id,
+                tenant_id=tenant_id,
+                permission=permission.value,
+                allowed=error is None,
+                reason="permission granted" if error is None else str(error),
+                resource_owner_id=resource_owner_id,
+            )
+        )
 
-    return decision
+    return decisions
@@ -4,6 +4,7 @@ import os
 from fastapi.security import OAuth2PasswordBearer
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
+from sqlalchemy.engine import make_url
 
 
 class Settings(BaseSettings):
@@ -18,6 +19,12 @@ class Settings(BaseSettings):
 
     database_url: str | None = None
 
+    # === ASYNC DATABASE STACK ===
+    # AsyncEngine/AsyncSession for deps, auth and user services
+    database_async_enabled: bool = False
+    # Defaults to DATABASE_URL with its async driver (asyncpg / aiosqlite)
+    async_database_url: str | None = None
+
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
@@ -26,6 +33,66 @@ class Settings(BaseSettings):
     # === AUDIT SIGNING (SECURITY-GRADE) ===
     audit_signing_key: str
 
+    # === AUDIT WRITER (group commit) ===
+    audit_async_enabled: bool = False
+    audit_batch_size: int = 100
+    audit_flush_interval_ms: int = 50
+    audit_queue_size: int = 10_000
+    audit_enqueue_timeout_ms: int = 100
+
+    # === AUDIT VERIFIER ===
+    # 0 = one worker process per CPU core
+    audit_verify_workers: int = 0
+    audit_verify_range_size: int = 10_000
+    # Entries per signed Merkle segment (inclusion proofs)
+    audit_merkle_segment_size: int = 1024
+
+    # === AUDIT LOG PARTITIONS (PostgreSQL) ===
+    # Monthly partitions kept pre-created past the current month
+    audit_partition_months_ahead: int = 3
+    # Detach partitions older than this many months (0 = keep all)
+    audit_partition_retention_months: int = 0
+
+    # === AUDIT ARCHIVE ===
+    # Directory of compressed, read-only audit segment files
+    audit_archive_dir: str = "var/audit_archive"
+    audit_archive_row_group_size: int = 8192
+
+    # === PASSWORD HASHING POOL ===
+    # 0 = one worker per CPU core
+    password_hash_workers: int = 0
+    password_hash_max_pending: int = 64
+
+    # === VERIFIED TOKEN CACHE ===
+    token_cache_max_entries: int = 10_000
+
+    # === REFRESH TOKEN FAMILIES ===
+    # Revoked families remembered in-process (0 disables)
+    refresh_family_denylist_max_entries: int = 10_000
+
+    # === REFRESH TOKEN GC ===
+    # Background deletion of expired / long-revoked refresh tokens
+    refresh_token_gc_enabled: bool = False
+    refresh_token_gc_interval_seconds: int = 300
+    refresh_token_gc_batch_size: int = 500
+    refresh_token_gc_batch_pause_ms: int = 100
+    refresh_token_gc_max_batches: int = 200
+    # Revoked tokens are kept this long so replays are still detected
+    refresh_token_gc_revoked_retention_hours: int = 24
+
+    # === SESSION EPOCHS ===
+    # Per-user token_epoch cache; bumps from other workers apply within the TTL
+    token_epoch_cache_ttl_seconds: int = 60
+    token_epoch_cache_max_entries: int = 100_000
+
+    # === PRINCIPAL CACHE ===
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_max_entries: int = 10_000
+
+    # === TENANT CACHE ===
+    tenant_cache_ttl_seconds: int = 300
+    tenant_cache_max_entries: int = 10_000
+
     @property
     def effective_database_url(self) -> str:
         env_db = os.getenv("DATABASE_URL")
@@ -37,6 +104,25 @@ class Settings(BaseSettings):
 
         raise RuntimeError("DATABASE_URL is required")
 
+    @property
+    def effective_async_database_url(self) -> str:
+        if self.async_database_url:
+            return self.async_database_url
+
+        url = make_url(self.effective_database_url)
+        backend = url.get_backend_name()
+
+        if backend == "postgresql":
+            return url.set(drivername="postgresql+asyncpg").render_as_string(
+                hide_password=False
+            )
+        if backend == "sqlite":
+            return url.set(drivername="sqlite+aiosqlite").render_as_string(
+                hide_password=False
+            )
+
+        raise RuntimeError(f"No async driver configured for {backend}")
+
 
 settings = Settings()
 
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.core.config import settings
@@ -37,3 +38,41 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ------------------------------------------------------------------
+# Async stack (DATABASE_ASYNC_ENABLED)
+# ------------------------------------------------------------------
+# Built on first use: the async driver is only required when enabled.
+
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.effective_async_database_url,
+            pool_pre_ping=True,
+        )
+    return _async_engine
+
+
+def AsyncSessionLocal():
+    global _async_session_factory
+
+    if _async_session_factory is None:
+        # expire_on_commit=False: no implicit IO on attribute access
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
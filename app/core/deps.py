@@ -1,21 +1,41 @@
 # app/core/deps.py
 from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Iterable, TypeVar
 from app.core.permissions import Permission
 
 from fastapi import Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
-from jose import jwt, JWTError
 from enum import Enum
 
+from app.core import queries
 from app.core.database import get_db
 from app.core.config import settings
-from app.core.security import oauth2_scheme
+from app.core.security import oauth2_scheme, decode_token
+from app.core.security_context import (
+    STATE_ATTR,
+    SecurityContext,
+    resolve_principal,
+)
+from app.core.principal import TenantRef
+from app.core.tenant_cache import get_tenant
+from app.core.token_epochs import EPOCH_CLAIM, token_epochs
 
 from app.models.user import User
-from app.models.tenant import Tenant
 
-from app.core.authorization import resolve_permission, AuthorizationError
-from app.services.audit_service import log_authorization_decision
+from app.core.authorization import (
+    AuthorizationError,
+    AuthorizationRequest,
+    resolve_permission,
+    resolve_permissions_bulk,
+)
+from app.services.audit_service import (
+    log_authorization_decision,
+    log_authorization_page,
+)
+
+
+T = TypeVar("T")
 
 
 # =====================================================
@@ -23,36 +43,75 @@ from app.services.audit_service import log_authorization_decision
 # =====================================================
 
 
-def get_current_user(
+def _revoked_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+    )
+
+
+def get_security_context(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
-) -> User:
+) -> SecurityContext:
+    """
+    Decodes the token and resolves user, tenant and roles once per
+    request; every other dependency (and handlers) reuse the result
+    stored on request.state.
+    """
+    context = getattr(request.state, STATE_ATTR, None)
+    if context is not None:
+        return context
+
     try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.algorithm],
-        )
+        # Cached verified claims: hot tokens skip the HMAC check
+        payload = decode_token(token)
         user_id = payload.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token payload",
             )
-    except JWTError:
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if not user:
+    user_id = int(user_id)
+
+    # Warm caches: no SQL at all; cold: one joined SELECT
+    resolved = resolve_principal(db, user_id)
+    if resolved is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
+    cached, tenant = resolved
+
+    epoch = token_epochs.get(user_id)
+    if epoch is None:
+        stored = db.scalar(queries.USER_EPOCH, {"user_id": user_id})
+        epoch = token_epochs.observe(user_id, stored or 0)
+    if not token_epochs.accepts(user_id, payload.get(EPOCH_CLAIM, 0), epoch):
+        raise _revoked_token()
+
+    context = SecurityContext(
+        claims=payload,
+        principal=cached.principal,
+        tenant=tenant,
+        # merge(load=False): attached without SQL
+        user=cached.to_user(db),
+    )
+    setattr(request.state, STATE_ATTR, context)
+    return context
+
 
-    return user
+def get_current_user(
+    context: SecurityContext = Depends(get_security_context),
+) -> User:
+    return context.user
 
 
 # =====================================================
@@ -62,43 +121,42 @@ def get_current_user(
 
 def get_current_tenant(
     tenant_id: int,
-    current_user: User = Depends(get_current_user),
+    context: SecurityContext = Depends(get_security_context),
     db: Session = Depends(get_db),
-) -> Tenant:
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+) -> TenantRef:
+    # Own tenant: already resolved with the user
+    if context.tenant is not None and context.tenant.id == tenant_id:
+        return context.tenant
+
+    tenant = get_tenant(db, tenant_id)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found",
         )
 
-    if current_user.tenant_id != tenant.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cross-tenant access denied",
-        )
-
-    return tenant
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Cross-tenant access denied",
+    )
 
 
 def get_current_user_tenant(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> Tenant:
-    if not current_user.tenant_id:
+    context: SecurityContext = Depends(get_security_context),
+) -> TenantRef:
+    if not context.principal.tenant_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User has no tenant",
         )
 
-    tenant = db.query(Tenant).filter(Tenant.id == current_user.tenant_id).first()
-    if not tenant:
+    if context.tenant is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found",
         )
 
-    return tenant
+    return context.tenant
 
 
 # =====================================================
@@ -118,8 +176,8 @@ def _normalize_permission(permission: str | Enum) -> str:
 def require_permission(permission: Permission):
     def checker(
         request: Request,
-        current_user: User = Depends(get_current_user),
-        tenant: Tenant = Depends(get_current_user_tenant),
+        context: SecurityContext = Depends(get_security_context),
+        tenant: TenantRef = Depends(get_current_user_tenant),
         db: Session = Depends(get_db),
     ) -> None:
         resource_owner_id = None
@@ -134,7 +192,7 @@ def require_permission(permission: Permission):
 
         try:
             resolve_permission(
-                user=current_user,
+                user=context.principal,
                 tenant=tenant,
                 permission=permission,  # ENUM, not str
                 resource_owner_id=resource_owner_id,
@@ -150,7 +208,7 @@ def require_permission(permission: Permission):
             try:
                 log_authorization_decision(
                     db=db,
-                    user_id=current_user.id if current_user else None,
+                    user_id=context.user_id,
                     tenant_id=tenant.id if tenant else None,
                     permission=permission.value,  # string only for audit
                     allowed=allowed,
@@ -169,3 +227,65 @@ def require_permission(permission: Permission):
             )
 
     return checker
+
+
+def authorize_page(
+    permission: Permission,
+    owner_of: Callable[[Any], int | None] = attrgetter("id"),
+):
+    """
+    Dependency for list endpoints: yields `filter_page(rows)`, which
+    keeps only the rows the caller may see under `permission`.
+
+    One resolve_permissions_bulk call (role mask compiled once) and
+    one audited decision per page (row counts in its context),
+    instead of N resolver calls and N audit entries.
+    `owner_of(row)` gives the resource_owner_id checked by policies.
+    """
+
+    def dependency(
+        request: Request,
+        context: SecurityContext = Depends(get_security_context),
+        tenant: TenantRef = Depends(get_current_user_tenant),
+        db: Session = Depends(get_db),
+    ) -> Callable[[Iterable[T]], list[T]]:
+        def filter_page(rows: Iterable[T]) -> list[T]:
+            rows = list(rows)
+
+            decisions = resolve_permissions_bulk(
+                user=context.principal,
+                tenant=tenant,
+                requests=[AuthorizationRequest(permission, owner_of(r)) for r in rows],
+            )
+
+            try:
+                log_authorization_page(
+                    db=db,
+                    decisions=decisions,
+                    endpoint=request.url.path,
+                    method=request.method,
+                )
+            except Exception:
+                pass
+
+            return [row for row, d in zip(rows, decisions) if d.allowed]
+
+        return filter_page
+
+    return dependency
+
+
+# =====================================================
+# ASYNC MODE
+# =====================================================
+
+if settings.database_async_enabled:
+    # Same names, AsyncSession-backed: routers stay unchanged
+    from app.core.deps_async import (  # noqa: F401
+        authorize_page,
+        get_current_tenant,
+        get_current_user,
+        get_current_user_tenant,
+        get_security_context,
+        require_permission,
+    )
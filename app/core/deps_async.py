@@ -0,0 +1,264 @@
+# app/core/deps_async.py
+"""
+AsyncSession versions of the dependencies in app.core.deps.
+
+Selected by DATABASE_ASYNC_ENABLED: app.core.deps re-exports these
+under the same names, so routers don't change. Nothing here touches
+FastAPI's threadpool.
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, Iterable, TypeVar
+
+from fastapi import Depends, HTTPException, status, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import queries
+from app.core.database import get_async_db
+from app.core.permissions import Permission
+from app.core.security import oauth2_scheme, decode_token
+from app.core.principal import TenantRef
+from app.core.security_context import (
+    STATE_ATTR,
+    SecurityContext,
+    resolve_principal_async,
+)
+from app.core.tenant_cache import get_tenant_async
+from app.core.token_epochs import EPOCH_CLAIM, token_epochs
+
+from app.models.user import User
+
+from app.core.authorization import (
+    AuthorizationError,
+    AuthorizationRequest,
+    resolve_permission,
+    resolve_permissions_bulk,
+)
+from app.services.audit_service import (
+    log_authorization_decision_async,
+    log_authorization_page,
+)
+
+
+T = TypeVar("T")
+
+
+# =====================================================
+# AUTHENTICATION
+# =====================================================
+
+
+async def get_security_context(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> SecurityContext:
+    """
+    Async twin of deps.get_security_context: resolved once per request
+    (request.state), warm caches cost no SQL, cold ones one SELECT.
+    """
+    context = getattr(request.state, STATE_ATTR, None)
+    if context is not None:
+        return context
+
+    try:
+        payload = decode_token(token)
+        user_id = payload.get("sub")
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+        )
+
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+        )
+
+    user_id = int(user_id)
+
+    resolved = await resolve_principal_async(db, user_id)
+    if resolved is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+    cached, tenant = resolved
+
+    epoch = token_epochs.get(user_id)
+    if epoch is None:
+        stored = await db.scalar(queries.USER_EPOCH, {"user_id": user_id})
+        epoch = token_epochs.observe(user_id, stored or 0)
+    if not token_epochs.accepts(user_id, payload.get(EPOCH_CLAIM, 0), epoch):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+        )
+
+    context = SecurityContext(
+        claims=payload,
+        principal=cached.principal,
+        tenant=tenant,
+        # merge(load=False) emits no SQL
+        user=await db.run_sync(cached.to_user),
+    )
+    setattr(request.state, STATE_ATTR, context)
+    return context
+
+
+async def get_current_user(
+    context: SecurityContext = Depends(get_security_context),
+) -> User:
+    return context.user
+
+
+# =====================================================
+# TENANT RESOLUTION
+# =====================================================
+
+
+async def get_current_tenant(
+    tenant_id: int,
+    context: SecurityContext = Depends(get_security_context),
+    db: AsyncSession = Depends(get_async_db),
+) -> TenantRef:
+    # Own tenant: already resolved with the user
+    if context.tenant is not None and context.tenant.id == tenant_id:
+        return context.tenant
+
+    tenant = await get_tenant_async(db, tenant_id)
+    if not tenant:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tenant not found",
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Cross-tenant access denied",
+    )
+
+
+async def get_current_user_tenant(
+    context: SecurityContext = Depends(get_security_context),
+) -> TenantRef:
+    if not context.principal.tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User has no tenant",
+        )
+
+    if context.tenant is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tenant not found",
+        )
+
+    return context.tenant
+
+
+# =====================================================
+# AUTHORIZATION + AUDIT LOGGING
+# =====================================================
+
+
+def require_permission(permission: Permission):
+    async def checker(
+        request: Request,
+        context: SecurityContext = Depends(get_security_context),
+        tenant: TenantRef = Depends(get_current_user_tenant),
+        db: AsyncSession = Depends(get_async_db),
+    ) -> None:
+        resource_owner_id = None
+        allowed = False
+        reason = "unknown"
+
+        if "user_id" in request.path_params:
+            try:
+                resource_owner_id = int(request.path_params["user_id"])
+            except ValueError:
+                pass
+
+        # Pure CPU (compiled masks + policy chain): fine on the loop
+        try:
+            resolve_permission(
+                user=context.principal,
+                tenant=tenant,
+                permission=permission,
+                resource_owner_id=resource_owner_id,
+            )
+            allowed = True
+            reason = "permission granted"
+
+        except AuthorizationError as e:
+            allowed = False
+            reason = str(e)
+
+        finally:
+            try:
+                await log_authorization_decision_async(
+                    db=db,
+                    user_id=context.user_id,
+                    tenant_id=tenant.id if tenant else None,
+                    permission=permission.value,
+                    allowed=allowed,
+                    reason=reason,
+                    endpoint=request.url.path,
+                    method=request.method,
+                    context={"resource_owner_id": resource_owner_id},
+                )
+            except Exception:
+                pass
+
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=reason,
+            )
+
+    return checker
+
+
+def authorize_page(
+    permission: Permission,
+    owner_of: Callable[[Any], int | None] = attrgetter("id"),
+):
+    """
+    Async twin of deps.authorize_page: the caller comes from the async
+    security context. `filter_page` itself stays sync (list handlers
+    call it from the threadpool or a streaming iterator), so its page
+    decision goes through the writer on its own session, never the loop.
+    """
+
+    async def dependency(
+        request: Request,
+        context: SecurityContext = Depends(get_security_context),
+        tenant: TenantRef = Depends(get_current_user_tenant),
+    ) -> Callable[[Iterable[T]], list[T]]:
+        endpoint, method = request.url.path, request.method
+
+        def filter_page(rows: Iterable[T]) -> list[T]:
+            rows = list(rows)
+
+            decisions = resolve_permissions_bulk(
+                user=context.principal,
+                tenant=tenant,
+                requests=[AuthorizationRequest(permission, owner_of(r)) for r in rows],
+            )
+
+            try:
+                log_authorization_page(
+                    db=None,
+                    decisions=decisions,
+                    endpoint=endpoint,
+                    method=method,
+                )
+            except Exception:
+                pass
+
+            return [row for row, d in zip(rows, decisions) if d.allowed]
+
+        return filter_page
+
+    return dependency
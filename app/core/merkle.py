@@ -0,0 +1,87 @@
+# app/core/merkle.py
+"""
+RFC 9162 (Certificate Transparency v2) Merkle tree helpers.
+
+Leaves and interior nodes are domain-separated (0x00 / 0x01 prefix),
+so an interior node can never be passed off as a leaf. Proofs are
+lists of hex digests, O(log n) long.
+"""
+
+import hashlib
+import hmac
+
+
+def leaf_hash(data: bytes) -> bytes:
+    return hashlib.sha256(b"\x00" + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _split(n: int) -> int:
+    # Largest power of two strictly smaller than n
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+def merkle_root(leaves: list[bytes]) -> bytes:
+    """
+    MTH over already-hashed leaves.
+    """
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+    if len(leaves) == 1:
+        return leaves[0]
+
+    k = _split(len(leaves))
+    return node_hash(merkle_root(leaves[:k]), merkle_root(leaves[k:]))
+
+
+def inclusion_path(leaves: list[bytes], index: int) -> list[bytes]:
+    """
+    Audit path of leaf `index` (leaf-to-root order).
+    """
+    if not 0 <= index < len(leaves):
+        raise IndexError(index)
+    if len(leaves) == 1:
+        return []
+
+    k = _split(len(leaves))
+    if index < k:
+        return inclusion_path(leaves[:k], index) + [merkle_root(leaves[k:])]
+    return inclusion_path(leaves[k:], index - k) + [merkle_root(leaves[:k])]
+
+
+def verify_inclusion(
+    *,
+    leaf: bytes,
+    index: int,
+    tree_size: int,
+    path: list[bytes],
+    root: bytes,
+) -> bool:
+    """
+    RFC 9162 section 2.1.3.2 inclusion proof verification.
+    """
+    if index >= tree_size:
+        return False
+
+    fn, sn, r = index, tree_size - 1, leaf
+
+    for p in path:
+        if sn == 0:
+            return False
+
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            if not fn & 1:
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+        else:
+            r = node_hash(r, p)
+
+        fn >>= 1
+        sn >>= 1
+
+    return sn == 0 and hmac.compare_digest(r, root)
@@ -0,0 +1,38 @@
+# app/core/metrics.py
+
+from typing import Callable
+
+
+# ------------------------------------------------------------------
+# In-process metrics registry
+# ------------------------------------------------------------------
+# Subsystems (caches, background workers) register a collector that
+# returns a flat dict of counters. `collect_metrics()` is what the
+# admin metrics endpoint exposes for scraping.
+
+MetricsCollector = Callable[[], dict[str, int | float]]
+
+_COLLECTORS: dict[str, MetricsCollector] = {}
+
+
+def register_metrics_source(name: str, collector: MetricsCollector) -> None:
+    """
+    Register (or replace) a named metrics collector.
+    """
+    _COLLECTORS[name] = collector
+
+
+def collect_metrics() -> dict[str, dict[str, int | float]]:
+    """
+    Snapshot all registered collectors.
+    A failing collector must NOT break the whole scrape.
+    """
+    snapshot: dict[str, dict[str, int | float]] = {}
+
+    for name, collector in _COLLECTORS.items():
+        try:
+            snapshot[name] = collector()
+        except Exception:
+            snapshot[name] = {"collector_error": 1}
+
+    return snapshot
@@ -0,0 +1,106 @@
+# app/core/password_hashing.py
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """
+    Raised when the hashing pool and its queue are full.
+    Routers map it to 503 (fast-fail instead of piling up requests).
+    """
+
+
+class PasswordHashingExecutor:
+    """
+    Dedicated, bounded pool for Argon2 hash/verify.
+
+    A thread pool is enough: argon2-cffi releases the GIL while
+    hashing, so N workers use N cores without pickling overhead. The
+    event loop and FastAPI's shared threadpool are never blocked by a
+    hash.
+
+    At most `max_workers` hashes run at once and `max_pending` wait;
+    anything beyond that is rejected immediately.
+    """
+
+    def __init__(self, *, max_workers: int, max_pending: int):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="argon2",
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_pending)
+
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+        self._slots.release()
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy("password hashing capacity exhausted")
+
+        with self._lock:
+            self.in_flight += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            # e.g. RuntimeError after shutdown: give the slot back
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+            raise
+
+        future.add_done_callback(self._release)
+        return future
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Blocking call for sync code paths (threadpool endpoints).
+        """
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Await the hash without blocking the event loop.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+password_hasher = PasswordHashingExecutor(
+    max_workers=settings.password_hash_workers or os.cpu_count() or 1,
+    max_pending=settings.password_hash_max_pending,
+)
+
+register_metrics_source("password_hashing", password_hasher.stats)
@@ -0,0 +1,89 @@
+# app/core/permission_masks.py
+
+from typing import Iterable
+
+from app.core.permissions import Permission
+from app.core.role_permissions import ROLE_PERMISSIONS
+
+
+# ------------------------------------------------------------------
+# Permission matching (supports wildcard)
+# ------------------------------------------------------------------
+
+
+def permission_matches(granted: Permission, required: Permission) -> bool:
+    """
+    Match permissions exactly or via wildcard.
+    """
+    if granted == required:
+        return True
+    if granted.value.endswith("*"):
+        return required.value.startswith(granted.value[:-1])
+    return False
+
+
+# ------------------------------------------------------------------
+# Compiled permission table (RBAC as bitmasks)
+# ------------------------------------------------------------------
+# Every Permission owns one bit. Each role is compiled into a mask with
+# wildcards ALREADY expanded, so a check is a single bitwise AND:
+#
+#     role_mask & PERMISSION_BITS[required] != 0
+#
+# Semantics are identical to `permission_matches` over the role's set.
+
+PERMISSION_BITS: dict[Permission, int] = {
+    permission: 1 << index for index, permission in enumerate(Permission)
+}
+
+ROLE_MASKS: dict[str, int] = {}
+
+# Bumped by every compile, so masks compiled into cached principals
+# can tell they are stale
+MASK_GENERATION = 0
+
+
+def compile_permission_mask(granted: Iterable[Permission]) -> int:
+    """
+    Expand granted permissions (incl. wildcards) into a bitmask.
+    """
+    granted = tuple(granted)
+    mask = 0
+
+    for required, bit in PERMISSION_BITS.items():
+        if any(permission_matches(g, required) for g in granted):
+            mask |= bit
+
+    return mask
+
+
+def compile_role_masks() -> None:
+    """
+    (Re)build ROLE_MASKS from ROLE_PERMISSIONS.
+    Runs at import; call again whenever ROLE_PERMISSIONS changes.
+    """
+    global ROLE_MASKS, MASK_GENERATION
+
+    # Rebind (not mutate) so concurrent readers never see a half-built table
+    ROLE_MASKS = {
+        role_name: compile_permission_mask(permissions)
+        for role_name, permissions in ROLE_PERMISSIONS.items()
+    }
+    MASK_GENERATION += 1
+
+
+def mask_for_roles(role_names: Iterable[str]) -> int:
+    """
+    Union of compiled role masks. Unknown roles grant nothing.
+    """
+    mask = 0
+    for name in role_names:
+        mask |= ROLE_MASKS.get(name, 0)
+    return mask
+
+
+def mask_allows(mask: int, permission: Permission) -> bool:
+    return bool(mask & PERMISSION_BITS[permission])
+
+
+compile_role_masks()
@@ -5,8 +5,13 @@ class BasePolicy(ABC):
     """
     Base class for all authorization policies.
     Deny-by-default.
+
+    `priority` decides evaluation order inside a permission's chain:
+    higher runs first (cheap, broad guards before resource checks).
     """
 
+    priority: int = 0
+
     @abstractmethod
     def allows(
         self,
@@ -22,8 +27,11 @@ class TenantIsolationPolicy(BasePolicy):
     """
     Enforces tenant isolation.
     User must belong to the same tenant.
+    Always evaluated first.
     """
 
+    priority = 100
+
     def allows(
         self,
         *,
@@ -0,0 +1,71 @@
+# app/core/principal.py
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable
+
+from app.core import permission_masks
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    The caller as the authorization engine sees it: ids, role names and
+    the compiled permission mask. Plain values only (no identity map,
+    no loaders), so one instance is shared process-wide by the caches.
+    """
+
+    id: int
+    tenant_id: int | None
+    role_names: tuple[str, ...]
+    permission_mask: int
+    epoch: int = 0
+    # permission_masks.MASK_GENERATION the mask was compiled under
+    mask_generation: int = 0
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        id: int,
+        tenant_id: int | None,
+        role_names: Iterable[str],
+        epoch: int = 0,
+    ) -> "Principal":
+        role_names = tuple(role_names)
+        return cls(
+            id=id,
+            tenant_id=tenant_id,
+            role_names=role_names,
+            permission_mask=permission_masks.mask_for_roles(role_names),
+            epoch=epoch,
+            mask_generation=permission_masks.MASK_GENERATION,
+        )
+
+    @property
+    def current_mask(self) -> int:
+        """
+        The compiled mask, recompiled if the role table changed since.
+        """
+        if self.mask_generation == permission_masks.MASK_GENERATION:
+            return self.permission_mask
+        return permission_masks.mask_for_roles(self.role_names)
+
+
+@dataclass(frozen=True, slots=True)
+class TenantRef:
+    """
+    Immutable snapshot of a Tenant row, safe to share between requests.
+    Carries the columns; relationships (users, roles) are not loaded.
+    """
+
+    id: int
+    name: str
+    created_at: datetime | None
+
+    @classmethod
+    def from_row(cls, row: Any) -> "TenantRef":
+        """
+        From a Core row or ORM Tenant (anything with id/name/created_at).
+        """
+        return cls(id=row.id, name=row.name, created_at=row.created_at)
@@ -0,0 +1,312 @@
+# app/core/principal_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+from app.core.principal import Principal
+from app.models.role import Role
+from app.models.user import User
+
+
+# ------------------------------------------------------------------
+# Cached principal snapshot
+# ------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRole:
+    id: int
+    name: str
+    tenant_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPrincipal:
+    """
+    Immutable snapshot of an authenticated user + roles.
+    NEVER holds ORM instances (they are bound to one session).
+
+    `principal` is what the authorization engine consumes; the other
+    fields rebuild the User handed to handlers.
+    """
+
+    principal: Principal
+    email: str
+    is_active: bool
+    created_at: datetime | None
+    roles: tuple[CachedRole, ...]
+
+    @property
+    def user_id(self) -> int:
+        return self.principal.id
+
+    @property
+    def tenant_id(self) -> int | None:
+        return self.principal.tenant_id
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedPrincipal":
+        roles = tuple(
+            CachedRole(id=role.id, name=role.name, tenant_id=role.tenant_id)
+            for role in user.roles
+        )
+        return cls(
+            principal=Principal.build(
+                id=user.id,
+                tenant_id=user.tenant_id,
+                role_names=(role.name for role in roles),
+                epoch=user.token_epoch or 0,
+            ),
+            email=user.email,
+            is_active=bool(user.is_active),
+            created_at=user.created_at,
+            roles=roles,
+        )
+
+    def to_user(self, db: Session) -> User:
+        """
+        Re-attach the snapshot to `db` WITHOUT emitting SQL.
+
+        A fresh detached User/Role graph is built per call and merged
+        with load=False, so the cache itself is never shared between
+        sessions. Attributes not in the snapshot (hashed_password)
+        stay expired and lazy-load only if accessed.
+        """
+        roles = []
+        for cached in self.roles:
+            role = Role(id=cached.id, name=cached.name, tenant_id=cached.tenant_id)
+            make_transient_to_detached(role)
+            roles.append(role)
+
+        user = User(
+            id=self.principal.id,
+            email=self.email,
+            tenant_id=self.tenant_id,
+            is_active=self.is_active,
+            created_at=self.created_at,
+        )
+        make_transient_to_detached(user)
+        set_committed_value(user, "roles", roles)
+
+        return db.merge(user, load=False)
+
+
+# ------------------------------------------------------------------
+# TTL + LRU cache keyed by (user_id, version stamp)
+# ------------------------------------------------------------------
+
+
+class PrincipalCache:
+    """
+    In-process principal cache.
+
+    Keys are (user_id, user_version, role_generation):
+    - user_version is bumped on writes to any User column the snapshot
+      holds (SNAPSHOT_ATTRS) or to Role.users, and on user deletion
+    - role_generation is bumped when a Role is renamed, moved or
+      deleted (affected users are unknown without a query, so all
+      principals are invalidated)
+
+    A bumped version makes older entries unreachable, so stale
+    privileges are never served. TTL bounds staleness for writes made
+    outside this process (other workers, raw SQL).
+
+    Versions come from one process-wide counter and only the most
+    recently bumped `max_entries` users keep theirs; every other user
+    is at `_version_floor`, the highest version pruned so far. Pruning
+    raises the floor, so it can only cause misses, never stale hits.
+    """
+
+    def __init__(self, *, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[
+            tuple[int, int, int], tuple[float, CachedPrincipal]
+        ] = OrderedDict()
+        self._versions: OrderedDict[int, int] = OrderedDict()
+        self._version_clock = 0
+        self._version_floor = 0
+        self._role_generation = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    # ----------------------
+    # Versioning
+    # ----------------------
+
+    def version_of(self, user_id: int) -> tuple[int, int, int]:
+        """
+        Current cache key for `user_id`.
+        Read it BEFORE loading from the DB and pass it to `put()`, so a
+        concurrent bump can never be overwritten by an older load.
+        """
+        with self._lock:
+            return self._key(user_id)
+
+    def _key(self, user_id: int) -> tuple[int, int, int]:
+        # Caller holds the lock
+        version = self._versions.get(user_id, self._version_floor)
+        return (user_id, version, self._role_generation)
+
+    def bump_user(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(self._key(user_id), None)
+
+            self._version_clock += 1
+            self._versions[user_id] = self._version_clock
+            self._versions.move_to_end(user_id)
+
+            # Bounded like the entries: forget the oldest bumps
+            while len(self._versions) > max(self.max_entries, 0):
+                _, pruned = self._versions.popitem(last=False)
+                self._version_floor = max(self._version_floor, pruned)
+
+            self.invalidations += 1
+
+    def bump_roles(self) -> None:
+        with self._lock:
+            self._role_generation += 1
+            self._entries.clear()
+            self.invalidations += 1
+
+    # ----------------------
+    # Lookup / store
+    # ----------------------
+
+    def get(self, user_id: int) -> CachedPrincipal | None:
+        now = time.monotonic()
+
+        with self._lock:
+            key = self._key(user_id)
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, principal = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return principal
+
+    def put(self, key: tuple[int, int, int], principal: CachedPrincipal) -> None:
+        if self.max_entries <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            # Skip loads that raced with an invalidation
+            if key != self._key(key[0]):
+                return
+
+            self._entries[key] = (expires_at, principal)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "versions": len(self._versions),
+            }
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries,
+)
+
+register_metrics_source("principal_cache", principal_cache.stats)
+
+
+# ------------------------------------------------------------------
+# Invalidation hooks (ORM writes)
+# ------------------------------------------------------------------
+# Changes are collected during flush and applied only after COMMIT,
+# so a concurrent request can't re-cache the pre-commit state under
+# the new version.
+
+_PENDING_USERS = "principal_cache_pending_users"
+_PENDING_ROLES = "principal_cache_pending_roles"
+
+# User attributes CachedPrincipal.from_user reads: a write to any of
+# them makes the cached snapshot stale
+SNAPSHOT_ATTRS = (
+    "email",
+    "tenant_id",
+    "is_active",
+    "created_at",
+    "token_epoch",
+    "roles",
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_principal_changes(session: Session, flush_context) -> None:
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User):
+            state = inspect(obj)
+            if obj in session.deleted or any(
+                state.attrs[name].history.has_changes() for name in SNAPSHOT_ATTRS
+            ):
+                session.info.setdefault(_PENDING_USERS, set()).add(obj.id)
+
+        elif isinstance(obj, Role):
+            state = inspect(obj)
+            if obj in session.deleted or any(
+                state.attrs[name].history.has_changes()
+                for name in ("name", "tenant_id")
+            ):
+                session.info[_PENDING_ROLES] = True
+
+            # role.users.append(...) / .remove(...) — only those users change
+            added, _, removed = state.attrs.users.history
+            for user in [*(added or ()), *(removed or ())]:
+                if user.id is not None:
+                    session.info.setdefault(_PENDING_USERS, set()).add(user.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_principal_changes(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_USERS, ()):
+        principal_cache.bump_user(user_id)
+
+    if session.info.pop(_PENDING_ROLES, False):
+        principal_cache.bump_roles()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_principal_changes(session: Session) -> None:
+    session.info.pop(_PENDING_USERS, None)
+    session.info.pop(_PENDING_ROLES, None)
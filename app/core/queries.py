@@ -0,0 +1,133 @@
+# app/core/queries.py
+"""
+Pre-built statements for the hot read paths (principal, tenant, login,
+refresh and tenant-scoped lookups).
+
+Every statement is built ONCE at import with named bind parameters, so
+a call only binds values: no Query/Select construction per request,
+and the statement's cache key is memoized, so SQLAlchemy's compiled
+cache is hit every time.
+
+- Core column selects wherever the caller doesn't need an ORM
+  identity (nothing enters the session's identity map)
+- ORM entity selects only where the row is mutated or returned to
+  callers; those skip the User.roles selectin load
+
+    db.execute(queries.LOGIN_USER, {"email": email, "tenant_id": tid})
+
+scripts/bench_queries.py measures these against the db.query() code
+they replaced.
+"""
+
+from functools import lru_cache
+
+from sqlalchemy import Select, bindparam, select
+from sqlalchemy.orm import lazyload
+
+from app.models.refresh_token import RefreshToken
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.models.user_roles import user_roles
+
+# ------------------------------------------------------------------
+# Principal / epoch (every authenticated request on a cold cache)
+# ------------------------------------------------------------------
+
+# params: user_id -> int | None
+USER_EPOCH = select(User.token_epoch).where(User.id == bindparam("user_id"))
+
+# params: user_id -> one Core row per role (role_* NULL without roles)
+PRINCIPAL = (
+    select(
+        User.id,
+        User.email,
+        User.tenant_id,
+        User.is_active,
+        User.created_at,
+        User.token_epoch,
+        Tenant.name.label("tenant_name"),
+        Tenant.created_at.label("tenant_created_at"),
+        Role.id.label("role_id"),
+        Role.name.label("role_name"),
+        Role.tenant_id.label("role_tenant_id"),
+    )
+    .outerjoin(Tenant, Tenant.id == User.tenant_id)
+    .outerjoin(user_roles, user_roles.c.user_id == User.id)
+    .outerjoin(Role, Role.id == user_roles.c.role_id)
+    .where(User.id == bindparam("user_id"))
+    .order_by(Role.id)
+)
+
+# ------------------------------------------------------------------
+# Tenants (tenant_cache misses)
+# ------------------------------------------------------------------
+
+_TENANT_COLUMNS = (Tenant.id, Tenant.name, Tenant.created_at)
+
+# params: tenant_id -> Core row | None
+TENANT_BY_ID = select(*_TENANT_COLUMNS).where(Tenant.id == bindparam("tenant_id"))
+
+# no params -> Core row | None (the tenant used by the auth endpoints)
+DEFAULT_TENANT = select(*_TENANT_COLUMNS).limit(1)
+
+# ------------------------------------------------------------------
+# Login / registration / refresh
+# ------------------------------------------------------------------
+
+# params: email, tenant_id -> Core row with what authentication reads
+LOGIN_USER = select(
+    User.id,
+    User.hashed_password,
+    User.is_active,
+    User.token_epoch,
+).where(
+    User.email == bindparam("email"),
+    User.tenant_id == bindparam("tenant_id"),
+)
+
+# params: email, tenant_id -> user id | None
+EMAIL_TAKEN = (
+    select(User.id)
+    .where(
+        User.email == bindparam("email"),
+        User.tenant_id == bindparam("tenant_id"),
+    )
+    .limit(1)
+)
+
+# params: digest, tenant_id -> RefreshToken (ORM: it is rotated in place)
+REFRESH_TOKEN = select(RefreshToken).where(
+    RefreshToken.token_digest == bindparam("digest"),
+    RefreshToken.tenant_id == bindparam("tenant_id"),
+)
+
+# ------------------------------------------------------------------
+# Tenant-scoped entities
+# ------------------------------------------------------------------
+
+# params: user_id, tenant_id -> User (roles load lazily, only if read)
+USER_IN_TENANT = (
+    select(User)
+    .where(
+        User.id == bindparam("user_id"),
+        User.tenant_id == bindparam("tenant_id"),
+    )
+    .options(lazyload(User.roles))
+)
+
+
+@lru_cache(maxsize=None)
+def scoped_by_id(model) -> Select:
+    """
+    params: obj_id, tenant_id -> `model` row of that tenant | None.
+    Built once per model; relationships load lazily, only if read.
+    """
+    return (
+        select(model)
+        .where(
+            model.id == bindparam("obj_id"),
+            model.tenant_id == bindparam("tenant_id"),
+        )
+        .options(lazyload("*"))
+    )
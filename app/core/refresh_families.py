@@ -0,0 +1,93 @@
+# app/core/refresh_families.py
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+
+
+def new_family_id() -> str:
+    """
+    One id per login; every rotated refresh token inherits it.
+    """
+    return uuid.uuid4().hex
+
+
+class RevokedFamilyDenylist:
+    """
+    Bounded, in-process set of revoked refresh-token families.
+
+    - checked on every refresh before rotating: a family revoked in
+      this process is refused without trusting the row just read.
+      It is only a fast path; concurrent refreshes are serialized by
+      the conditional rotation UPDATE (refresh_tokens), not by this set
+    - an entry lives for the refresh token lifetime: every token of the
+      family was issued before the revocation, so none can still be
+      valid after that
+    - the database stays authoritative (all rows of the family are
+      revoked), so LRU eviction never re-enables a token
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.revoked = 0
+        self.evictions = 0
+
+    def add(self, family_id: str) -> None:
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[family_id] = time.time() + self.ttl_seconds
+            self._entries.move_to_end(family_id)
+            self.revoked += 1
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, family_id: str | None) -> bool:
+        if family_id is None:
+            return False
+
+        with self._lock:
+            expires_at = self._entries.get(family_id)
+            if expires_at is None:
+                return False
+
+            if expires_at <= time.time():
+                del self._entries[family_id]
+                return False
+
+            self.hits += 1
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revoked": self.revoked,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+
+revoked_families = RevokedFamilyDenylist(
+    max_entries=settings.refresh_family_denylist_max_entries,
+    ttl_seconds=settings.refresh_token_expire_days * 86400,
+)
+
+register_metrics_source("refresh_family_denylist", revoked_families.stats)
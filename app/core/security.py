@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Union, Dict, Any
+import hashlib
+from typing import Optional, Union, Dict, Any, Mapping
 import uuid
 
 from jose import jwt, JWTError
@@ -7,6 +8,8 @@ from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.config import settings
+from app.core.password_hashing import password_hasher
+from app.core.token_cache import token_cache
 
 
 # -------------------------
@@ -18,18 +21,38 @@ pwd_context = CryptContext(
 )
 
 
+# Both run on the dedicated, bounded hashing pool and raise
+# PasswordHasherBusy when it is saturated.
+
+
 def get_password_hash(password: str) -> str:
     """
     Hash plain password using Argon2.
     """
-    return pwd_context.hash(password)
+    return password_hasher.run(pwd_context.hash, password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify password against stored hash.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.run(pwd_context.verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash plain password without blocking the event loop.
+    """
+    return await password_hasher.run_async(pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify password without blocking the event loop.
+    """
+    return await password_hasher.run_async(
+        pwd_context.verify, plain_password, hashed_password
+    )
 
 
 # -------------------------
@@ -106,15 +129,33 @@ def create_refresh_token(subject: Union[str, Dict[str, Any]]) -> str:
     )
 
 
-def decode_token(token: str) -> dict:
+def refresh_token_digest(token: str) -> bytes:
+    """
+    32-byte SHA-256 of an opaque refresh token: what the DB stores and
+    looks up. Tokens carry 384 random bits, so a plain (unkeyed) hash is
+    enough and survives SECRET_KEY rotation.
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+def decode_token(token: str) -> Mapping[str, Any]:
     """
     Decode and validate JWT token.
+
+    Verified claims are cached (read-only) until the token's `exp`, so
+    a reused token skips parsing and signature verification.
     """
+    claims = token_cache.get(token)
+    if claims is not None:
+        return claims
+
     try:
-        return jwt.decode(
+        claims = jwt.decode(
             token,
             settings.secret_key,
             algorithms=[settings.algorithm],
         )
     except JWTError:
         raise ValueError("Invalid or expired token")
+
+    return token_cache.put(token, claims)
@@ -0,0 +1,136 @@
+# app/core/security_context.py
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core import queries
+from app.core.principal import Principal, TenantRef
+from app.core.principal_cache import CachedPrincipal, CachedRole, principal_cache
+from app.core.tenant_cache import get_tenant, get_tenant_async, tenant_cache
+from app.core.token_epochs import token_epochs
+from app.models.user import User
+
+# request.state attribute holding the resolved context
+STATE_ATTR = "security_context"
+
+
+@dataclass(frozen=True)
+class SecurityContext:
+    """
+    Everything authorization needs about the caller, resolved once per
+    request: the verified claims, the principal the authorization
+    engine consumes, the user's tenant and the User (attached to the
+    request session) for handlers.
+    """
+
+    claims: dict[str, Any]
+    principal: Principal
+    tenant: TenantRef | None
+    user: User
+
+    @property
+    def user_id(self) -> int:
+        return self.principal.id
+
+    @property
+    def tenant_id(self) -> int | None:
+        return self.tenant.id if self.tenant is not None else None
+
+    @property
+    def role_names(self) -> tuple[str, ...]:
+        return self.principal.role_names
+
+
+def load_principal(
+    db: Session, user_id: int
+) -> tuple[CachedPrincipal, TenantRef | None] | None:
+    """
+    Cold path: one joined SELECT (queries.PRINCIPAL: user, tenant and
+    one Core row per role; nothing enters the identity map), then both
+    caches are filled from it. Returns None if the user doesn't exist.
+    """
+    # Versions read BEFORE the load: a concurrent invalidation wins
+    cache_key = principal_cache.version_of(user_id)
+    generation = tenant_cache.generation
+
+    rows = db.execute(queries.PRINCIPAL, {"user_id": user_id}).all()
+    return _store_principal(rows, cache_key, generation)
+
+
+async def load_principal_async(
+    db: AsyncSession, user_id: int
+) -> tuple[CachedPrincipal, TenantRef | None] | None:
+    """
+    AsyncSession flavour of load_principal (same single SELECT).
+    """
+    cache_key = principal_cache.version_of(user_id)
+    generation = tenant_cache.generation
+
+    rows = (await db.execute(queries.PRINCIPAL, {"user_id": user_id})).all()
+    return _store_principal(rows, cache_key, generation)
+
+
+def _store_principal(
+    rows: list, cache_key: tuple[int, int, int], generation: int
+) -> tuple[CachedPrincipal, TenantRef | None] | None:
+    if not rows:
+        return None
+
+    row = rows[0]
+    roles = tuple(
+        CachedRole(id=r.role_id, name=r.role_name, tenant_id=r.role_tenant_id)
+        for r in rows
+        if r.role_id is not None
+    )
+    cached = CachedPrincipal(
+        principal=Principal.build(
+            id=row.id,
+            tenant_id=row.tenant_id,
+            role_names=(role.name for role in roles),
+            epoch=row.token_epoch,
+        ),
+        email=row.email,
+        is_active=bool(row.is_active),
+        created_at=row.created_at,
+        roles=roles,
+    )
+    principal_cache.put(cache_key, cached)
+    token_epochs.observe(row.id, row.token_epoch)
+
+    if row.tenant_name is None:
+        return cached, None
+
+    tenant = TenantRef(
+        id=row.tenant_id, name=row.tenant_name, created_at=row.tenant_created_at
+    )
+    tenant_cache.put(generation, tenant.id, tenant)
+    return cached, tenant
+
+
+def resolve_principal(
+    db: Session, user_id: int
+) -> tuple[CachedPrincipal, TenantRef | None] | None:
+    """
+    Principal and tenant for `user_id`: from the caches when both hit
+    (no SQL), else through `load_principal`.
+    """
+    cached = principal_cache.get(user_id)
+    if cached is None:
+        return load_principal(db, user_id)
+
+    tenant = get_tenant(db, cached.tenant_id) if cached.tenant_id else None
+    return cached, tenant
+
+
+async def resolve_principal_async(
+    db: AsyncSession, user_id: int
+) -> tuple[CachedPrincipal, TenantRef | None] | None:
+    cached = principal_cache.get(user_id)
+    if cached is None:
+        return await load_principal_async(db, user_id)
+
+    tenant = await get_tenant_async(db, cached.tenant_id) if cached.tenant_id else None
+    return cached, tenant
@@ -0,0 +1,202 @@
+# app/core/tenant_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core import queries
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+from app.core.principal import TenantRef
+from app.models.tenant import Tenant
+
+
+# Key of the tenant used by the auth endpoints (first row, see
+# app/api/v1/auth.py); other keys are tenant ids
+DEFAULT_TENANT = "default"
+
+
+class TenantCache:
+    """
+    Read-through TTL + LRU cache of tenant snapshots.
+
+    Any committed Tenant update or delete bumps the generation and
+    drops every entry: tenants change rarely, and the default tenant
+    can't be invalidated by id. Loads that raced with a bump are not
+    stored. TTL bounds staleness for writes made outside this process.
+    Missing tenants are never cached.
+    """
+
+    def __init__(self, *, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[int | str, tuple[float, TenantRef]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Read it BEFORE loading from the DB and pass it to `put()`.
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, key: int | str) -> TenantRef | None:
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, tenant = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return tenant
+
+    def put(self, generation: int, key: int | str, tenant: TenantRef) -> None:
+        if self.max_entries <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._entries[key] = (expires_at, tenant)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+
+tenant_cache = TenantCache(
+    ttl_seconds=settings.tenant_cache_ttl_seconds,
+    max_entries=settings.tenant_cache_max_entries,
+)
+
+register_metrics_source("tenant_cache", tenant_cache.stats)
+
+
+# ------------------------------------------------------------------
+# Read-through lookups
+# ------------------------------------------------------------------
+
+
+def _store(generation: int, key: int | str, row: Any | None) -> TenantRef | None:
+    if row is None:
+        return None
+
+    snapshot = TenantRef.from_row(row)
+    tenant_cache.put(generation, snapshot.id, snapshot)
+    if key == DEFAULT_TENANT:
+        tenant_cache.put(generation, DEFAULT_TENANT, snapshot)
+    return snapshot
+
+
+def get_tenant(db: Session, tenant_id: int) -> TenantRef | None:
+    cached = tenant_cache.get(tenant_id)
+    if cached is not None:
+        return cached
+
+    generation = tenant_cache.generation
+    row = db.execute(queries.TENANT_BY_ID, {"tenant_id": tenant_id}).first()
+    return _store(generation, tenant_id, row)
+
+
+def get_default_tenant(db: Session) -> TenantRef | None:
+    cached = tenant_cache.get(DEFAULT_TENANT)
+    if cached is not None:
+        return cached
+
+    generation = tenant_cache.generation
+    row = db.execute(queries.DEFAULT_TENANT).first()
+    return _store(generation, DEFAULT_TENANT, row)
+
+
+async def get_tenant_async(db: AsyncSession, tenant_id: int) -> TenantRef | None:
+    cached = tenant_cache.get(tenant_id)
+    if cached is not None:
+        return cached
+
+    generation = tenant_cache.generation
+    row = (await db.execute(queries.TENANT_BY_ID, {"tenant_id": tenant_id})).first()
+    return _store(generation, tenant_id, row)
+
+
+async def get_default_tenant_async(db: AsyncSession) -> TenantRef | None:
+    cached = tenant_cache.get(DEFAULT_TENANT)
+    if cached is not None:
+        return cached
+
+    generation = tenant_cache.generation
+    row = (await db.execute(queries.DEFAULT_TENANT)).first()
+    return _store(generation, DEFAULT_TENANT, row)
+
+
+# ------------------------------------------------------------------
+# Invalidation hooks (ORM writes)
+# ------------------------------------------------------------------
+# Applied after COMMIT only, as in principal_cache.
+
+_PENDING_TENANTS = "tenant_cache_pending"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tenant_changes(session: Session, flush_context) -> None:
+    if any(
+        isinstance(obj, Tenant) for obj in list(session.dirty) + list(session.deleted)
+    ):
+        session.info[_PENDING_TENANTS] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_tenant_changes(session: Session) -> None:
+    if session.info.pop(_PENDING_TENANTS, False):
+        tenant_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_tenant_changes(session: Session) -> None:
+    session.info.pop(_PENDING_TENANTS, None)
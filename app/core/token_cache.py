@@ -0,0 +1,154 @@
+# app/core/token_cache.py
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+
+
+def token_digest(token: str) -> bytes:
+    """
+    Cache key: raw tokens are never kept in memory.
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of already-verified JWT claims.
+
+    - keyed by sha256(raw token), so a hit needs no base64 / JSON
+      parsing and no HMAC verification
+    - each entry lives until the token's own `exp` (wall clock, the
+      same clock jose validates against); tokens without `exp` are
+      never cached
+    - claims are stored read-only and shared between requests
+
+    Revocation: `purge_token()` drops one token, `purge_subject()` every
+    cached token of a user (logout-everywhere, deactivation, ...).
+    """
+
+    def __init__(self, *, max_entries: int):
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[
+            bytes, tuple[float, Mapping[str, Any]]
+        ] = OrderedDict()
+        self._by_subject: dict[str, set[bytes]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.purged = 0
+
+    # ----------------------
+    # Lookup / store
+    # ----------------------
+
+    def get(self, token: str) -> Mapping[str, Any] | None:
+        digest = token_digest(token)
+
+        with self._lock:
+            entry = self._entries.get(digest)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                self._remove(digest)
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return claims
+
+    def put(self, token: str, claims: dict[str, Any]) -> Mapping[str, Any]:
+        """
+        Store verified `claims`; returns the read-only view to hand out.
+        """
+        frozen = MappingProxyType(dict(claims))
+
+        exp = claims.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)):
+            return frozen
+
+        digest = token_digest(token)
+        subject = claims.get("sub")
+
+        with self._lock:
+            self._entries[digest] = (float(exp), frozen)
+            self._entries.move_to_end(digest)
+
+            if subject is not None:
+                self._by_subject.setdefault(str(subject), set()).add(digest)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+        return frozen
+
+    def _remove(self, digest: bytes) -> None:
+        # caller holds the lock
+        _, claims = self._entries.pop(digest)
+
+        subject = claims.get("sub")
+        if subject is not None:
+            digests = self._by_subject.get(str(subject))
+            if digests is not None:
+                digests.discard(digest)
+                if not digests:
+                    del self._by_subject[str(subject)]
+
+    # ----------------------
+    # Revocation hooks
+    # ----------------------
+
+    def purge_token(self, token: str) -> None:
+        digest = token_digest(token)
+
+        with self._lock:
+            if digest in self._entries:
+                self._remove(digest)
+                self.purged += 1
+
+    def purge_subject(self, subject: str | int) -> None:
+        with self._lock:
+            for digest in list(self._by_subject.get(str(subject), ())):
+                self._remove(digest)
+                self.purged += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_subject.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "purged": self.purged,
+                "size": len(self._entries),
+            }
+
+
+token_cache = VerifiedTokenCache(max_entries=settings.token_cache_max_entries)
+
+register_metrics_source("token_cache", token_cache.stats)
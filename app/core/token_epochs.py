@@ -0,0 +1,118 @@
+# app/core/token_epochs.py
+
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+
+# JWT claim carrying User.token_epoch at issue time; tokens without it
+# count as epoch 0
+EPOCH_CLAIM = "epoch"
+
+
+class TokenEpochCache:
+    """
+    In-process map user_id -> current User.token_epoch.
+
+    An access token is accepted only if its epoch claim is not older
+    than the user's current epoch, so bumping the epoch (logout
+    everywhere, password change, deactivation) kills every outstanding
+    access token at once. In the common case the check is one dict
+    lookup.
+
+    Epochs only ever grow, so `observe()` keeps the maximum it has
+    seen: a slow load can never roll back a bump made meanwhile, and a
+    token carrying a newer epoch than the cached one proves the entry
+    stale. TTL bounds staleness for bumps made by other processes.
+    """
+
+    def __init__(self, *, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[int, tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, user_id: int) -> int | None:
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, epoch = entry
+            if expires_at <= now:
+                del self._entries[user_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return epoch
+
+    def observe(self, user_id: int, epoch: int) -> int:
+        """
+        Record an epoch read from the DB or a verified token; returns
+        the user's current epoch.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                epoch = max(epoch, entry[1])
+
+            if self.max_entries <= 0:
+                return epoch
+
+            self._entries[user_id] = (now + self.ttl_seconds, epoch)
+            self._entries.move_to_end(user_id)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return epoch
+
+    def accepts(self, user_id: int, claimed: int, current: int) -> bool:
+        """
+        Whether a verified token claiming epoch `claimed` is still valid
+        when the user's epoch is `current`.
+        """
+        if claimed < current:
+            return False
+
+        if claimed > current:
+            # Issued after a bump this process hasn't seen yet
+            self.observe(user_id, claimed)
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+
+token_epochs = TokenEpochCache(
+    ttl_seconds=settings.token_epoch_cache_ttl_seconds,
+    max_entries=settings.token_epoch_cache_max_entries,
+)
+
+register_metrics_source("token_epochs", token_epochs.stats)
@@ -1,22 +1,20 @@
 # ===== app/core/utils.py =====
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from app.models.tenant import Tenant
+from app.core import queries
+from app.core.principal import TenantRef
 
 
 def get_scoped_resource_or_forbid(
     db: Session,
-    tenant: Tenant,
+    tenant: TenantRef,
     model,
     obj_id: int,
 ):
-    obj = (
-        db.query(model)
-        .filter(
-            model.id == obj_id,
-            model.tenant_id == tenant.id,
-        )
-        .first()
+    # Statement built once per model (app.core.queries)
+    obj = db.scalar(
+        queries.scoped_by_id(model),
+        {"obj_id": obj_id, "tenant_id": tenant.id},
     )
 
     if not obj:
@@ -1,11 +1,48 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from app.core.authorization import compile_policy_chains
+    from app.core.config import settings
+    from app.services.audit_service import audit_writer
+    from app.services.refresh_token_gc import refresh_token_collector
+
+    # Freeze policy registry into precompiled, precedence-ordered chains
+    compile_policy_chains()
+
+    if settings.audit_async_enabled:
+        audit_writer.start()
+
+    if settings.refresh_token_gc_enabled:
+        refresh_token_collector.start()
+
+    try:
+        yield
+    finally:
+        refresh_token_collector.stop()
+
+        # Drain queued audit decisions before the process exits
+        audit_writer.stop()
+
+        if settings.database_async_enabled:
+            from app.core.database import get_async_engine
+
+            await get_async_engine().dispose()
+
+
 def create_app():
-    app = FastAPI()
+    from app.core.config import settings
+
+    app = FastAPI(lifespan=lifespan)
 
-    from app.api.v1.auth import router as auth_router
+    if settings.database_async_enabled:
+        from app.api.v1.auth_async import router as auth_router
+    else:
+        from app.api.v1.auth import router as auth_router
     from app.api.v1.users import router as users_router
     from app.routers.tenant_dashboard import router as tenant_router
     from app.routers.admin import router as admin_router
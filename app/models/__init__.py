@@ -4,6 +4,10 @@ from app.models.role import Role
 from app.models.refresh_token import RefreshToken
 from app.models.user_roles import user_roles
 from app.models.item import Item
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.audit_chain_head import AuditChainHead
+from app.models.audit_checkpoint import AuditVerificationCheckpoint
+from app.models.audit_segment import AuditMerkleSegment
 
 __all__ = [
     "Tenant",
@@ -12,4 +16,8 @@ __all__ = [
     "RefreshToken",
     "user_roles",
     "Item",
+    "AuthorizationAuditLog",
+    "AuditChainHead",
+    "AuditVerificationCheckpoint",
+    "AuditMerkleSegment",
 ]
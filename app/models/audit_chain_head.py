@@ -0,0 +1,45 @@
+# app/models/audit_chain_head.py
+
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+GLOBAL_CHAIN_KEY = "global"
+
+
+def chain_key_for(tenant_id: int | None) -> str:
+    """
+    Audit chains are partitioned per tenant.
+    Tenant-less decisions (e.g. ADMIN_DASHBOARD) share the global chain.
+    """
+    if tenant_id is None:
+        return GLOBAL_CHAIN_KEY
+    return f"tenant:{tenant_id}"
+
+
+class AuditChainHead(Base):
+    """
+    Head pointer of ONE authorization audit hash chain.
+
+    Appenders advance it with a compare-and-swap
+    (UPDATE ... WHERE seq = :expected RETURNING seq) in the same
+    transaction as their INSERT, so appends to one chain serialize on
+    this row while different tenants append in parallel.
+    """
+
+    __tablename__ = "audit_chain_heads"
+
+    chain_key = Column(String(32), primary_key=True)
+    tenant_id = Column(Integer, nullable=True)
+
+    last_hash = Column(String(64), nullable=True)
+    seq = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
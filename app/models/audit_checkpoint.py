@@ -0,0 +1,39 @@
+# app/models/audit_checkpoint.py
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+# Checkpoint key of the legacy chain (rows with chain_key IS NULL)
+LEGACY_CHECKPOINT_KEY = "legacy"
+
+
+class AuditVerificationCheckpoint(Base):
+    """
+    Last verified position of ONE audit chain.
+
+    Written by the streaming verifier after a clean run so the next
+    run only verifies newer rows. HMAC-signed with the audit signing
+    key: a forged checkpoint is ignored and the chain is re-verified
+    from the start.
+    """
+
+    __tablename__ = "audit_verification_checkpoints"
+
+    chain_key = Column(String(32), primary_key=True)
+
+    last_id = Column(Integer, nullable=False)
+    last_seq = Column(BigInteger, nullable=True)
+    last_hash = Column(String(64), nullable=True)
+    entries_verified = Column(BigInteger, nullable=False)
+
+    signature = Column(String(64), nullable=False)
+
+    verified_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -1,6 +1,7 @@
 # app/models/audit_log.py
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     Integer,
     String,
@@ -23,6 +24,10 @@ class AuthorizationAuditLog(Base):
     - HMAC-signed
     - Tamper-evident
     - Audit-grade (NOT business logging)
+
+    On PostgreSQL the table is range-partitioned by month on created_at
+    (migration 5b1e9c0d7a24, see app.services.audit_partitions). The
+    model stays unpartitioned so create_all schemas keep working.
     """
 
     __tablename__ = "authorization_audit_logs"
@@ -46,6 +51,12 @@ class AuthorizationAuditLog(Base):
     context = Column(Text, nullable=True)
 
     # === Cryptographic Integrity ===
+    # Chain this entry belongs to (see audit_chain_head.chain_key_for).
+    # NULL = legacy single global chain written before partitioning.
+    chain_key = Column(String(32), nullable=True)
+    # 1-based position inside the chain (NULL for rows predating it)
+    chain_seq = Column(BigInteger, nullable=True)
+
     signature = Column(String(64), nullable=False)
     prev_hash = Column(String(64), nullable=True)
     entry_hash = Column(String(64), nullable=False)
@@ -72,4 +83,16 @@ class AuthorizationAuditLog(Base):
             "tenant_id",
             "created_at",
         ),
+        Index(
+            "ix_auth_audit_chain",
+            "chain_key",
+            "id",
+        ),
+        # DB-level fork guard: one entry per chain position
+        Index(
+            "ux_auth_audit_chain_seq",
+            "chain_key",
+            "chain_seq",
+            unique=True,
+        ),
     )
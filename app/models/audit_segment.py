@@ -0,0 +1,59 @@
+# app/models/audit_segment.py
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class AuditMerkleSegment(Base):
+    """
+    Signed Merkle root over ONE fixed-size segment of an audit chain.
+
+    Segment k of a chain covers its entries k*size .. (k+1)*size - 1 in
+    append order (first_id .. last_id). Leaves commit to (id,
+    entry_hash), so one entry is proven with an O(log size) path
+    against `root`. `last_hash` links consecutive segments.
+    """
+
+    __tablename__ = "audit_merkle_segments"
+
+    id = Column(Integer, primary_key=True)
+
+    # LEGACY_CHECKPOINT_KEY for the pre-partitioning chain
+    chain_key = Column(String(32), nullable=False)
+    segment_index = Column(Integer, nullable=False)
+
+    first_id = Column(Integer, nullable=False)
+    last_id = Column(Integer, nullable=False)
+    entry_count = Column(Integer, nullable=False)
+
+    root = Column(String(64), nullable=False)
+    last_hash = Column(String(64), nullable=True)
+    signature = Column(String(64), nullable=False)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index(
+            "ux_audit_merkle_segment",
+            "chain_key",
+            "segment_index",
+            unique=True,
+        ),
+        Index(
+            "ix_audit_merkle_segment_range",
+            "chain_key",
+            "last_id",
+        ),
+    )
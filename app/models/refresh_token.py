@@ -6,6 +6,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Boolean,
+    LargeBinary,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -18,7 +19,9 @@ class RefreshToken(Base):
 
     id = Column(Integer, primary_key=True, index=True)
 
-    token = Column(String, unique=True, nullable=False, index=True)
+    # SHA-256 of the opaque token (security.refresh_token_digest);
+    # the plaintext is only ever returned to the client
+    token_digest = Column(LargeBinary(32), nullable=False)
 
     user_id = Column(
         Integer,
@@ -39,7 +42,12 @@ class RefreshToken(Base):
     revoked = Column(Boolean, default=False, nullable=False)
     revoked_at = Column(DateTime(timezone=True), nullable=True)
 
-    replaced_by_token = Column(String, nullable=True)
+    # Shared by every token rotated from the same login; reuse of a
+    # rotated token revokes the whole family
+    family_id = Column(String(32), nullable=False)
+
+    # Digest of the token this one was rotated into
+    replaced_by_digest = Column(LargeBinary(32), nullable=True)
 
     created_at = Column(
         DateTime(timezone=True),
@@ -50,7 +58,23 @@ class RefreshToken(Base):
     user = relationship("User", back_populates="refresh_tokens")
     tenant = relationship("Tenant")
 
-    __table_args__ = (Index("ix_refresh_token_token_tenant", "token", "tenant_id"),)
+    __table_args__ = (
+        # The only lookup path: refresh by (digest, tenant)
+        Index(
+            "ix_refresh_token_digest_tenant",
+            "token_digest",
+            "tenant_id",
+            unique=True,
+        ),
+        Index("ix_refresh_token_family", "family_id"),
+        # Garbage collector range scans (services/refresh_token_gc.py)
+        Index("ix_refresh_token_expires", "expires_at"),
+        Index(
+            "ix_refresh_token_revoked_at",
+            "revoked_at",
+            postgresql_where=revoked_at.isnot(None),
+        ),
+    )
 
     # Helper to coerce naive datetimes to UTC-aware for comparisons
     @staticmethod
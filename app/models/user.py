@@ -5,6 +5,7 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     DateTime,
+    Index,
     text,
 )
 from sqlalchemy.sql import expression
@@ -24,11 +25,15 @@ class User(Base):
 
     is_active = Column(Boolean, nullable=False, server_default=expression.true())
 
+    # Embedded in access tokens; bumping it revokes all of them
+    # (auth_service.invalidate_sessions)
+    token_epoch = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Indexed by ix_users_tenant_id_id (tenant lookups use its prefix)
     tenant_id = Column(
         Integer,
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     created_at = Column(
@@ -58,5 +63,10 @@ class User(Base):
         passive_deletes=True,
     )
 
+    __table_args__ = (
+        # Keyset pagination of tenant listings (user_service.list_users)
+        Index("ix_users_tenant_id_id", "tenant_id", "id"),
+    )
+
     def __repr__(self) -> str:
         return f"<User id={self.id} email={self.email} tenant_id={self.tenant_id}>"
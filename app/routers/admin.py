@@ -1,7 +1,19 @@
-from fastapi import APIRouter, Depends
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
 from app.core.permissions import Permission
 from app.core.deps import get_current_user, require_permission
+from app.core.metrics import collect_metrics
 from app.models.user import User
+from app.services.audit_merkle import (
+    ProofUnavailable,
+    inclusion_proof,
+    seal_all_segments,
+)
+from app.services.audit_verifier import verify_all_chains_streaming
 
 router = APIRouter(
     prefix="/admin",
@@ -15,3 +27,53 @@ def admin_dashboard(
     _: None = Depends(require_permission(Permission.ADMIN_DASHBOARD)),
 ):
     return {"msg": f"Welcome admin {current_user.email}"}
+
+
+@router.get(
+    "/metrics",
+    dependencies=[Depends(require_permission(Permission.ADMIN_DASHBOARD))],
+)
+def admin_metrics():
+    return collect_metrics()
+
+
+@router.post(
+    "/audit/verify",
+    dependencies=[Depends(require_permission(Permission.ADMIN_DASHBOARD))],
+)
+def admin_verify_audit(full: bool = False, db: Session = Depends(get_db)):
+    """
+    Verify every audit chain. Resumes from signed checkpoints unless
+    `full=true`, so routine runs only check entries added since.
+    """
+    results = verify_all_chains_streaming(db, resume=not full)
+    return {
+        "ok": all(result.ok for result in results),
+        "chains": [asdict(result) for result in results],
+    }
+
+
+@router.post(
+    "/audit/segments",
+    dependencies=[Depends(require_permission(Permission.ADMIN_DASHBOARD))],
+)
+def admin_seal_audit_segments(db: Session = Depends(get_db)):
+    return {"sealed": seal_all_segments(db)}
+
+
+@router.get(
+    "/audit/proof/{entry_id}",
+    dependencies=[Depends(require_permission(Permission.ADMIN_DASHBOARD))],
+)
+def admin_audit_inclusion_proof(entry_id: int, db: Session = Depends(get_db)):
+    try:
+        return asdict(inclusion_proof(db, entry_id))
+    except ProofUnavailable as e:
+        raise HTTPException(
+            status_code=(
+                status.HTTP_404_NOT_FOUND
+                if e.reason == "entry_not_found"
+                else status.HTTP_409_CONFLICT
+            ),
+            detail=e.reason,
+        )
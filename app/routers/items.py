@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from app.core.permissions import Permission
 from app.core.deps import get_current_tenant, require_permission
-from app.models.tenant import Tenant
+from app.core.principal import TenantRef
 from app.models.item import Item
 from sqlalchemy.orm import Session
 from app.core.database import get_db
@@ -17,7 +17,7 @@ router = APIRouter(
     dependencies=[Depends(require_permission(Permission.ITEMS_READ))],
 )
 def read_item(
-    tenant: Tenant = Depends(get_current_tenant),
+    tenant: TenantRef = Depends(get_current_tenant),
     db: Session = Depends(get_db),
     item_id: int | None = None,
 ):
@@ -30,7 +30,7 @@ def read_item(
     dependencies=[Depends(require_permission(Permission.ITEMS_WRITE))],
 )
 def update_item(
-    tenant: Tenant = Depends(get_current_tenant),
+    tenant: TenantRef = Depends(get_current_tenant),
     db: Session = Depends(get_db),
     item_id: int | None = None,
     payload: dict | None = None,
@@ -44,7 +44,7 @@ def update_item(
     dependencies=[Depends(require_permission(Permission.ITEMS_WRITE))],
 )
 def delete_item(
-    tenant: Tenant = Depends(get_current_tenant),
+    tenant: TenantRef = Depends(get_current_tenant),
     db: Session = Depends(get_db),
     item_id: int | None = None,
 ):
@@ -1,9 +1,21 @@
 # app/routers/tenant_dashboard.py
 
-from fastapi import APIRouter, Depends
+from datetime import datetime
 
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
 from app.core.deps import get_current_tenant, require_permission
 from app.core.permissions import Permission
+from app.core.principal import TenantRef
+from app.schemas.audit import AuditPagePublic
+from app.services.audit_query import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursor,
+    list_tenant_audit,
+)
 
 router = APIRouter(
     prefix="/tenants",
@@ -20,3 +32,42 @@ router = APIRouter(
 )
 def tenant_dashboard():
     return {"msg": "Tenant admin dashboard"}
+
+
+@router.get(
+    "/{tenant_id}/audit",
+    response_model=AuditPagePublic,
+    dependencies=[Depends(require_permission(Permission.TENANT_ADMIN))],
+)
+def tenant_audit(
+    user_id: int | None = None,
+    permission: str | None = None,
+    allowed: bool | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    tenant: TenantRef = Depends(get_current_tenant),
+    db: Session = Depends(get_db),
+):
+    """
+    The tenant's authorization decisions, newest first. Pass the
+    returned `next_cursor` back as `cursor` for the next page.
+    """
+    try:
+        return list_tenant_audit(
+            db,
+            tenant.id,
+            user_id=user_id,
+            permission=permission,
+            allowed=allowed,
+            since=since,
+            until=until,
+            cursor=cursor,
+            limit=limit,
+        )
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
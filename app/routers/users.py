@@ -1,11 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.api.v1.users import NEXT_CURSOR_HEADER, ndjson_lines
+
 from app.core.database import get_db
-from app.core.deps import get_current_tenant, require_permission
+from app.core.deps import authorize_page, get_current_tenant, require_permission
 from app.core.permissions import Permission
-from app.models.tenant import Tenant
+from app.core.principal import TenantRef
+from app.schemas.user import UserPublic
 from app.services import user_service
+from app.services.user_service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor
 
 router = APIRouter(
     prefix="/users",
@@ -16,13 +23,36 @@ router = APIRouter(
 @router.get(
     "/",
     status_code=200,
+    response_model=list[UserPublic],
     dependencies=[Depends(require_permission(Permission.USERS_READ))],
 )
 def list_users_endpoint(
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    stream: bool = False,
     db: Session = Depends(get_db),
-    tenant: Tenant = Depends(get_current_tenant),
+    tenant: TenantRef = Depends(get_current_tenant),
+    filter_page: Callable = Depends(authorize_page(Permission.USERS_READ)),
 ):
-    return user_service.list_users(db, tenant.id)
+    try:
+        if stream:
+            batches = user_service.stream_users(db, tenant.id, cursor=cursor)
+            return StreamingResponse(
+                ndjson_lines(batches, filter_page),
+                media_type="application/x-ndjson",
+            )
+
+        page = user_service.list_users(db, tenant.id, cursor=cursor, limit=limit)
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return filter_page(page.items)
 
 
 @router.put(
@@ -34,7 +64,7 @@ def update_user_endpoint(
     user_id: int,
     email: str,
     db: Session = Depends(get_db),
-    tenant: Tenant = Depends(get_current_tenant),
+    tenant: TenantRef = Depends(get_current_tenant),
 ):
     updated = user_service.update_user_email(db, user_id, tenant.id, email)
     if not updated:
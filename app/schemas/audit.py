@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+
+class AuditEntryPublic(BaseModel):
+    id: int
+    user_id: int | None
+    permission: str
+    allowed: bool
+    reason: str | None
+    endpoint: str | None
+    method: str | None
+    context: str | None
+    created_at: datetime
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AuditPagePublic(BaseModel):
+    items: list[AuditEntryPublic]
+    next_cursor: str | None
@@ -7,6 +7,11 @@ class UserCreate(BaseModel):
     password: str
 
 
+class PasswordChange(BaseModel):
+    current_password: str
+    new_password: str
+
+
 class UserPublic(BaseModel):
     id: int
     email: EmailStr
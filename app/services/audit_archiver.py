@@ -0,0 +1,265 @@
+# app/services/audit_archiver.py
+"""
+Move closed time ranges of authorization_audit_logs into compressed
+segment files (app.core.audit_archive) and verify chains across the
+archive / live table boundary.
+
+On a partitioned table (see audit_partitions) whole months are moved:
+a detached partition is archived, then dropped. On a plain table the
+immutability triggers forbid deleting rows, so archived ranges simply
+stay in the table too; the verifier de-duplicates them.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from heapq import merge
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import column, or_, select, table, text
+from sqlalchemy.orm import Session
+
+from app.core.audit_archive import (
+    SEGMENT_SUFFIX,
+    ArchivedEntry,
+    ArchiveIntegrityError,
+    AuditArchive,
+    write_segment,
+)
+from app.core.config import settings
+from app.core.logging import logger
+from app.models.audit_chain_head import AuditChainHead
+from app.services.audit_partitions import (
+    AUDIT_LOG_TABLE,
+    add_months,
+    list_partitions,
+    partition_name,
+)
+from app.services.audit_verifier import (
+    LEGACY_CHAIN_KEY,
+    AuditRow,
+    ChainVerificationResult,
+    verify_rows,
+)
+
+
+@dataclass
+class ArchivedSegmentInfo:
+    path: str
+    rows: int
+    chains: int
+
+
+def _archive(archive_dir: str | None) -> AuditArchive:
+    return AuditArchive(archive_dir or settings.audit_archive_dir)
+
+
+def segment_path(archive_dir: str | Path, start: datetime, end: datetime) -> Path:
+    return Path(archive_dir) / (
+        f"{start:%Y%m%dT%H%M%SZ}-{end:%Y%m%dT%H%M%SZ}{SEGMENT_SUFFIX}"
+    )
+
+
+def _source(name: str):
+    return table(name, *(column(field) for field in ArchivedEntry._fields))
+
+
+def archive_range(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    *,
+    archive_dir: str | None = None,
+    source: str = AUDIT_LOG_TABLE,
+    row_group_size: int | None = None,
+) -> ArchivedSegmentInfo:
+    """
+    Write every entry with start <= created_at < end into one new
+    segment file. Only closed ranges (end in the past) are accepted.
+    Rows are streamed, never loaded at once. Does not delete anything.
+    """
+    if end > datetime.now(timezone.utc):
+        raise ValueError("only closed time ranges can be archived")
+
+    archive = _archive(archive_dir)
+    archive.directory.mkdir(parents=True, exist_ok=True)
+    path = segment_path(archive.directory, start, end)
+
+    logs = _source(source)
+    result = db.execute(
+        select(*(logs.c[field] for field in ArchivedEntry._fields))
+        .where(logs.c.created_at >= start, logs.c.created_at < end)
+        .order_by(logs.c.id)
+        .execution_options(stream_results=True, yield_per=10_000)
+    )
+    try:
+        footer = write_segment(
+            path,
+            (ArchivedEntry(*row) for row in result),
+            start=start,
+            end=end,
+            row_group_size=row_group_size or settings.audit_archive_row_group_size,
+        )
+    finally:
+        result.close()
+
+    logger.info("archived %d audit entries to %s", footer["rows"], path)
+    return ArchivedSegmentInfo(
+        path=str(path), rows=footer["rows"], chains=len(footer["anchors"])
+    )
+
+
+def archive_detached_partition(
+    db: Session,
+    name: str,
+    *,
+    archive_dir: str | None = None,
+    table_name: str = AUDIT_LOG_TABLE,
+) -> ArchivedSegmentInfo:
+    """
+    Archive a monthly partition detached by detach_partitions_before(),
+    then drop it. Attached partitions are refused.
+    """
+    if name in list_partitions(db, table_name):
+        raise ValueError(f"{name} is still attached to {table_name}")
+
+    suffix = name[len(table_name) + 1 :]
+    month = datetime.strptime(suffix, "%Y_%m").replace(tzinfo=timezone.utc)
+    if partition_name(month.date(), table_name) != name:
+        raise ValueError(f"{name} is not a monthly partition of {table_name}")
+
+    following = add_months(month.date(), 1)
+    info = archive_range(
+        db,
+        month,
+        datetime(following.year, following.month, 1, tzinfo=timezone.utc),
+        archive_dir=archive_dir,
+        source=name,
+    )
+
+    db.execute(text(f"DROP TABLE {name}"))
+    db.commit()
+    return info
+
+
+# ------------------------------------------------------------------
+# Verification across the boundary
+# ------------------------------------------------------------------
+
+
+def _live_entries(db: Session, chain_key: str | None, head_seq: int | None):
+    logs = _source(AUDIT_LOG_TABLE)
+    stmt = select(*(logs.c[field] for field in AuditRow._fields))
+
+    if chain_key is LEGACY_CHAIN_KEY:
+        stmt = stmt.where(logs.c.chain_key.is_(None))
+    else:
+        stmt = stmt.where(logs.c.chain_key == chain_key)
+        if head_seq is not None:
+            stmt = stmt.where(
+                or_(logs.c.chain_seq.is_(None), logs.c.chain_seq <= head_seq)
+            )
+
+    return db.execute(
+        stmt.order_by(logs.c.id).execution_options(
+            stream_results=True, yield_per=settings.audit_verify_range_size
+        )
+    )
+
+
+def _as_row(entry: ArchivedEntry) -> AuditRow:
+    return AuditRow(*(getattr(entry, field) for field in AuditRow._fields))
+
+
+def _merged(
+    archived: Iterator[ArchivedEntry],
+    live: Iterator[AuditRow],
+    result: ChainVerificationResult,
+) -> Iterator[AuditRow]:
+    """
+    Archived and live entries in id order. An entry present in both must
+    be identical; the copy is then walked once.
+    """
+    previous: AuditRow | None = None
+    for row in merge(
+        (_as_row(entry) for entry in archived), live, key=lambda row: row.id
+    ):
+        if previous is not None and row.id == previous.id:
+            if row != previous:
+                result.fail(row.id, "archive_mismatch")
+            continue
+
+        previous = row
+        yield row
+
+
+def verify_chain_with_archive(
+    db: Session,
+    chain_key: str | None,
+    *,
+    archive_dir: str | None = None,
+) -> ChainVerificationResult:
+    """
+    Walk one chain from its first archived entry through the live table,
+    checking links, signatures and chain_seq as verify_chain() does, plus
+    each segment's footer signature, chunk digests and chain anchor.
+    """
+    head = None
+    if chain_key is not LEGACY_CHAIN_KEY:
+        head = db.execute(
+            select(AuditChainHead.last_hash, AuditChainHead.seq).where(
+                AuditChainHead.chain_key == chain_key
+            )
+        ).first()
+
+    live = _live_entries(db, chain_key, head.seq if head else None)
+    archived = _archive(archive_dir).chain_entries(chain_key)
+    merged = ChainVerificationResult(chain_key=chain_key)
+
+    try:
+        result = verify_rows(
+            chain_key,
+            _merged(archived, (AuditRow(*row) for row in live), merged),
+        )
+    except ArchiveIntegrityError as e:
+        logger.error("audit archive unreadable: %s", e)
+        result = ChainVerificationResult(chain_key=chain_key)
+        result.fail(None, "archive_corrupt")
+        return result
+    finally:
+        live.close()
+
+    if not merged.ok:
+        # An archived entry differs from its live copy: more specific
+        # than whatever link / signature failure it caused
+        result.ok = False
+        result.first_bad_id, result.reason = merged.first_bad_id, merged.reason
+
+    if (
+        result.ok
+        and head is not None
+        and (head.last_hash != result.last_hash or head.seq != result.entries_checked)
+    ):
+        result.fail(None, "head_mismatch")
+
+    return result
+
+
+def verify_all_chains_with_archive(
+    db: Session, *, archive_dir: str | None = None
+) -> list[ChainVerificationResult]:
+    """
+    Verify every chain present in the live table or in the archive.
+    """
+    live_keys = {
+        key
+        for (key,) in db.execute(
+            select(_source(AUDIT_LOG_TABLE).c.chain_key).distinct()
+        )
+    }
+    keys = live_keys | _archive(archive_dir).chain_keys()
+
+    return [
+        verify_chain_with_archive(db, key, archive_dir=archive_dir)
+        for key in sorted(keys, key=lambda key: (key is not None, key or ""))
+    ]
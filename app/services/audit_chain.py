@@ -0,0 +1,160 @@
+# app/services/audit_chain.py
+
+import threading
+from typing import Any, Callable, NamedTuple
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.audit_chain_head import AuditChainHead, chain_key_for
+from app.models.audit_log import AuthorizationAuditLog
+
+
+class ChainHead(NamedTuple):
+    last_hash: str | None
+    seq: int
+
+
+class ChainConflictError(Exception):
+    """
+    The chain head kept moving under us (other writers / processes).
+    """
+
+
+# ------------------------------------------------------------------
+# In-memory head tracking
+# ------------------------------------------------------------------
+
+
+class ChainHeadTracker:
+    """
+    Process-local view of each chain's head.
+
+    Only a hint: every append is still validated by a compare-and-swap
+    on `audit_chain_heads`, so a stale entry costs one reload, never a
+    forked chain. Safe across multiple worker processes.
+    """
+
+    def __init__(self):
+        self._heads: dict[str, ChainHead] = {}
+        self._lock = threading.Lock()
+
+        self.reloads = 0
+        self.conflicts = 0
+
+    def get(self, chain_key: str) -> ChainHead | None:
+        with self._lock:
+            return self._heads.get(chain_key)
+
+    def set(self, chain_key: str, head: ChainHead) -> None:
+        with self._lock:
+            current = self._heads.get(chain_key)
+            # Never move backwards (late commit of an older append)
+            if current is None or head.seq >= current.seq:
+                self._heads[chain_key] = head
+
+    def invalidate(self, chain_key: str) -> None:
+        with self._lock:
+            self._heads.pop(chain_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heads.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "tracked_chains": len(self._heads),
+                "reloads": self.reloads,
+                "conflicts": self.conflicts,
+            }
+
+
+chain_heads = ChainHeadTracker()
+
+
+# ------------------------------------------------------------------
+# Head persistence
+# ------------------------------------------------------------------
+
+
+def _load_chain_head(db: Session, chain_key: str, tenant_id: int | None) -> ChainHead:
+    """
+    Read (creating on first use) the persisted head: two columns, no ORM row.
+    """
+    stmt = select(AuditChainHead.last_hash, AuditChainHead.seq).where(
+        AuditChainHead.chain_key == chain_key
+    )
+
+    row = db.execute(stmt).first()
+    if row is None:
+        try:
+            with db.begin_nested():
+                db.add(AuditChainHead(chain_key=chain_key, tenant_id=tenant_id, seq=0))
+        except IntegrityError:
+            # Another writer created it first
+            pass
+        row = db.execute(stmt).one()
+
+    chain_heads.reloads += 1
+    return ChainHead(last_hash=row.last_hash, seq=row.seq)
+
+
+def append_to_chain(
+    db: Session,
+    tenant_id: int | None,
+    payloads: list[dict[str, Any]],
+    build_entry: Callable[[dict[str, Any], str | None], AuthorizationAuditLog],
+    *,
+    max_attempts: int = 5,
+) -> tuple[str, ChainHead]:
+    """
+    Chain `payloads` onto the tenant's chain inside the caller's
+    transaction. O(1) regardless of table size:
+
+    1. take the head from memory (or load it once)
+    2. sign + link entries locally
+    3. UPDATE audit_chain_heads ... WHERE seq = :expected RETURNING seq
+       — row lock held until the caller commits
+    4. on conflict reload the head and rebuild
+
+    Returns (chain_key, new_head). The caller must `chain_heads.set()`
+    it after COMMIT, or `chain_heads.invalidate()` on rollback.
+    """
+    chain_key = chain_key_for(tenant_id)
+
+    for _ in range(max_attempts):
+        head = chain_heads.get(chain_key) or _load_chain_head(db, chain_key, tenant_id)
+
+        prev_hash = head.last_hash
+        seq = head.seq
+        entries = []
+
+        for payload in payloads:
+            seq += 1
+            entry = build_entry(payload, prev_hash)
+            entry.chain_key = chain_key
+            entry.chain_seq = seq
+            entries.append(entry)
+            prev_hash = entry.entry_hash
+
+        swapped = db.execute(
+            update(AuditChainHead)
+            .where(
+                AuditChainHead.chain_key == chain_key,
+                AuditChainHead.seq == head.seq,
+                AuditChainHead.last_hash.is_not_distinct_from(head.last_hash),
+            )
+            .values(last_hash=prev_hash, seq=seq)
+            .returning(AuditChainHead.seq)
+        ).first()
+
+        if swapped is not None:
+            db.add_all(entries)
+            return chain_key, ChainHead(last_hash=prev_hash, seq=seq)
+
+        chain_heads.conflicts += 1
+        chain_heads.invalidate(chain_key)
+
+    raise ChainConflictError(chain_key)
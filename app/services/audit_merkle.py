@@ -0,0 +1,287 @@
+# app/services/audit_merkle.py
+
+import hmac
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.audit_signing import compute_signature
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.merkle import inclusion_path, leaf_hash, merkle_root, verify_inclusion
+from app.models.audit_checkpoint import LEGACY_CHECKPOINT_KEY
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.audit_segment import AuditMerkleSegment
+from app.services.audit_verifier import AUDIT_ROW_COLUMNS, AuditRow, verify_rows
+
+
+class ProofUnavailable(Exception):
+    """
+    No inclusion proof can be served for an entry.
+    reason: entry_not_found | entry_not_sealed | segment_mismatch
+    """
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(reason)
+
+
+@dataclass
+class InclusionProof:
+    entry_id: int
+    entry_hash: str
+    chain_key: str
+    segment_index: int
+    first_id: int
+    last_id: int
+    leaf_index: int
+    tree_size: int
+    leaf: str
+    path: list[str]
+    root: str
+    last_hash: str | None
+    segment_signature: str
+
+
+def entry_leaf(entry_id: int, entry_hash: str) -> bytes:
+    """
+    Leaf commits to the row id AND its chain hash.
+    """
+    return leaf_hash(f"{entry_id}|{entry_hash}".encode())
+
+
+def _segment_signature(
+    chain_key: str,
+    segment_index: int,
+    first_id: int,
+    last_id: int,
+    entry_count: int,
+    root: str,
+    last_hash: str | None,
+) -> str:
+    return compute_signature(
+        {
+            "kind": "merkle_segment",
+            "chain_key": chain_key,
+            "segment_index": segment_index,
+            "first_id": first_id,
+            "last_id": last_id,
+            "entry_count": entry_count,
+            "root": root,
+            "last_hash": last_hash,
+        }
+    )
+
+
+def _chain_filter(segment_chain_key: str):
+    if segment_chain_key == LEGACY_CHECKPOINT_KEY:
+        return AuthorizationAuditLog.chain_key.is_(None)
+    return AuthorizationAuditLog.chain_key == segment_chain_key
+
+
+# ------------------------------------------------------------------
+# Sealing
+# ------------------------------------------------------------------
+
+
+def seal_chain_segments(
+    db: Session,
+    chain_key: str | None,
+    *,
+    segment_size: int | None = None,
+) -> int:
+    """
+    Seal every COMPLETE segment of one chain not sealed yet; the tail
+    waits until it fills up. Each segment's links and signatures are
+    re-verified first: a tampered range is never sealed (sealing stops
+    at it and the error is logged).
+
+    Returns the number of segments sealed.
+    """
+    segment_size = segment_size or settings.audit_merkle_segment_size
+    segment_key = chain_key or LEGACY_CHECKPOINT_KEY
+
+    last = db.execute(
+        select(
+            AuditMerkleSegment.segment_index,
+            AuditMerkleSegment.last_id,
+            AuditMerkleSegment.last_hash,
+        )
+        .where(AuditMerkleSegment.chain_key == segment_key)
+        .order_by(AuditMerkleSegment.segment_index.desc())
+        .limit(1)
+    ).first()
+
+    next_index = last.segment_index + 1 if last else 0
+    after_id = last.last_id if last else 0
+    prev_hash = last.last_hash if last else None
+
+    result = db.execute(
+        select(*AUDIT_ROW_COLUMNS)
+        .where(_chain_filter(segment_key), AuthorizationAuditLog.id > after_id)
+        .order_by(AuthorizationAuditLog.id)
+        .execution_options(stream_results=True, yield_per=segment_size)
+    )
+
+    sealed = []
+    try:
+        for part in result.partitions():
+            if len(part) < segment_size:
+                break
+
+            rows = [AuditRow(*row) for row in part]
+            check = verify_rows(chain_key, rows, prev_hash=prev_hash)
+            if not check.ok:
+                logger.error(
+                    "audit segment %s/%d not sealed: %s at entry %s",
+                    segment_key,
+                    next_index,
+                    check.reason,
+                    check.first_bad_id,
+                )
+                break
+
+            root = merkle_root([entry_leaf(r.id, r.entry_hash) for r in rows]).hex()
+            segment = dict(
+                chain_key=segment_key,
+                segment_index=next_index,
+                first_id=rows[0].id,
+                last_id=rows[-1].id,
+                entry_count=len(rows),
+                root=root,
+                last_hash=check.last_hash,
+            )
+            sealed.append(
+                AuditMerkleSegment(**segment, signature=_segment_signature(**segment))
+            )
+
+            prev_hash = check.last_hash
+            next_index += 1
+
+    finally:
+        result.close()
+
+    if sealed:
+        db.add_all(sealed)
+        db.commit()
+
+    return len(sealed)
+
+
+def seal_all_segments(
+    db: Session, *, segment_size: int | None = None
+) -> dict[str, int]:
+    """
+    Seal pending segments of every chain. Meant to run periodically
+    (cron / admin endpoint); returns {chain: segments sealed}.
+    """
+    chain_keys = [
+        key
+        for (key,) in db.query(AuthorizationAuditLog.chain_key)
+        .distinct()
+        .order_by(AuthorizationAuditLog.chain_key)
+    ]
+
+    sealed = {}
+    for key in chain_keys:
+        sealed[key or LEGACY_CHECKPOINT_KEY] = seal_chain_segments(
+            db, key, segment_size=segment_size
+        )
+
+    return sealed
+
+
+# ------------------------------------------------------------------
+# Inclusion proofs
+# ------------------------------------------------------------------
+
+
+def inclusion_proof(db: Session, entry_id: int) -> InclusionProof:
+    """
+    O(log segment_size) proof that `entry_id` is in its sealed segment.
+    Reads one segment's (id, entry_hash) pairs, never the whole chain.
+    """
+    entry = db.execute(
+        select(AuthorizationAuditLog.chain_key, AuthorizationAuditLog.entry_hash).where(
+            AuthorizationAuditLog.id == entry_id
+        )
+    ).first()
+    if entry is None:
+        raise ProofUnavailable("entry_not_found")
+
+    segment_key = entry.chain_key or LEGACY_CHECKPOINT_KEY
+
+    segment = db.scalar(
+        select(AuditMerkleSegment)
+        .where(
+            AuditMerkleSegment.chain_key == segment_key,
+            AuditMerkleSegment.last_id >= entry_id,
+        )
+        .order_by(AuditMerkleSegment.last_id)
+        .limit(1)
+    )
+    if segment is None or segment.first_id > entry_id:
+        raise ProofUnavailable("entry_not_sealed")
+
+    members = db.execute(
+        select(AuthorizationAuditLog.id, AuthorizationAuditLog.entry_hash)
+        .where(
+            _chain_filter(segment_key),
+            AuthorizationAuditLog.id.between(segment.first_id, segment.last_id),
+        )
+        .order_by(AuthorizationAuditLog.id)
+    ).all()
+
+    leaves = [entry_leaf(member.id, member.entry_hash) for member in members]
+    if merkle_root(leaves).hex() != segment.root:
+        # Rows changed after sealing
+        raise ProofUnavailable("segment_mismatch")
+
+    index = [member.id for member in members].index(entry_id)
+
+    return InclusionProof(
+        entry_id=entry_id,
+        entry_hash=entry.entry_hash,
+        chain_key=segment_key,
+        segment_index=segment.segment_index,
+        first_id=segment.first_id,
+        last_id=segment.last_id,
+        leaf_index=index,
+        tree_size=len(leaves),
+        leaf=leaves[index].hex(),
+        path=[node.hex() for node in inclusion_path(leaves, index)],
+        root=segment.root,
+        last_hash=segment.last_hash,
+        segment_signature=segment.signature,
+    )
+
+
+def verify_inclusion_proof(proof: InclusionProof) -> bool:
+    """
+    Offline check for auditors / incident tooling: the segment root is
+    signed with the audit key and the entry hashes up to it.
+    """
+    expected_signature = _segment_signature(
+        proof.chain_key,
+        proof.segment_index,
+        proof.first_id,
+        proof.last_id,
+        proof.tree_size,
+        proof.root,
+        proof.last_hash,
+    )
+    if not hmac.compare_digest(proof.segment_signature, expected_signature):
+        return False
+
+    leaf = entry_leaf(proof.entry_id, proof.entry_hash)
+    if leaf.hex() != proof.leaf:
+        return False
+
+    return verify_inclusion(
+        leaf=leaf,
+        index=proof.leaf_index,
+        tree_size=proof.tree_size,
+        path=[bytes.fromhex(node) for node in proof.path],
+        root=bytes.fromhex(proof.root),
+    )
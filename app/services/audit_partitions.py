@@ -0,0 +1,262 @@
+# app/services/audit_partitions.py
+"""
+Monthly range partitions of authorization_audit_logs (on created_at).
+
+The table is converted by migration 5b1e9c0d7a24; the ORM model stays a
+plain table so create_all schemas (tests, local dev) keep working and
+every function here is a no-op on them.
+
+Each partition carries its own immutability triggers and its own
+(chain_key, chain_seq) unique index: a partitioned unique index would
+have to include created_at, and triggers cloned from the parent are
+dropped on DETACH, which would leave archived partitions writable.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.services.audit_verifier import verified_through
+
+AUDIT_LOG_TABLE = "authorization_audit_logs"
+IMMUTABILITY_FUNCTION = "prevent_authorization_audit_log_modification"
+
+
+@dataclass
+class PartitionMaintenanceResult:
+    created: list[str] = field(default_factory=list)
+    detached: list[str] = field(default_factory=list)
+    # Partition name -> why it was left alone
+    skipped: dict[str, str] = field(default_factory=dict)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date, table: str = AUDIT_LOG_TABLE) -> str:
+    return f"{table}_{month:%Y_%m}"
+
+
+def default_partition_name(table: str = AUDIT_LOG_TABLE) -> str:
+    return f"{table}_default"
+
+
+def _bound(month: date) -> str:
+    # Bounds are UTC midnights regardless of the session time zone
+    return f"{month.isoformat()} 00:00:00+00"
+
+
+def is_partitioned(db: Session, table: str = AUDIT_LOG_TABLE) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+
+    return bool(
+        db.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table))"
+            ),
+            {"table": table},
+        )
+    )
+
+
+def list_partitions(db: Session, table: str = AUDIT_LOG_TABLE) -> dict[str, date]:
+    """
+    Monthly partitions currently attached: {name: first day of month}.
+    The default partition is not included.
+    """
+    names = db.scalars(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": table},
+    )
+
+    partitions = {}
+    for name in names:
+        suffix = name[len(table) + 1 :]
+        try:
+            partitions[name] = datetime.strptime(suffix, "%Y_%m").date()
+        except ValueError:
+            continue  # default partition / foreign attachments
+
+    return partitions
+
+
+def _protect(db: Session, name: str) -> None:
+    for action in ("UPDATE", "DELETE"):
+        db.execute(
+            text(
+                f"CREATE OR REPLACE TRIGGER trg_auth_audit_no_{action.lower()} "
+                f"BEFORE {action} ON {name} "
+                f"FOR EACH ROW EXECUTE FUNCTION {IMMUTABILITY_FUNCTION}()"
+            )
+        )
+
+
+def create_partition(db: Session, month: date, table: str = AUDIT_LOG_TABLE) -> str:
+    """
+    Create (idempotently) the partition holding `month`, with its
+    per-partition fork guard and immutability triggers.
+    Does not commit.
+    """
+    name = partition_name(month, table)
+    db.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(add_months(month, 1))}')"
+        )
+    )
+    db.execute(
+        text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{name}_chain_seq "
+            f"ON {name} (chain_key, chain_seq)"
+        )
+    )
+    _protect(db, name)
+    return name
+
+
+def _default_has_rows(db: Session, month: date, table: str) -> bool:
+    return bool(
+        db.scalar(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {default_partition_name(table)} "
+                "WHERE created_at >= :lower AND created_at < :upper)"
+            ),
+            {"lower": _bound(month), "upper": _bound(add_months(month, 1))},
+        )
+    )
+
+
+def ensure_partitions(
+    db: Session,
+    *,
+    months_ahead: int | None = None,
+    today: date | None = None,
+    table: str = AUDIT_LOG_TABLE,
+) -> PartitionMaintenanceResult:
+    """
+    Pre-create partitions for the current month and `months_ahead`
+    months after it, so writes never fall through to the default
+    partition.
+
+    A month whose rows already landed in the default partition (the job
+    did not run in time) can't be attached; it is skipped and logged so
+    the rows can be moved by hand.
+    """
+    result = PartitionMaintenanceResult()
+    if not is_partitioned(db, table):
+        return result
+
+    if months_ahead is None:
+        months_ahead = settings.audit_partition_months_ahead
+    current = month_start(today or datetime.now(timezone.utc).date())
+    existing = set(list_partitions(db, table))
+
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(month, table)
+        if name in existing:
+            continue
+
+        if _default_has_rows(db, month, table):
+            logger.error(
+                "audit partition %s not created: rows for it are in %s",
+                name,
+                default_partition_name(table),
+            )
+            result.skipped[name] = "rows_in_default_partition"
+            continue
+
+        create_partition(db, month, table)
+        db.commit()
+        result.created.append(name)
+
+    return result
+
+
+def _unverified_chain(db: Session, name: str) -> str | None:
+    """
+    First chain with entries in partition `name` beyond its signed
+    verification checkpoint, if any.
+    """
+    rows = db.execute(
+        text(f"SELECT chain_key, MAX(id) AS last_id FROM {name} GROUP BY chain_key")
+    )
+    for chain_key, last_id in rows:
+        if last_id > verified_through(db, chain_key):
+            return chain_key or "legacy"
+
+    return None
+
+
+def detach_partitions_before(
+    db: Session,
+    cutoff: date,
+    *,
+    require_verified: bool = True,
+    table: str = AUDIT_LOG_TABLE,
+) -> PartitionMaintenanceResult:
+    """
+    Detach every monthly partition that ends on or before `cutoff`.
+    Detached tables keep their data and triggers; archive or drop them
+    out of band instead of deleting rows one by one.
+
+    With `require_verified`, a partition is only detached once every
+    chain in it is covered by a clean verification checkpoint: a later
+    `--full` re-verification can no longer see those rows.
+    """
+    result = PartitionMaintenanceResult()
+    if not is_partitioned(db, table):
+        return result
+
+    for name, month in sorted(list_partitions(db, table).items(), key=lambda p: p[1]):
+        if add_months(month, 1) > cutoff:
+            continue
+
+        if require_verified:
+            chain_key = _unverified_chain(db, name)
+            if chain_key is not None:
+                result.skipped[name] = f"unverified:{chain_key}"
+                continue
+
+        db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        db.commit()
+        result.detached.append(name)
+
+    return result
+
+
+def maintain_partitions(
+    db: Session, *, today: date | None = None
+) -> PartitionMaintenanceResult:
+    """
+    Periodic job: roll the pre-created window forward and detach
+    partitions past the configured retention (if any).
+    """
+    today = today or datetime.now(timezone.utc).date()
+    result = ensure_partitions(db, today=today)
+
+    if settings.audit_partition_retention_months > 0:
+        cutoff = add_months(
+            month_start(today), -settings.audit_partition_retention_months
+        )
+        detached = detach_partitions_before(db, cutoff)
+        result.detached = detached.detached
+        result.skipped.update(detached.skipped)
+
+    return result
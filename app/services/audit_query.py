@@ -0,0 +1,112 @@
+# app/services/audit_query.py
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.models.audit_log import AuthorizationAuditLog
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Only what a tenant admin needs; hashes / signatures stay internal
+AUDIT_PUBLIC_COLUMNS = (
+    AuthorizationAuditLog.id,
+    AuthorizationAuditLog.user_id,
+    AuthorizationAuditLog.permission,
+    AuthorizationAuditLog.allowed,
+    AuthorizationAuditLog.reason,
+    AuthorizationAuditLog.endpoint,
+    AuthorizationAuditLog.method,
+    AuthorizationAuditLog.context,
+    AuthorizationAuditLog.created_at,
+)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclass
+class AuditPage:
+    items: list[Row]
+    next_cursor: str | None
+
+
+def encode_cursor(created_at: datetime, entry_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{entry_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, entry_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(entry_id)
+    except ValueError as e:  # also covers binascii / unicode errors
+        raise InvalidCursor("invalid cursor") from e
+
+
+def list_tenant_audit(
+    db: Session,
+    tenant_id: int,
+    *,
+    user_id: int | None = None,
+    permission: str | None = None,
+    allowed: bool | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> AuditPage:
+    """
+    One page of a tenant's authorization history, newest first.
+
+    Keyset pagination on (created_at, id): each page is a range scan of
+    ix_auth_audit_tenant_time (ix_auth_audit_user_tenant_time when
+    filtering by user) starting at the cursor, so page N costs the same
+    as page 1. `since` is inclusive, `until` exclusive.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    log = AuthorizationAuditLog
+
+    conditions = [log.tenant_id == tenant_id]
+    if user_id is not None:
+        conditions.append(log.user_id == user_id)
+    if permission is not None:
+        conditions.append(log.permission == permission)
+    if allowed is not None:
+        conditions.append(log.allowed.is_(allowed))
+    if since is not None:
+        conditions.append(log.created_at >= since)
+    if until is not None:
+        conditions.append(log.created_at < until)
+
+    if cursor is not None:
+        created_at, entry_id = decode_cursor(cursor)
+        # Bare `created_at <=` keeps an index range bound; the OR only
+        # filters ties at the boundary timestamp.
+        conditions.append(
+            and_(
+                log.created_at <= created_at,
+                or_(log.created_at < created_at, log.id < entry_id),
+            )
+        )
+
+    rows = db.execute(
+        select(*AUDIT_PUBLIC_COLUMNS)
+        .where(*conditions)
+        .order_by(log.created_at.desc(), log.id.desc())
+        .limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return AuditPage(items=rows, next_cursor=next_cursor)
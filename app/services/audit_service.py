@@ -1,22 +1,184 @@
 # app/services/audit_service.py
 
+import asyncio
+import threading
+import time
+from typing import Any, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.authorization import AuthorizationDecision
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logging import logger
+from app.core.metrics import register_metrics_source
 from app.models.audit_log import AuthorizationAuditLog
+from app.models.audit_chain_head import chain_key_for
 from app.core.audit_signing import (
     compute_signature,
     compute_entry_hash,
 )
+from app.services.audit_chain import (
+    ChainConflictError,
+    append_to_chain,
+    chain_heads,
+)
+from app.services.audit_writer import AuditWriter
+
+
+def _build_payload(
+    *,
+    user_id: int | None,
+    tenant_id: int | None,
+    permission: str,
+    allowed: bool,
+    reason: str,
+    endpoint: str | None,
+    method: str | None,
+    context: dict | None,
+) -> dict[str, Any]:
+    return {
+        "user_id": user_id,
+        "tenant_id": tenant_id,
+        "permission": permission,
+        "allowed": allowed,
+        "reason": reason if not allowed else "permission granted",
+        "endpoint": endpoint,
+        "method": method,
+        "context": context or {},
+    }
 
 
-def _get_previous_entry_hash(db: Session) -> str | None:
-    last = (
-        db.query(AuthorizationAuditLog)
-        .order_by(AuthorizationAuditLog.id.desc())
-        .first()
+def _build_log_entry(
+    payload: dict[str, Any],
+    prev_hash: str | None,
+) -> AuthorizationAuditLog:
+    """
+    Sign + chain one payload onto `prev_hash`.
+    Cryptographic failure degrades the entry, it never raises.
+    """
+    integrity_ok = True
+    signature = "DEGRADED"
+    entry_hash = "DEGRADED"
+
+    try:
+        signature = compute_signature(payload)
+        entry_hash = compute_entry_hash(
+            prev_hash=prev_hash,
+            signature=signature,
+        )
+
+    except Exception:
+        # Cryptographic failure must NOT block authorization
+        integrity_ok = False
+
+    return AuthorizationAuditLog(
+        user_id=payload["user_id"],
+        tenant_id=payload["tenant_id"],
+        permission=payload["permission"],
+        allowed=payload["allowed"],
+        reason=payload["reason"],
+        endpoint=payload["endpoint"],
+        method=payload["method"],
+        context=str(payload["context"]),
+        signature=signature,
+        prev_hash=prev_hash,
+        entry_hash=entry_hash,
+        integrity_ok=integrity_ok,
     )
-    return last.entry_hash if last else None
+
+
+# ------------------------------------------------------------------
+# Batched writer (group commit)
+# ------------------------------------------------------------------
+
+
+def _append_batch(db: Session, payloads: list[dict[str, Any]]) -> None:
+    """
+    Chain, sign and insert `payloads` in ONE transaction on `db`.
+
+    Payloads are grouped per chain (input order kept inside each
+    chain); heads are locked in sorted order so concurrent writers
+    can't deadlock. Raises after rolling back.
+    """
+    by_tenant: dict[int | None, list[dict[str, Any]]] = {}
+    for payload in payloads:
+        by_tenant.setdefault(payload["tenant_id"], []).append(payload)
+
+    new_heads = []
+    try:
+        for tenant_id in sorted(by_tenant, key=chain_key_for):
+            new_heads.append(
+                append_to_chain(db, tenant_id, by_tenant[tenant_id], _build_log_entry)
+            )
+
+        db.commit()
+
+    except (SQLAlchemyError, ChainConflictError):
+        db.rollback()
+        for tenant_id in by_tenant:
+            chain_heads.invalidate(chain_key_for(tenant_id))
+        raise
+
+    for chain_key, head in new_heads:
+        chain_heads.set(chain_key, head)
+
+
+def persist_authorization_batch(payloads: list[dict[str, Any]]) -> None:
+    """
+    Group-commit sink of the audit writer.
+
+    Runs on the single audit-writer thread, on its own session, so
+    request sessions are never touched.
+    """
+    db = SessionLocal()
+    try:
+        _append_batch(db, payloads)
+    finally:
+        db.close()
+
+
+audit_writer = AuditWriter(
+    sink=persist_authorization_batch,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_ms / 1000,
+    queue_size=settings.audit_queue_size,
+    enqueue_timeout=settings.audit_enqueue_timeout_ms / 1000,
+)
+
+# Inline (request-path) writes: the fallback when the writer is off
+# or its queue stays full
+INLINE_ATTEMPTS = 3
+
+inline_writes = {
+    "batches_written": 0,
+    "retries": 0,
+    "requeued_entries": 0,
+    "dropped_entries": 0,
+}
+_inline_lock = threading.Lock()  # request threads write concurrently
+
+
+def _count_inline(name: str) -> None:
+    with _inline_lock:
+        inline_writes[name] += 1
+
+
+def _inline_stats() -> dict[str, int]:
+    with _inline_lock:
+        return dict(inline_writes)
+
+
+register_metrics_source("audit_writer", audit_writer.stats)
+register_metrics_source("audit_inline", _inline_stats)
+register_metrics_source("audit_chain_heads", chain_heads.stats)
+
+
+# ------------------------------------------------------------------
+# Public API
+# ------------------------------------------------------------------
 
 
 def log_authorization_decision(
@@ -40,54 +202,215 @@ def log_authorization_decision(
     - Append-only
     - HMAC-signed
     - Hash-chained
+
+    When the audit writer is running the decision is queued and
+    committed with its batch; if the queue stays full it is written
+    inline instead (backpressure). A failing inline write is retried,
+    then handed back to the writer; only if that fails too is the
+    decision dropped, logged with its payload and counted in the
+    audit_inline metrics. Either way `db` is only used for its bind
+    and never committed.
     """
 
-    integrity_ok = True
-    signature = "DEGRADED"
-    entry_hash = "DEGRADED"
-    prev_hash = None
+    payload = _build_payload(
+        user_id=user_id,
+        tenant_id=tenant_id,
+        permission=permission,
+        allowed=allowed,
+        reason=reason,
+        endpoint=endpoint,
+        method=method,
+        context=context,
+    )
 
-    payload = {
-        "user_id": user_id,
-        "tenant_id": tenant_id,
-        "permission": permission,
-        "allowed": allowed,
-        "reason": reason if not allowed else "permission granted",
-        "endpoint": endpoint,
-        "method": method,
-        "context": context or {},
-    }
+    _submit_or_write(db, [payload])
 
-    try:
-        prev_hash = _get_previous_entry_hash(db)
-        signature = compute_signature(payload)
-        entry_hash = compute_entry_hash(
-            prev_hash=prev_hash,
-            signature=signature,
-        )
 
-    except Exception:
-        # Cryptographic failure must NOT block authorization
-        integrity_ok = False
+async def log_authorization_decision_async(
+    *,
+    db: AsyncSession,
+    user_id: int | None,
+    tenant_id: int | None,
+    permission: str,
+    allowed: bool,
+    reason: str,
+    endpoint: str | None = None,
+    method: str | None = None,
+    context: dict | None = None,
+) -> None:
+    """
+    Event-loop flavour of log_authorization_decision (same guarantees).
 
-    try:
-        log = AuthorizationAuditLog(
-            user_id=user_id,
-            tenant_id=tenant_id,
-            permission=permission,
-            allowed=allowed,
-            reason=payload["reason"],
+    The decision is queued only if the writer has room right now; the
+    blocking paths (waiting on a full queue, the inline chain append)
+    run in a worker thread on their own sync session. `db` is not used.
+    """
+
+    payload = _build_payload(
+        user_id=user_id,
+        tenant_id=tenant_id,
+        permission=permission,
+        allowed=allowed,
+        reason=reason,
+        endpoint=endpoint,
+        method=method,
+        context=context,
+    )
+
+    await _submit_or_write_async([payload])
+
+
+def _decision_payloads(
+    decisions: Iterable[AuthorizationDecision],
+    endpoint: str | None,
+    method: str | None,
+    context: dict | None,
+) -> list[dict[str, Any]]:
+    return [
+        _build_payload(
+            user_id=decision.user_id,
+            tenant_id=decision.tenant_id,
+            permission=decision.permission,
+            allowed=decision.allowed,
+            reason=decision.reason or "unknown",
             endpoint=endpoint,
             method=method,
-            context=str(payload["context"]),
-            signature=signature,
-            prev_hash=prev_hash,
-            entry_hash=entry_hash,
-            integrity_ok=integrity_ok,
+            context={
+                **(context or {}),
+                "resource_owner_id": decision.resource_owner_id,
+            },
         )
+        for decision in decisions
+    ]
 
-        db.add(log)
-        db.commit()
 
-    except SQLAlchemyError:
-        db.rollback()
+def log_authorization_decisions(
+    *,
+    db: Session | None,
+    decisions: Iterable[AuthorizationDecision],
+    endpoint: str | None = None,
+    method: str | None = None,
+    context: dict | None = None,
+) -> None:
+    """
+    Audit a vector of decisions (resolve_permissions_bulk) as one batch:
+    one chain append and one commit for the whole page.
+    Same guarantees as log_authorization_decision; with db=None the
+    inline fallback opens its own session.
+    """
+    _submit_or_write(db, _decision_payloads(decisions, endpoint, method, context))
+
+
+def log_authorization_page(
+    *,
+    db: Session | None,
+    decisions: Iterable[AuthorizationDecision],
+    endpoint: str | None = None,
+    method: str | None = None,
+    context: dict | None = None,
+) -> None:
+    """
+    Audit a filtered page (one principal, one permission) as ONE
+    decision: allowed if any row was, with the row counts in its
+    context. The per-row decisions are not written, so the audit
+    volume does not grow with the page size. An empty page is not
+    audited. Same guarantees as log_authorization_decision.
+    """
+    decisions = list(decisions)
+    if not decisions:
+        return
+
+    allowed = [decision for decision in decisions if decision.allowed]
+    first = allowed[0] if allowed else decisions[0]
+
+    payload = _build_payload(
+        user_id=first.user_id,
+        tenant_id=first.tenant_id,
+        permission=first.permission,
+        allowed=bool(allowed),
+        reason=first.reason or "unknown",
+        endpoint=endpoint,
+        method=method,
+        context={
+            **(context or {}),
+            "rows": len(decisions),
+            "allowed_rows": len(allowed),
+        },
+    )
+
+    _submit_or_write(db, [payload])
+
+
+async def log_authorization_decisions_async(
+    *,
+    db: AsyncSession,
+    decisions: Iterable[AuthorizationDecision],
+    endpoint: str | None = None,
+    method: str | None = None,
+    context: dict | None = None,
+) -> None:
+    payloads = _decision_payloads(decisions, endpoint, method, context)
+    await _submit_or_write_async(payloads)
+
+
+async def _submit_or_write_async(payloads: list[dict[str, Any]]) -> None:
+    # Never block the loop: queue what fits now, the rest off-loop
+    if audit_writer.running:
+        payloads = [p for p in payloads if not audit_writer.submit_nowait(p)]
+
+    if payloads:
+        await asyncio.to_thread(_submit_or_write, None, payloads)
+
+
+def _submit_or_write(db: Session | None, payloads: list[dict[str, Any]]) -> None:
+    if audit_writer.running:
+        payloads = [p for p in payloads if not audit_writer.submit(p)]
+
+    if not payloads:
+        return
+
+    # Inline writes get their own session on the request's bind:
+    # committing `db` itself would expire the user/tenant it loaded,
+    # and the handler would silently re-SELECT them
+    if db is None:
+        audit_db = SessionLocal()
+    else:
+        audit_db = Session(bind=db.get_bind(), autoflush=False)
+    try:
+        _write_inline(audit_db, payloads)
+    finally:
+        audit_db.close()
+
+
+def _write_inline(db: Session, payloads: list[dict[str, Any]]) -> None:
+    """
+    Never raises. A failed append has already rolled back and dropped
+    the cached chain heads, so a retry reloads them.
+    """
+    for attempt in range(INLINE_ATTEMPTS):
+        try:
+            _append_batch(db, payloads)
+        except (SQLAlchemyError, ChainConflictError):
+            if attempt + 1 < INLINE_ATTEMPTS:
+                _count_inline("retries")
+                time.sleep(0.01 * 2**attempt)
+                continue
+            logger.exception("audit: inline write of %d entries failed", len(payloads))
+            break
+
+        _count_inline("batches_written")
+        return
+
+    # Last resort: the writer may have room again
+    if audit_writer.running:
+        remaining = []
+        for payload in payloads:
+            if audit_writer.submit(payload):
+                _count_inline("requeued_entries")
+            else:
+                remaining.append(payload)
+        payloads = remaining
+
+    for payload in payloads:
+        _count_inline("dropped_entries")
+        logger.error("audit: dropped authorization decision %r", payload)
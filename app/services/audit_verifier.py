@@ -0,0 +1,585 @@
+# app/services/audit_verifier.py
+
+import ast
+import hmac
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.core.audit_archive import ArchiveIntegrityError, AuditArchive
+from app.core.audit_signing import compute_signature, verify_entry
+from app.core.config import settings
+from app.core.logging import logger
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.audit_chain_head import AuditChainHead
+from app.models.audit_checkpoint import (
+    LEGACY_CHECKPOINT_KEY,
+    AuditVerificationCheckpoint,
+)
+
+
+LEGACY_CHAIN_KEY = None  # rows written before per-tenant chains
+
+
+@dataclass
+class ChainVerificationResult:
+    chain_key: str | None
+    entries_checked: int = 0
+    degraded_entries: int = 0
+    ok: bool = True
+    first_bad_id: int | None = None
+    reason: str | None = None
+    last_hash: str | None = None
+    last_seq: int | None = None
+    # Entries trusted from a signed checkpoint (not re-verified)
+    resumed_entries: int = 0
+
+    def fail(self, entry_id: int | None, reason: str) -> None:
+        if self.ok:
+            self.ok = False
+            self.first_bad_id = entry_id
+            self.reason = reason
+
+
+def payload_from_row(row: AuthorizationAuditLog) -> dict[str, Any]:
+    """
+    Rebuild the signed payload from a stored row.
+    `context` is stored as the repr() of a dict of primitives.
+    """
+    try:
+        context = ast.literal_eval(row.context) if row.context else {}
+    except (ValueError, SyntaxError):
+        context = row.context
+
+    return {
+        "user_id": row.user_id,
+        "tenant_id": row.tenant_id,
+        "permission": row.permission,
+        "allowed": row.allowed,
+        "reason": row.reason,
+        "endpoint": row.endpoint,
+        "method": row.method,
+        "context": context,
+    }
+
+
+def verify_rows(
+    chain_key: str | None,
+    rows: Iterable[AuthorizationAuditLog],
+    *,
+    prev_hash: str | None = None,
+) -> ChainVerificationResult:
+    """
+    Verify one chain's rows (in append order): HMAC signature,
+    entry hash, the prev_hash link and chain_seq continuity.
+    """
+    result = ChainVerificationResult(chain_key=chain_key)
+    prev_seq: int | None = None
+
+    for row in rows:
+        result.entries_checked += 1
+
+        if row.prev_hash != prev_hash:
+            result.fail(row.id, "broken_link")
+
+        if row.chain_seq is not None:
+            if prev_seq is not None and row.chain_seq != prev_seq + 1:
+                result.fail(row.id, "sequence_gap")
+            prev_seq = row.chain_seq
+
+        if not row.integrity_ok:
+            # Written without a signature; only the link can be checked
+            result.degraded_entries += 1
+
+        elif not verify_entry(
+            payload=payload_from_row(row),
+            signature=row.signature,
+            prev_hash=row.prev_hash,
+            entry_hash=row.entry_hash,
+        ):
+            result.fail(row.id, "bad_signature")
+
+        prev_hash = row.entry_hash
+
+    result.last_hash = prev_hash
+    result.last_seq = prev_seq
+    return result
+
+
+def verify_chain(db: Session, chain_key: str | None) -> ChainVerificationResult:
+    """
+    Walk one chain in append order. `chain_key=None` walks the legacy
+    global chain; any other key is also checked against its head row.
+    """
+    query = db.query(AuthorizationAuditLog)
+    if chain_key is LEGACY_CHAIN_KEY:
+        query = query.filter(AuthorizationAuditLog.chain_key.is_(None))
+    else:
+        query = query.filter(AuthorizationAuditLog.chain_key == chain_key)
+
+    # Rows predating chain_seq (NULL) come first, in id order
+    query = query.order_by(
+        AuthorizationAuditLog.chain_seq.asc().nulls_first(),
+        AuthorizationAuditLog.id,
+    )
+
+    result = verify_rows(chain_key, query.yield_per(1000))
+
+    if chain_key is not LEGACY_CHAIN_KEY:
+        head = db.get(AuditChainHead, chain_key)
+        if head is not None and (
+            head.last_hash != result.last_hash or head.seq != result.entries_checked
+        ):
+            result.fail(None, "head_mismatch")
+
+    return result
+
+
+def verify_all_chains(db: Session) -> list[ChainVerificationResult]:
+    """
+    Verify the legacy chain plus every per-tenant / global chain.
+    """
+    chain_keys = [
+        key
+        for (key,) in db.query(AuthorizationAuditLog.chain_key)
+        .distinct()
+        .order_by(AuthorizationAuditLog.chain_key)
+    ]
+
+    return [verify_chain(db, key) for key in chain_keys]
+
+
+# ------------------------------------------------------------------
+# Streaming, parallel verification with checkpoints
+# ------------------------------------------------------------------
+# Rows are streamed through a server-side cursor in fixed-size ranges.
+# Each range is verified on its own (signatures + links inside the
+# range) in a process pool; the parent only stitches ranges together
+# by checking prev_hash / chain_seq at each boundary. At most
+# 2 x workers ranges are in flight, so memory stays bounded.
+#
+# Inside one chain id order == append order: appends serialize on the
+# chain head row lock, and rows predating chain_seq have lower ids.
+
+
+class AuditRow(NamedTuple):
+    id: int
+    chain_seq: int | None
+    user_id: int | None
+    tenant_id: int | None
+    permission: str
+    allowed: bool
+    reason: str | None
+    endpoint: str | None
+    method: str | None
+    context: str | None
+    signature: str
+    prev_hash: str | None
+    entry_hash: str
+    integrity_ok: bool
+
+
+AUDIT_ROW_COLUMNS = tuple(
+    getattr(AuthorizationAuditLog, name) for name in AuditRow._fields
+)
+
+
+@dataclass
+class RangeResult:
+    result: ChainVerificationResult
+    first_id: int
+    last_id: int
+    first_prev_hash: str | None
+    first_seq: int | None
+
+
+def verify_range(chain_key: str | None, rows: list[tuple]) -> RangeResult:
+    """
+    Process-pool worker: verify one contiguous range of a chain.
+    """
+    audit_rows = [AuditRow(*row) for row in rows]
+    first = audit_rows[0]
+
+    return RangeResult(
+        result=verify_rows(chain_key, audit_rows, prev_hash=first.prev_hash),
+        first_id=first.id,
+        last_id=audit_rows[-1].id,
+        first_prev_hash=first.prev_hash,
+        first_seq=first.chain_seq,
+    )
+
+
+def _bounded_map(
+    executor: Executor | None,
+    fn: Callable[[list[tuple]], RangeResult],
+    ranges: Iterable[list[tuple]],
+    max_in_flight: int,
+) -> Iterator[RangeResult]:
+    """
+    Ordered map over `ranges` with at most `max_in_flight` pending.
+    Runs inline without an executor.
+    """
+    if executor is None:
+        yield from map(fn, ranges)
+        return
+
+    pending: deque = deque()
+    for chunk in ranges:
+        pending.append(executor.submit(fn, chunk))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _checkpoint_signature(
+    chain_key: str,
+    last_id: int,
+    last_seq: int | None,
+    last_hash: str | None,
+    entries_verified: int,
+) -> str:
+    return compute_signature(
+        {
+            "kind": "verification_checkpoint",
+            "chain_key": chain_key,
+            "last_id": last_id,
+            "last_seq": last_seq,
+            "last_hash": last_hash,
+            "entries_verified": entries_verified,
+        }
+    )
+
+
+def _load_checkpoint(
+    db: Session, checkpoint_key: str
+) -> AuditVerificationCheckpoint | None:
+    checkpoint = db.get(AuditVerificationCheckpoint, checkpoint_key)
+    if checkpoint is None:
+        return None
+
+    expected = _checkpoint_signature(
+        checkpoint_key,
+        checkpoint.last_id,
+        checkpoint.last_seq,
+        checkpoint.last_hash,
+        checkpoint.entries_verified,
+    )
+    if not hmac.compare_digest(checkpoint.signature, expected):
+        # Forged / corrupted: never trust it, re-verify from the start
+        return None
+
+    return checkpoint
+
+
+def _save_checkpoint(
+    db: Session,
+    checkpoint_key: str,
+    last_id: int,
+    last_seq: int | None,
+    last_hash: str | None,
+    entries_verified: int,
+) -> None:
+    db.merge(
+        AuditVerificationCheckpoint(
+            chain_key=checkpoint_key,
+            last_id=last_id,
+            last_seq=last_seq,
+            last_hash=last_hash,
+            entries_verified=entries_verified,
+            signature=_checkpoint_signature(
+                checkpoint_key, last_id, last_seq, last_hash, entries_verified
+            ),
+        )
+    )
+    db.commit()
+
+
+# ------------------------------------------------------------------
+# Archived prefixes
+# ------------------------------------------------------------------
+# Once a range is archived and its partition dropped, the first live
+# row of a chain links into the archive. Each segment footer is
+# HMAC-signed and carries one anchor per chain (count, last id / seq /
+# hash), so the archived prefix is trusted like a checkpoint; its
+# entries are re-walked by scripts/archive_audit_logs.py --verify.
+
+
+@dataclass
+class ArchivedPrefix:
+    last_id: int
+    last_seq: int | None
+    last_hash: str | None
+    count: int
+    # First anchor that does not link to the previous segment
+    broken_at: int | None = None
+
+
+def archived_prefixes(
+    archive_dir: str | None = None,
+) -> dict[str | None, ArchivedPrefix]:
+    """
+    Per chain: everything its archive segments cover, from the segment
+    footers only (no column is decompressed). Raises
+    ArchiveIntegrityError for an unreadable or forged segment.
+    """
+    anchors: dict[str | None, list] = {}
+    for segment in AuditArchive(archive_dir or settings.audit_archive_dir).segments():
+        for chain_key, anchor in segment.anchors.items():
+            anchors.setdefault(chain_key, []).append(anchor)
+
+    prefixes = {}
+    for chain_key, chain_anchors in anchors.items():
+        chain_anchors.sort(key=lambda anchor: anchor.first_id)
+        prefix = None
+        for anchor in chain_anchors:
+            if prefix is None:
+                prefix = ArchivedPrefix(
+                    anchor.last_id, anchor.last_seq, anchor.last_hash, anchor.count
+                )
+                continue
+
+            if prefix.broken_at is None and anchor.prev_hash != prefix.last_hash:
+                prefix.broken_at = anchor.first_id
+            prefix.last_id = anchor.last_id
+            prefix.last_seq = anchor.last_seq
+            prefix.last_hash = anchor.last_hash
+            prefix.count += anchor.count
+
+        prefixes[chain_key] = prefix
+
+    return prefixes
+
+
+def verified_through(db: Session, chain_key: str | None) -> int:
+    """
+    Highest entry id of `chain_key` covered by a valid signed checkpoint
+    (0 if the chain was never verified clean).
+    """
+    checkpoint = _load_checkpoint(db, chain_key or LEGACY_CHECKPOINT_KEY)
+    return checkpoint.last_id if checkpoint else 0
+
+
+def verify_chain_streaming(
+    db: Session,
+    chain_key: str | None,
+    *,
+    executor: Executor | None = None,
+    range_size: int | None = None,
+    max_in_flight: int = 2,
+    resume: bool = True,
+    archive_dir: str | None = None,
+    archived: dict[str | None, ArchivedPrefix] | None = None,
+) -> ChainVerificationResult:
+    """
+    Verify one chain in ranges, resuming from its signed checkpoint.
+
+    The head is read first and only entries up to its seq are walked,
+    so appends racing with the run are left for the next run instead
+    of being reported as a head mismatch. On success the checkpoint
+    advances to the last verified entry; on failure it is left alone.
+
+    The chain's archived prefix (`archived`, else read from
+    `archive_dir`) seeds the walk when it reaches further than the
+    checkpoint, also with resume=False: archived rows may no longer
+    be in the table.
+    """
+    range_size = range_size or settings.audit_verify_range_size
+    checkpoint_key = chain_key or LEGACY_CHECKPOINT_KEY
+
+    total = ChainVerificationResult(chain_key=chain_key)
+    after_id = 0
+    prev_hash: str | None = None
+    prev_seq: int | None = None
+
+    if archived is None:
+        try:
+            archived = archived_prefixes(archive_dir)
+        except ArchiveIntegrityError as e:
+            logger.error("audit archive unreadable: %s", e)
+            total.fail(None, "archive_corrupt")
+            return total
+
+    prefix = archived.get(chain_key)
+    if prefix is not None and prefix.broken_at is not None:
+        total.fail(prefix.broken_at, "broken_link")
+        return total
+
+    checkpoint = _load_checkpoint(db, checkpoint_key) if resume else None
+    if checkpoint is not None and (
+        prefix is None or checkpoint.last_id >= prefix.last_id
+    ):
+        after_id = checkpoint.last_id
+        prev_hash = checkpoint.last_hash
+        prev_seq = checkpoint.last_seq
+        total.entries_checked = total.resumed_entries = checkpoint.entries_verified
+    elif prefix is not None:
+        after_id = prefix.last_id
+        prev_hash = prefix.last_hash
+        prev_seq = prefix.last_seq
+        total.entries_checked = total.resumed_entries = prefix.count
+
+    stmt = select(*AUDIT_ROW_COLUMNS).where(AuthorizationAuditLog.id > after_id)
+
+    head = None
+    if chain_key is LEGACY_CHAIN_KEY:
+        stmt = stmt.where(AuthorizationAuditLog.chain_key.is_(None))
+    else:
+        head = db.execute(
+            select(AuditChainHead.last_hash, AuditChainHead.seq).where(
+                AuditChainHead.chain_key == chain_key
+            )
+        ).first()
+        stmt = stmt.where(AuthorizationAuditLog.chain_key == chain_key)
+        if head is not None:
+            stmt = stmt.where(
+                or_(
+                    AuthorizationAuditLog.chain_seq.is_(None),
+                    AuthorizationAuditLog.chain_seq <= head.seq,
+                )
+            )
+
+    result = db.execute(
+        stmt.order_by(AuthorizationAuditLog.id).execution_options(
+            stream_results=True, yield_per=range_size
+        )
+    )
+
+    last_good_id = after_id
+    try:
+        ranges = ([tuple(row) for row in part] for part in result.partitions())
+
+        for chunk in _bounded_map(
+            executor, partial(verify_range, chain_key), ranges, max_in_flight
+        ):
+            checked = chunk.result
+
+            if chunk.first_prev_hash != prev_hash:
+                total.fail(chunk.first_id, "broken_link")
+            elif (
+                chunk.first_seq is not None
+                and prev_seq is not None
+                and chunk.first_seq != prev_seq + 1
+            ):
+                total.fail(chunk.first_id, "sequence_gap")
+            elif not checked.ok:
+                total.fail(checked.first_bad_id, checked.reason)
+
+            if not total.ok:
+                break
+
+            total.entries_checked += checked.entries_checked
+            total.degraded_entries += checked.degraded_entries
+            prev_hash = checked.last_hash
+            if checked.last_seq is not None:
+                prev_seq = checked.last_seq
+            last_good_id = chunk.last_id
+
+    finally:
+        result.close()
+
+    total.last_hash = prev_hash
+    total.last_seq = prev_seq
+
+    if (
+        total.ok
+        and head is not None
+        and (head.last_hash != prev_hash or head.seq != total.entries_checked)
+    ):
+        total.fail(None, "head_mismatch")
+
+    if total.ok and last_good_id > after_id:
+        _save_checkpoint(
+            db,
+            checkpoint_key,
+            last_good_id,
+            prev_seq,
+            prev_hash,
+            total.entries_checked,
+        )
+
+    return total
+
+
+def _chain_keys(
+    db: Session, archived: dict[str | None, ArchivedPrefix]
+) -> list[str | None]:
+    """
+    Every chain to verify, without scanning the log table: the keyed
+    chains of audit_chain_heads, every chain with an archived prefix
+    (its rows may be gone from the table) and the legacy chain while
+    an unkeyed row is left. Keyed chains first, legacy last.
+    """
+    keys = set(db.scalars(select(AuditChainHead.chain_key)))
+    keys.update(archived)
+    if LEGACY_CHAIN_KEY not in keys and db.scalar(
+        select(AuthorizationAuditLog.id)
+        .where(AuthorizationAuditLog.chain_key.is_(None))
+        .limit(1)
+    ):
+        keys.add(LEGACY_CHAIN_KEY)
+
+    named = sorted(key for key in keys if key is not LEGACY_CHAIN_KEY)
+    return named + [LEGACY_CHAIN_KEY] if LEGACY_CHAIN_KEY in keys else named
+
+
+def verify_all_chains_streaming(
+    db: Session,
+    *,
+    workers: int | None = None,
+    range_size: int | None = None,
+    resume: bool = True,
+    archive_dir: str | None = None,
+) -> list[ChainVerificationResult]:
+    """
+    Verify every chain with one shared process pool.
+
+    `workers` defaults to AUDIT_VERIFY_WORKERS (0 = one per CPU); with
+    a single worker everything runs in-process. Archive segment
+    footers are read once for all chains.
+    """
+    workers = workers or settings.audit_verify_workers or os.cpu_count() or 1
+
+    try:
+        archived = archived_prefixes(archive_dir)
+    except ArchiveIntegrityError as e:
+        logger.error("audit archive unreadable: %s", e)
+        failed = []
+        for key in _chain_keys(db, {}):
+            result = ChainVerificationResult(chain_key=key)
+            result.fail(None, "archive_corrupt")
+            failed.append(result)
+        return failed
+
+    chain_keys = _chain_keys(db, archived)
+
+    def run(executor: Executor | None) -> list[ChainVerificationResult]:
+        return [
+            verify_chain_streaming(
+                db,
+                key,
+                executor=executor,
+                range_size=range_size,
+                max_in_flight=2 * workers,
+                resume=resume,
+                archived=archived,
+            )
+            for key in chain_keys
+        ]
+
+    if workers <= 1:
+        return run(None)
+
+    # spawn: never fork a process that runs server / writer threads
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return run(executor)
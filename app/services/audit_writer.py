@@ -0,0 +1,257 @@
+# app/services/audit_writer.py
+
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+from app.core.logging import logger
+
+
+class AuditWriter:
+    """
+    Bounded, batching (group-commit) writer.
+
+    - Producers `submit()` items onto a bounded in-memory queue
+    - ONE background thread drains it in batches of up to `batch_size`,
+      waiting at most `flush_interval` for a batch to fill
+    - Each batch is handed to `sink` (one transaction per batch)
+
+    Single consumer by design: the sink can keep ordered state (e.g. a
+    hash-chain head) without extra locking. Once `stop()` begins, new
+    items are rejected so callers write them themselves.
+    """
+
+    def __init__(
+        self,
+        *,
+        sink: Callable[[list[Any]], None],
+        batch_size: int,
+        flush_interval: float,
+        queue_size: int,
+        enqueue_timeout: float,
+        max_retries: int = 3,
+        name: str = "audit-writer",
+    ):
+        self.sink = sink
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.max_retries = max_retries
+        self.name = name
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Producers between the stopping check and their put: stop()
+        # drains only after they are done
+        self._producers = threading.Condition()
+        self._in_flight = 0
+        self._lock = threading.Lock()  # counters
+
+        self.enqueued = 0
+        self.rejected = 0
+        self.batches_written = 0
+        self.entries_written = 0
+        self.failed_batches = 0
+        self.dropped_entries = 0
+
+    # ----------------------
+    # Lifecycle
+    # ----------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 30.0) -> None:
+        """
+        Drain everything already queued, then stop the worker.
+        Items submitted from here on are rejected.
+        """
+        if self._thread is None:
+            return
+
+        with self._producers:
+            self._stopping.set()
+            self._producers.wait_for(lambda: not self._in_flight, timeout)
+
+        self._thread.join(timeout)
+
+        if self._thread.is_alive():
+            # Never run a second consumer next to a live worker
+            logger.error("%s: drain timed out after %ss", self.name, timeout)
+            return
+
+        self._thread = None
+
+        # Items submitted while the worker was exiting
+        while True:
+            batch = self._next_batch_nowait()
+            if not batch:
+                return
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """
+        Block until every submitted item has been handed to the sink.
+        """
+        deadline = time.monotonic() + timeout
+
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+
+        return True
+
+    # ----------------------
+    # Producer side
+    # ----------------------
+
+    def submit(self, item: Any) -> bool:
+        """
+        Enqueue one item. Blocks up to `enqueue_timeout` when the queue
+        is full (backpressure); returns False if it is still full or the
+        writer is stopping, so the caller can fall back to a synchronous
+        write.
+        """
+        if self._put(item, timeout=self.enqueue_timeout):
+            return True
+
+        with self._lock:
+            self.rejected += 1
+        return False
+
+    def submit_nowait(self, item: Any) -> bool:
+        """
+        Enqueue one item only if there is room right now. For callers
+        that must not block (the event loop); False when the queue is
+        full or the writer is stopping.
+        """
+        return self._put(item, timeout=None)
+
+    def _put(self, item: Any, *, timeout: float | None) -> bool:
+        with self._producers:
+            if self._stopping.is_set():
+                return False
+            self._in_flight += 1
+
+        try:
+            if timeout is None:
+                self._queue.put_nowait(item)
+            else:
+                self._queue.put(item, timeout=timeout)
+        except queue.Full:
+            return False
+        finally:
+            with self._producers:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    self._producers.notify_all()
+
+        with self._lock:
+            self.enqueued += 1
+        return True
+
+    # ----------------------
+    # Consumer side
+    # ----------------------
+
+    def _next_batch(self) -> list[Any]:
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _next_batch_nowait(self) -> list[Any]:
+        batch: list[Any] = []
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _write(self, batch: list[Any]) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.sink(batch)
+            except Exception:
+                if attempt < self.max_retries:
+                    time.sleep(min(0.05 * 2**attempt, 1.0))
+                    continue
+
+                with self._lock:
+                    self.failed_batches += 1
+                    self.dropped_entries += len(batch)
+                logger.exception(
+                    "%s: dropping batch of %d entries", self.name, len(batch)
+                )
+                # The entries themselves, so they can be recovered
+                for item in batch:
+                    logger.error("%s: dropped %r", self.name, item)
+                return
+
+            with self._lock:
+                self.batches_written += 1
+                self.entries_written += len(batch)
+            return
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+
+            if not batch:
+                if self._stopping.is_set():
+                    return
+                continue
+
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "running": int(self.running),
+                "queue_depth": self._queue.qsize(),
+                "enqueued": self.enqueued,
+                "rejected": self.rejected,
+                "batches_written": self.batches_written,
+                "entries_written": self.entries_written,
+                "failed_batches": self.failed_batches,
+                "dropped_entries": self.dropped_entries,
+            }
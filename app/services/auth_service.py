@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 import secrets
 
+from sqlalchemy import Row, update
 from sqlalchemy.orm import Session
 
 from app.models.user import User
@@ -11,8 +12,13 @@ from app.core.security import (
     verify_password,
     get_password_hash,
     create_access_token,
+    refresh_token_digest,
 )
+from app.core import queries
 from app.core.config import settings
+from app.core.refresh_families import new_family_id, revoked_families
+from app.core.token_cache import token_cache
+from app.core.token_epochs import EPOCH_CLAIM, token_epochs
 
 
 # ======================
@@ -32,7 +38,7 @@ class AuthError(Exception):
 def _generate_refresh_token() -> str:
     """
     Generate cryptographically secure opaque refresh token.
-    Stored verbatim in DB (NOT JWT).
+    Only its SHA-256 digest is stored (NOT JWT).
     """
     return secrets.token_urlsafe(48)
 
@@ -44,19 +50,82 @@ def _refresh_expiry() -> datetime:
     )
 
 
+def _access_token(user_id: int, tenant_id: int, epoch: int) -> str:
+    return create_access_token(
+        {"sub": str(user_id), "tenant_id": tenant_id, EPOCH_CLAIM: epoch}
+    )
+
+
+def _bump_epoch_statement(user_id: int):
+    return (
+        update(User)
+        .where(User.id == user_id)
+        .values(token_epoch=User.token_epoch + 1)
+        .returning(User.token_epoch)
+        # loaded Users see the new epoch (expire_on_commit=False sessions)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def _revoke_user_tokens_statement(user_id: int):
+    return (
+        update(RefreshToken)
+        .where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.revoked.is_(False),
+        )
+        .values(revoked=True, revoked_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _sessions_invalidated(user_id: int, epoch: int) -> None:
+    # After commit: this process stops accepting older tokens at once
+    token_epochs.observe(user_id, epoch)
+    token_cache.purge_subject(user_id)
+
+
+def _revoke_family_statement(family_id: str):
+    # One set-based UPDATE over ix_refresh_token_family, however many
+    # times the family has rotated
+    return (
+        update(RefreshToken)
+        .where(
+            RefreshToken.family_id == family_id,
+            RefreshToken.revoked.is_(False),
+        )
+        .values(revoked=True, revoked_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _rotate_statement(token_id: int, replaced_by_digest: str):
+    # Compare-and-set: of concurrent refreshes presenting the same
+    # token only one flips it; the others get no row back (reuse)
+    return (
+        update(RefreshToken)
+        .where(
+            RefreshToken.id == token_id,
+            RefreshToken.revoked.is_(False),
+        )
+        .values(
+            revoked=True,
+            revoked_at=datetime.now(timezone.utc),
+            replaced_by_digest=replaced_by_digest,
+        )
+        .returning(RefreshToken.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
 # ======================
 # Public API
 # ======================
 
 
 def register_user(db: Session, tenant, user_in: UserCreate) -> User:
-    existing = (
-        db.query(User)
-        .filter(
-            User.email == user_in.email,
-            User.tenant_id == tenant.id,
-        )
-        .first()
+    existing = db.scalar(
+        queries.EMAIL_TAKEN, {"email": user_in.email, "tenant_id": tenant.id}
     )
     if existing:
         raise AuthError("Email already registered")
@@ -74,30 +143,24 @@ def register_user(db: Session, tenant, user_in: UserCreate) -> User:
     return user
 
 
-def authenticate_user(
-    db: Session,
-    tenant,
-    email: str,
-    password: str,
-) -> Token:
-    user = (
-        db.query(User)
-        .filter(
-            User.email == email,
-            User.tenant_id == tenant.id,
-        )
-        .first()
-    )
+def _find_user(db: Session, tenant, email: str) -> Row | None:
+    """
+    Core row (id, hashed_password, is_active, token_epoch): login never
+    needs the ORM User or its roles.
+    """
+    return db.execute(
+        queries.LOGIN_USER, {"email": email, "tenant_id": tenant.id}
+    ).first()
 
-    if not user or not verify_password(password, user.hashed_password):
-        raise AuthError("Invalid credentials")
 
-    access_token = create_access_token({"sub": str(user.id), "tenant_id": tenant.id})
+def _issue_tokens(db: Session, tenant, user: User | Row) -> Token:
+    access_token = _access_token(user.id, tenant.id, user.token_epoch)
 
     refresh_token_value = _generate_refresh_token()
 
     refresh_token = RefreshToken(
-        token=refresh_token_value,
+        token_digest=refresh_token_digest(refresh_token_value),
+        family_id=new_family_id(),
         user_id=user.id,
         tenant_id=tenant.id,
         expires_at=_refresh_expiry(),
@@ -113,6 +176,68 @@ def authenticate_user(
     )
 
 
+def authenticate_user(
+    db: Session,
+    tenant,
+    email: str,
+    password: str,
+) -> Token:
+    user = _find_user(db, tenant, email)
+
+    if not user or not verify_password(password, user.hashed_password):
+        raise AuthError("Invalid credentials")
+
+    if not user.is_active:
+        raise AuthError("Invalid credentials")
+
+    return _issue_tokens(db, tenant, user)
+
+
+def invalidate_sessions(db: Session, user_id: int) -> int:
+    """
+    Log a user out everywhere: bump token_epoch (every access token
+    issued so far is rejected by get_current_user) and revoke all their
+    refresh tokens. Commits; returns the new epoch.
+    """
+    epoch = db.execute(_bump_epoch_statement(user_id)).scalar_one()
+    db.execute(_revoke_user_tokens_statement(user_id))
+    db.commit()
+
+    _sessions_invalidated(user_id, epoch)
+    return epoch
+
+
+def change_password(
+    db: Session,
+    tenant,
+    user: User,
+    current_password: str,
+    new_password: str,
+) -> Token:
+    """
+    Replace the password, end every other session, and return a fresh
+    token pair for the caller.
+    """
+    if not verify_password(current_password, user.hashed_password):
+        raise AuthError("Invalid credentials")
+
+    user.hashed_password = get_password_hash(new_password)
+    invalidate_sessions(db, user.id)
+
+    return _issue_tokens(db, tenant, user)
+
+
+def revoke_token_family(db: Session, family_id: str) -> int:
+    """
+    Revoke every token of a refresh family; returns the rows revoked.
+    """
+    revoked = db.execute(_revoke_family_statement(family_id)).rowcount
+    db.commit()
+
+    revoked_families.add(family_id)
+    return revoked
+
+
 def refresh_tokens(
     db: Session,
     tenant,
@@ -121,24 +246,26 @@ def refresh_tokens(
     """
     Secure Refresh Token Rotation
     - Opaque refresh tokens
-    - Single-use
+    - Single-use, also under concurrent refreshes (conditional UPDATE)
+    - Reuse of a rotated token revokes its whole family
     - No state leakage (generic errors)
     """
 
-    token = (
-        db.query(RefreshToken)
-        .filter(
-            RefreshToken.token == refresh_token_str,
-            RefreshToken.tenant_id == tenant.id,
-        )
-        .first()
+    token = db.scalar(
+        queries.REFRESH_TOKEN,
+        {"digest": refresh_token_digest(refresh_token_str), "tenant_id": tenant.id},
     )
 
     # 🔒 GENERIC FAILURE (no info leak)
     if not token:
         raise AuthError("Invalid or expired refresh token")
 
+    if token.family_id in revoked_families:
+        raise AuthError("Invalid or expired refresh token")
+
     if token.is_revoked:
+        # Replayed: whoever holds the newer tokens may be an attacker
+        revoke_token_family(db, token.family_id)
         raise AuthError("Invalid or expired refresh token")
 
     if token.is_expired:
@@ -148,17 +275,20 @@ def refresh_tokens(
     # ROTATION
     # ----------------------
 
-    now = datetime.now(timezone.utc)
-
-    token.revoked = True
-    token.revoked_at = now
+    user_id, family_id = token.user_id, token.family_id
 
     new_refresh_token_value = _generate_refresh_token()
-    token.replaced_by_token = new_refresh_token_value
+    new_digest = refresh_token_digest(new_refresh_token_value)
+
+    if db.scalar(_rotate_statement(token.id, new_digest)) is None:
+        # A concurrent refresh rotated it since we read it: reuse
+        revoke_token_family(db, family_id)
+        raise AuthError("Invalid or expired refresh token")
 
     new_refresh_token = RefreshToken(
-        token=new_refresh_token_value,
-        user_id=token.user_id,
+        token_digest=new_digest,
+        family_id=family_id,
+        user_id=user_id,
         tenant_id=tenant.id,
         expires_at=_refresh_expiry(),
     )
@@ -166,9 +296,8 @@ def refresh_tokens(
     db.add(new_refresh_token)
     db.commit()
 
-    access_token = create_access_token(
-        {"sub": str(token.user_id), "tenant_id": tenant.id}
-    )
+    epoch = db.scalar(queries.USER_EPOCH, {"user_id": user_id})
+    access_token = _access_token(user_id, tenant.id, epoch)
 
     return {
         "access_token": access_token,
@@ -0,0 +1,214 @@
+# app/services/auth_service_async.py
+"""
+AsyncSession versions of auth_service (DATABASE_ASYNC_ENABLED).
+Same behaviour and errors; Argon2 is awaited on the hashing pool.
+"""
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.refresh_token import RefreshToken
+from app.schemas.user import UserCreate
+from app.schemas.token import Token
+from app.core.security import (
+    verify_password_async,
+    get_password_hash_async,
+    refresh_token_digest,
+)
+from app.core import queries
+from app.core.refresh_families import new_family_id, revoked_families
+from app.services.auth_service import (
+    AuthError,
+    _access_token,
+    _bump_epoch_statement,
+    _generate_refresh_token,
+    _refresh_expiry,
+    _revoke_family_statement,
+    _revoke_user_tokens_statement,
+    _rotate_statement,
+    _sessions_invalidated,
+)
+
+
+async def _find_user(db: AsyncSession, tenant, email: str) -> Row | None:
+    """
+    See auth_service._find_user.
+    """
+    result = await db.execute(
+        queries.LOGIN_USER, {"email": email, "tenant_id": tenant.id}
+    )
+    return result.first()
+
+
+async def register_user(db: AsyncSession, tenant, user_in: UserCreate) -> User:
+    if await db.scalar(
+        queries.EMAIL_TAKEN, {"email": user_in.email, "tenant_id": tenant.id}
+    ):
+        raise AuthError("Email already registered")
+
+    user = User(
+        email=user_in.email,
+        hashed_password=await get_password_hash_async(user_in.password),
+        tenant_id=tenant.id,
+        is_active=True,
+    )
+
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+async def _issue_tokens(
+    db: AsyncSession, tenant, user: User | Row, epoch: int | None = None
+) -> Token:
+    """
+    `epoch` overrides user.token_epoch: a User merged from the principal
+    cache doesn't have it loaded, and a lazy load can't run here.
+    """
+    if epoch is None:
+        epoch = user.token_epoch
+    access_token = _access_token(user.id, tenant.id, epoch)
+
+    refresh_token_value = _generate_refresh_token()
+
+    db.add(
+        RefreshToken(
+            token_digest=refresh_token_digest(refresh_token_value),
+            family_id=new_family_id(),
+            user_id=user.id,
+            tenant_id=tenant.id,
+            expires_at=_refresh_expiry(),
+        )
+    )
+    await db.commit()
+
+    return Token(
+        access_token=access_token,
+        refresh_token=refresh_token_value,
+        token_type="bearer",
+    )
+
+
+async def authenticate_user(
+    db: AsyncSession,
+    tenant,
+    email: str,
+    password: str,
+) -> Token:
+    user = await _find_user(db, tenant, email)
+
+    if not user or not await verify_password_async(password, user.hashed_password):
+        raise AuthError("Invalid credentials")
+
+    if not user.is_active:
+        raise AuthError("Invalid credentials")
+
+    return await _issue_tokens(db, tenant, user)
+
+
+async def invalidate_sessions(db: AsyncSession, user_id: int) -> int:
+    """
+    See auth_service.invalidate_sessions.
+    """
+    epoch = (await db.execute(_bump_epoch_statement(user_id))).scalar_one()
+    await db.execute(_revoke_user_tokens_statement(user_id))
+    await db.commit()
+
+    _sessions_invalidated(user_id, epoch)
+    return epoch
+
+
+async def change_password(
+    db: AsyncSession,
+    tenant,
+    user: User,
+    current_password: str,
+    new_password: str,
+) -> Token:
+    """
+    See auth_service.change_password.
+    """
+    # `user` may be a cached principal: hashed_password isn't loaded
+    hashed_password = await db.scalar(
+        select(User.hashed_password).where(User.id == user.id)
+    )
+    if not await verify_password_async(current_password, hashed_password):
+        raise AuthError("Invalid credentials")
+
+    user.hashed_password = await get_password_hash_async(new_password)
+    epoch = await invalidate_sessions(db, user.id)
+
+    return await _issue_tokens(db, tenant, user, epoch=epoch)
+
+
+async def revoke_token_family(db: AsyncSession, family_id: str) -> int:
+    """
+    See auth_service.revoke_token_family.
+    """
+    revoked = (await db.execute(_revoke_family_statement(family_id))).rowcount
+    await db.commit()
+
+    revoked_families.add(family_id)
+    return revoked
+
+
+async def refresh_tokens(
+    db: AsyncSession,
+    tenant,
+    refresh_token_str: str,
+):
+    """
+    Secure Refresh Token Rotation (see auth_service.refresh_tokens).
+    """
+
+    token = await db.scalar(
+        queries.REFRESH_TOKEN,
+        {"digest": refresh_token_digest(refresh_token_str), "tenant_id": tenant.id},
+    )
+
+    # 🔒 GENERIC FAILURE (no info leak)
+    if not token or token.family_id in revoked_families:
+        raise AuthError("Invalid or expired refresh token")
+
+    if token.is_revoked:
+        await revoke_token_family(db, token.family_id)
+        raise AuthError("Invalid or expired refresh token")
+
+    if token.is_expired:
+        raise AuthError("Invalid or expired refresh token")
+
+    # ----------------------
+    # ROTATION
+    # ----------------------
+
+    user_id, family_id = token.user_id, token.family_id
+
+    new_refresh_token_value = _generate_refresh_token()
+    new_digest = refresh_token_digest(new_refresh_token_value)
+
+    if await db.scalar(_rotate_statement(token.id, new_digest)) is None:
+        # A concurrent refresh rotated it since we read it: reuse
+        await revoke_token_family(db, family_id)
+        raise AuthError("Invalid or expired refresh token")
+
+    db.add(
+        RefreshToken(
+            token_digest=new_digest,
+            family_id=family_id,
+            user_id=user_id,
+            tenant_id=tenant.id,
+            expires_at=_refresh_expiry(),
+        )
+    )
+    await db.commit()
+
+    epoch = await db.scalar(queries.USER_EPOCH, {"user_id": user_id})
+    access_token = _access_token(user_id, tenant.id, epoch)
+
+    return {
+        "access_token": access_token,
+        "refresh_token": new_refresh_token_value,
+        "token_type": "bearer",
+    }
@@ -0,0 +1,240 @@
+# app/services/refresh_token_gc.py
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import and_, delete, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logging import logger
+from app.core.metrics import register_metrics_source
+from app.models.refresh_token import RefreshToken
+
+
+@dataclass
+class GCPassResult:
+    expired: int = 0
+    revoked: int = 0
+    batches: int = 0
+    # False when the pass stopped at max_batches with rows left
+    complete: bool = True
+
+
+def delete_batch(db: Session, condition, *, batch_size: int) -> int:
+    """
+    Delete up to `batch_size` rows matching `condition`, in one short
+    transaction. Rows locked by a concurrent refresh are skipped, not
+    waited on; they are picked up by a later batch.
+    """
+    ids = (
+        db.execute(
+            select(RefreshToken.id)
+            .where(condition)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        .scalars()
+        .all()
+    )
+    if not ids:
+        db.commit()
+        return 0
+
+    db.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return len(ids)
+
+
+class RefreshTokenCollector:
+    """
+    Deletes expired and long-revoked refresh tokens.
+
+    - each pass walks ix_refresh_token_expires (expired, never
+      revoked), then ix_refresh_token_revoked_at, then revoked rows
+      without a revoked_at, in batches of `batch_size` ids
+    - every batch is its own transaction, followed by `batch_pause`,
+      so locks stay short and the collector never saturates the DB
+    - at most `max_batches` per pass; the rest waits for the next one
+
+    Revoked tokens are kept for `revoked_retention` first, even once
+    expired: replaying a rotated token is only recognised (and its
+    family revoked) while the row still exists. Revoked rows with no
+    revoked_at (written before it existed) are kept until
+    `revoked_retention` after they expire.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int,
+        batch_pause: float,
+        max_batches: int,
+        interval: float,
+        revoked_retention: timedelta,
+        name: str = "refresh-token-gc",
+    ):
+        self.session_factory = session_factory
+        self.batch_size = max(1, batch_size)
+        self.batch_pause = batch_pause
+        self.max_batches = max(1, max_batches)
+        self.interval = interval
+        self.revoked_retention = revoked_retention
+        self.name = name
+
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.passes = 0
+        self.batches = 0
+        self.deleted_expired = 0
+        self.deleted_revoked = 0
+        self.errors = 0
+        self.backlogged_passes = 0
+        self.last_pass_at: float | None = None
+        self.last_pass_seconds = 0.0
+
+    # ----------------------
+    # Lifecycle
+    # ----------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 30.0) -> None:
+        """
+        Stop after the batch in flight; never mid-transaction.
+        """
+        if self._thread is None:
+            return
+
+        self._stopping.set()
+        self._thread.join(timeout)
+
+        if self._thread.is_alive():
+            logger.error("%s: stop timed out after %ss", self.name, timeout)
+            return
+
+        self._thread = None
+
+    # ----------------------
+    # Collection
+    # ----------------------
+
+    def collect(self, now: datetime | None = None) -> GCPassResult:
+        """
+        One rate-limited pass (what the background thread runs every
+        `interval`; scripts/gc_refresh_tokens.py runs it once).
+        """
+        now = now or datetime.now(timezone.utc)
+        started = time.monotonic()
+        result = GCPassResult()
+
+        retained_since = now - self.revoked_retention
+        phases = (
+            (
+                "expired",
+                and_(
+                    RefreshToken.expires_at < now,
+                    RefreshToken.revoked.is_(False),
+                    RefreshToken.revoked_at.is_(None),
+                ),
+            ),
+            ("revoked", RefreshToken.revoked_at < retained_since),
+            (
+                "revoked",
+                and_(
+                    RefreshToken.revoked.is_(True),
+                    RefreshToken.revoked_at.is_(None),
+                    RefreshToken.expires_at < retained_since,
+                ),
+            ),
+        )
+
+        db = self.session_factory()
+        try:
+            for phase, condition in phases:
+                while not self._stopping.is_set():
+                    if result.batches >= self.max_batches:
+                        result.complete = False
+                        break
+
+                    deleted = delete_batch(db, condition, batch_size=self.batch_size)
+                    result.batches += 1
+                    self.batches += 1
+
+                    if phase == "expired":
+                        result.expired += deleted
+                        self.deleted_expired += deleted
+                    else:
+                        result.revoked += deleted
+                        self.deleted_revoked += deleted
+
+                    if deleted < self.batch_size:
+                        break
+
+                    self._stopping.wait(self.batch_pause)
+        finally:
+            db.close()
+
+        self.passes += 1
+        if not result.complete:
+            self.backlogged_passes += 1
+        self.last_pass_at = time.time()
+        self.last_pass_seconds = round(time.monotonic() - started, 3)
+
+        return result
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self.collect()
+            except Exception:
+                self.errors += 1
+                logger.exception("%s: pass failed", self.name)
+
+            self._stopping.wait(self.interval)
+
+    def stats(self) -> dict[str, int | float | bool | None]:
+        return {
+            "running": self.running,
+            "passes": self.passes,
+            "batches": self.batches,
+            "deleted_expired": self.deleted_expired,
+            "deleted_revoked": self.deleted_revoked,
+            "errors": self.errors,
+            "backlogged_passes": self.backlogged_passes,
+            "last_pass_at": self.last_pass_at,
+            "last_pass_seconds": self.last_pass_seconds,
+        }
+
+
+refresh_token_collector = RefreshTokenCollector(
+    batch_size=settings.refresh_token_gc_batch_size,
+    batch_pause=settings.refresh_token_gc_batch_pause_ms / 1000,
+    max_batches=settings.refresh_token_gc_max_batches,
+    interval=settings.refresh_token_gc_interval_seconds,
+    revoked_retention=timedelta(
+        hours=settings.refresh_token_gc_revoked_retention_hours
+    ),
+)
+
+register_metrics_source("refresh_token_gc", refresh_token_collector.stats)
@@ -1,20 +1,109 @@
+import base64
+from dataclasses import dataclass
+from typing import Iterator
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from app.core import queries
 from app.models.user import User
+from app.services.auth_service import invalidate_sessions
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+STREAM_BATCH_SIZE = 500
+
+# فقط ستون‌های عمومی؛ hashed_password هرگز از دیتابیس خوانده نمی‌شود
+USER_PUBLIC_COLUMNS = (User.id, User.email, User.tenant_id)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclass
+class UserPage:
+    items: list[Row]
+    next_cursor: str | None
+
+
+def encode_cursor(user_id: int) -> str:
+    return base64.urlsafe_b64encode(str(user_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        return int(raw)
+    except ValueError as e:  # also covers binascii / unicode errors
+        raise InvalidCursor("invalid cursor") from e
+
+
+def _tenant_users_statement(tenant_id: int, cursor: str | None):
+    # Keyset on (tenant_id, id): a range scan of ix_users_tenant_id_id
+    # starting after the cursor, so page N costs the same as page 1
+    conditions = [User.tenant_id == tenant_id]
+    if cursor is not None:
+        conditions.append(User.id > decode_cursor(cursor))
+
+    return select(*USER_PUBLIC_COLUMNS).where(*conditions).order_by(User.id)
+
+
+def list_users(
+    db: Session,
+    tenant_id: int,
+    *,
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> UserPage:
+    """
+    یک صفحه از کاربران یک tenant (فقط ستون‌های عمومی)، به ترتیب id.
+    `next_cursor` صفحه‌ی بعد را می‌دهد؛ None یعنی صفحه‌ی آخر.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    rows = db.execute(_tenant_users_statement(tenant_id, cursor).limit(limit + 1)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id)
 
+    return UserPage(items=rows, next_cursor=next_cursor)
 
-def list_users(db: Session, tenant_id: int):
+
+def stream_users(
+    db: Session,
+    tenant_id: int,
+    *,
+    cursor: str | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[list[Row]]:
     """
-    لیست همه کاربران یک tenant خاص
+    همه‌ی کاربران یک tenant به صورت دسته‌های `batch_size` تایی، با
+    server-side cursor (yield_per): حافظه مستقل از اندازه‌ی tenant است.
+    cursor نامعتبر همین‌جا خطا می‌دهد، نه وسط استریم.
     """
-    return db.query(User).filter(User.tenant_id == tenant_id).all()
+    statement = _tenant_users_statement(tenant_id, cursor).execution_options(
+        yield_per=batch_size
+    )
+    return _partitions(db, statement)
+
+
+def _partitions(db: Session, statement) -> Iterator[list[Row]]:
+    result = db.execute(statement)
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
 
 
 def get_user_by_id(db: Session, user_id: int, tenant_id: int) -> User | None:
     """
     گرفتن یک کاربر خاص از tenant مشخص
     """
-    return (
-        db.query(User).filter(User.id == user_id, User.tenant_id == tenant_id).first()
+    return db.scalar(
+        queries.USER_IN_TENANT, {"user_id": user_id, "tenant_id": tenant_id}
     )
 
 
@@ -51,6 +140,18 @@ def update_user_email(
     return user
 
 
+def deactivate_user(db: Session, user_id: int, tenant_id: int) -> bool:
+    """
+    غیرفعال کردن کاربر و پایان همه نشست‌های او (توکن‌های access و refresh)
+    """
+    user = get_user_by_id(db, user_id, tenant_id)
+    if not user:
+        return False
+    user.is_active = False
+    invalidate_sessions(db, user.id)
+    return True
+
+
 def delete_user(db: Session, user_id: int, tenant_id: int) -> bool:
     """
     حذف کاربر در tenant مشخص
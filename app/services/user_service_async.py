@@ -0,0 +1,65 @@
+# app/services/user_service_async.py
+"""
+AsyncSession versions of user_service (DATABASE_ASYNC_ENABLED).
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.services.auth_service_async import invalidate_sessions
+
+
+async def list_users(db: AsyncSession, tenant_id: int):
+    result = await db.scalars(select(User).where(User.tenant_id == tenant_id))
+    return result.all()
+
+
+async def get_user_by_id(db: AsyncSession, user_id: int, tenant_id: int) -> User | None:
+    return await db.scalar(
+        select(User).where(User.id == user_id, User.tenant_id == tenant_id)
+    )
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
+    return await db.scalar(select(User).where(User.email == email))
+
+
+async def create_user(
+    db: AsyncSession, email: str, hashed_password: str, tenant_id: int
+) -> User:
+    user = User(email=email, hashed_password=hashed_password, tenant_id=tenant_id)
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+async def update_user_email(
+    db: AsyncSession, user_id: int, tenant_id: int, email: str
+) -> User | None:
+    user = await get_user_by_id(db, user_id, tenant_id)
+    if not user:
+        return None
+    user.email = email
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+
+async def deactivate_user(db: AsyncSession, user_id: int, tenant_id: int) -> bool:
+    user = await get_user_by_id(db, user_id, tenant_id)
+    if not user:
+        return False
+    user.is_active = False
+    await invalidate_sessions(db, user.id)
+    return True
+
+
+async def delete_user(db: AsyncSession, user_id: int, tenant_id: int) -> bool:
+    user = await get_user_by_id(db, user_id, tenant_id)
+    if not user:
+        return False
+    await db.delete(user)
+    await db.commit()
+    return True
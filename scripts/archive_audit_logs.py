@@ -0,0 +1,81 @@
+# scripts/archive_audit_logs.py
+"""
+Archive closed time ranges of the authorization audit log.
+
+Either archives [--start, --end) of the live table (rows stay in it,
+the table is append-only) or archives a detached monthly partition and
+drops it. --verify walks every chain across archive and live table.
+
+Usage:
+    python scripts/archive_audit_logs.py --start 2026-01-01 --end 2026-02-01
+    python scripts/archive_audit_logs.py --partition authorization_audit_logs_2026_01
+    python scripts/archive_audit_logs.py --verify
+
+Exit code 1 if verification fails.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.services.audit_archiver import (  # noqa: E402
+    archive_detached_partition,
+    archive_range,
+    verify_all_chains_with_archive,
+)
+
+
+def utc_date(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--start", type=utc_date)
+    parser.add_argument("--end", type=utc_date)
+    parser.add_argument("--partition", help="detached partition to archive")
+    parser.add_argument("--verify", action="store_true")
+    parser.add_argument("--archive-dir", default=None)
+    args = parser.parse_args()
+
+    if bool(args.start) != bool(args.end):
+        parser.error("--start and --end go together")
+
+    db = SessionLocal()
+    try:
+        if args.partition:
+            info = archive_detached_partition(
+                db, args.partition, archive_dir=args.archive_dir
+            )
+            print(f"{info.path}: {info.rows} entries, {info.chains} chains")
+
+        if args.start:
+            info = archive_range(db, args.start, args.end, archive_dir=args.archive_dir)
+            print(f"{info.path}: {info.rows} entries, {info.chains} chains")
+
+        if args.verify:
+            results = verify_all_chains_with_archive(db, archive_dir=args.archive_dir)
+            for result in results:
+                status = (
+                    "ok"
+                    if result.ok
+                    else f"FAILED at {result.first_bad_id}: {result.reason}"
+                )
+                print(
+                    f"{result.chain_key or 'legacy':<24} {status:<40} "
+                    f"entries={result.entries_checked}"
+                )
+            return 0 if all(result.ok for result in results) else 1
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
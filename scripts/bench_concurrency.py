@@ -0,0 +1,152 @@
+# scripts/bench_concurrency.py
+"""
+Concurrency benchmark: sync (threadpool) vs async (AsyncSession) stack.
+
+Fires authenticated GET /tenants/{id}/dashboard requests (user + tenant
+lookup, RBAC check, audit write) in-process through the ASGI app at
+increasing concurrency, once per DATABASE_ASYNC_ENABLED mode. Each
+mode runs in its own subprocess because the setting is read at import.
+
+Needs a real PostgreSQL DATABASE_URL (schema is created if missing).
+
+Usage:
+    DATABASE_URL=postgresql+psycopg2://... \\
+        python scripts/bench_concurrency.py [requests] [concurrency ...]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("AUDIT_SIGNING_KEY", "bench")
+
+DEFAULT_REQUESTS = 2000
+DEFAULT_CONCURRENCY = (1, 10, 100, 1000)
+
+
+def _seed() -> tuple[int, str]:
+    from app.core.database import Base, SessionLocal, engine
+    from app.core.security import create_access_token
+    from app.models.role import Role
+    from app.models.tenant import Tenant
+    from app.models.user import User
+
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        tenant = Tenant(name=f"bench-{uuid.uuid4()}")
+        db.add(tenant)
+        db.flush()
+
+        user = User(
+            email=f"{uuid.uuid4()}@bench.local",
+            hashed_password="unused",
+            tenant_id=tenant.id,
+        )
+        role = Role(name="admin", tenant_id=tenant.id)
+        role.users.append(user)
+        db.add_all([user, role])
+        db.commit()
+
+        return tenant.id, create_access_token(subject=str(user.id))
+    finally:
+        db.close()
+
+
+async def _run_level(app, path: str, token: str, total: int, concurrency: int):
+    import httpx
+
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    # App errors (e.g. pool timeouts) become 500s and count as errors
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await c.get(path, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "rps": total / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def _child(total: int, levels: list[int]) -> None:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    tenant_id, token = _seed()
+
+    from app.main import app
+
+    path = f"/tenants/{tenant_id}/dashboard"
+
+    async def main():
+        results = [await _run_level(app, path, token, total, n) for n in levels]
+        if os.environ.get("DATABASE_ASYNC_ENABLED") == "true":
+            from app.core.database import get_async_engine
+
+            await get_async_engine().dispose()
+        return results
+
+    print(json.dumps(asyncio.run(main())))
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        args = sys.argv[sys.argv.index("--child") + 1 :]
+        _child(int(args[0]), [int(n) for n in args[1:]])
+        return
+
+    if not os.environ.get("DATABASE_URL", "").startswith("postgresql"):
+        sys.exit("DATABASE_URL must point at PostgreSQL")
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS
+    levels = [int(n) for n in sys.argv[2:]] or list(DEFAULT_CONCURRENCY)
+
+    for mode in ("false", "true"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", str(total), *map(str, levels)],
+            env={**os.environ, "DATABASE_ASYNC_ENABLED": mode},
+            check=True,
+            stdout=subprocess.PIPE,
+            text=True,
+        ).stdout
+
+        label = "async" if mode == "true" else "sync"
+        print(f"{label} stack ({total} requests per level)")
+        for row in json.loads(output.strip().splitlines()[-1]):
+            print(
+                f"  c={row['concurrency']:>5}  {row['rps']:8.0f} req/s  "
+                f"p50 {row['p50_ms']:7.1f} ms  p99 {row['p99_ms']:7.1f} ms  "
+                f"errors {row['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# scripts/bench_permissions.py
+"""
+Micro-benchmark: legacy set-union + wildcard matching vs compiled bitmasks.
+
+Usage:
+    python scripts/bench_permissions.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+# Pure in-memory benchmark: no DB is touched, settings only need to load
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("AUDIT_SIGNING_KEY", "bench")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.core.permissions import Permission  # noqa: E402
+from app.core.role_permissions import ROLE_PERMISSIONS  # noqa: E402
+from app.core.permission_masks import (  # noqa: E402
+    mask_allows,
+    mask_for_roles,
+    permission_matches,
+)
+
+ROLE_NAMES = ("user", "admin")
+REQUIRED = tuple(Permission)
+
+
+def legacy_check() -> int:
+    granted = 0
+    for required in REQUIRED:
+        granted_permissions: set[Permission] = set()
+        for name in ROLE_NAMES:
+            granted_permissions |= ROLE_PERMISSIONS.get(name, set())
+        if any(permission_matches(p, required) for p in granted_permissions):
+            granted += 1
+    return granted
+
+
+def compiled_check() -> int:
+    granted = 0
+    for required in REQUIRED:
+        if mask_allows(mask_for_roles(ROLE_NAMES), required):
+            granted += 1
+    return granted
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    assert legacy_check() == compiled_check()
+
+    checks = iterations * len(REQUIRED)
+    for name, fn in (("legacy", legacy_check), ("compiled", compiled_check)):
+        seconds = min(timeit.repeat(fn, number=iterations, repeat=5))
+        print(f"{name:>9}: {seconds / checks * 1e9:8.1f} ns/check")
+
+
+if __name__ == "__main__":
+    main()
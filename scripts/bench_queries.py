@@ -0,0 +1,156 @@
+# scripts/bench_queries.py
+"""
+Micro-benchmark: legacy db.query() lookups vs the pre-built statements
+in app.core.queries, for the lookups on the auth path.
+
+Each pair runs the same lookup against the same seeded rows; the
+session is reset between calls so every call pays the full load (no
+identity-map hits). Reports µs per lookup (DB round trip included).
+
+Needs a real PostgreSQL DATABASE_URL (schema is created if missing).
+
+Usage:
+    DATABASE_URL=postgresql+psycopg2://... \\
+        python scripts/bench_queries.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+import uuid
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("AUDIT_SIGNING_KEY", "bench")
+
+DEFAULT_ITERATIONS = 2000
+
+
+def _seed(db) -> dict:
+    from datetime import datetime, timedelta, timezone
+
+    from app.core.security import refresh_token_digest
+    from app.models.refresh_token import RefreshToken
+    from app.models.role import Role
+    from app.models.tenant import Tenant
+    from app.models.user import User
+
+    tenant = Tenant(name=f"bench-{uuid.uuid4()}")
+    db.add(tenant)
+    db.flush()
+
+    user = User(
+        email=f"{uuid.uuid4()}@bench.local",
+        hashed_password="unused",
+        tenant_id=tenant.id,
+    )
+    role = Role(name="admin", tenant_id=tenant.id)
+    role.users.append(user)
+    db.add_all([user, role])
+    db.flush()
+
+    db.add(
+        RefreshToken(
+            token_digest=refresh_token_digest("bench-token"),
+            family_id=uuid.uuid4().hex,
+            user_id=user.id,
+            tenant_id=tenant.id,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=1),
+        )
+    )
+    db.commit()
+
+    return {
+        "user_id": user.id,
+        "tenant_id": tenant.id,
+        "email": user.email,
+        "digest": refresh_token_digest("bench-token"),
+    }
+
+
+def _pairs(db, seed: dict):
+    from app.core import queries
+    from app.models.refresh_token import RefreshToken
+    from app.models.tenant import Tenant
+    from app.models.user import User
+
+    user_id, tenant_id = seed["user_id"], seed["tenant_id"]
+    email, digest = seed["email"], seed["digest"]
+
+    def legacy_principal():
+        user = db.query(User).filter(User.id == user_id).first()
+        db.get(Tenant, user.tenant_id)
+
+    def fast_principal():
+        db.execute(queries.PRINCIPAL, {"user_id": user_id}).all()
+
+    def legacy_login():
+        db.query(User).filter(User.email == email, User.tenant_id == tenant_id).first()
+
+    def fast_login():
+        db.execute(queries.LOGIN_USER, {"email": email, "tenant_id": tenant_id}).first()
+
+    def legacy_user_in_tenant():
+        db.query(User).filter(User.id == user_id, User.tenant_id == tenant_id).first()
+
+    def fast_user_in_tenant():
+        db.scalar(queries.USER_IN_TENANT, {"user_id": user_id, "tenant_id": tenant_id})
+
+    def legacy_refresh():
+        db.query(RefreshToken).filter(
+            RefreshToken.token_digest == digest,
+            RefreshToken.tenant_id == tenant_id,
+        ).first()
+
+    def fast_refresh():
+        db.scalar(queries.REFRESH_TOKEN, {"digest": digest, "tenant_id": tenant_id})
+
+    return (
+        ("principal + tenant", legacy_principal, fast_principal),
+        ("login lookup", legacy_login, fast_login),
+        ("user in tenant", legacy_user_in_tenant, fast_user_in_tenant),
+        ("refresh token", legacy_refresh, fast_refresh),
+    )
+
+
+def main() -> None:
+    if not os.environ.get("DATABASE_URL", "").startswith("postgresql"):
+        sys.exit("DATABASE_URL must point at PostgreSQL")
+
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS
+
+    import app.models  # noqa: F401  (registers every mapper)
+    from app.core.database import Base, SessionLocal, engine
+
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        seed = _seed(db)
+
+        print(f"µs per lookup ({iterations} iterations, best of 5)")
+        for name, legacy, fast in _pairs(db, seed):
+            results = []
+            for fn in (legacy, fast):
+
+                def call(fn=fn):
+                    fn()
+                    db.expunge_all()
+
+                call()  # warm the compiled cache
+                seconds = min(timeit.repeat(call, number=iterations, repeat=5))
+                results.append(seconds / iterations * 1e6)
+
+            print(
+                f"  {name:<20} legacy {results[0]:8.1f}  fast {results[1]:8.1f}  "
+                f"x{results[0] / results[1]:.2f}"
+            )
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# scripts/gc_refresh_tokens.py
+"""
+Delete expired and long-revoked refresh tokens.
+
+One rate-limited pass of the refresh token collector, for deployments
+that run it from cron instead of REFRESH_TOKEN_GC_ENABLED. Batch size,
+pause and batches per pass come from the REFRESH_TOKEN_GC_* settings.
+
+Usage:
+    python scripts/gc_refresh_tokens.py [--until-done]
+
+--until-done keeps running passes until no batch limit is hit.
+"""
+
+import argparse
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.services.refresh_token_gc import refresh_token_collector  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--until-done",
+        action="store_true",
+        help="repeat passes until the backlog is cleared",
+    )
+    args = parser.parse_args()
+
+    while True:
+        result = refresh_token_collector.collect()
+        print(
+            f"deleted {result.expired} expired, {result.revoked} revoked "
+            f"in {result.batches} batches"
+        )
+        if result.complete or not args.until_done:
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
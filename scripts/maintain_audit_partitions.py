@@ -0,0 +1,71 @@
+# scripts/maintain_audit_partitions.py
+"""
+Maintain the monthly partitions of authorization_audit_logs.
+
+Pre-creates the next AUDIT_PARTITION_MONTHS_AHEAD months and detaches
+partitions past AUDIT_PARTITION_RETENTION_MONTHS. Run daily (cron); a
+no-op when the table is not partitioned.
+
+Usage:
+    python scripts/maintain_audit_partitions.py [--detach-before YYYY-MM] [--force]
+
+--force detaches partitions even if their chains were not verified yet.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.services.audit_partitions import (  # noqa: E402
+    detach_partitions_before,
+    is_partitioned,
+    maintain_partitions,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--detach-before",
+        type=lambda value: datetime.strptime(value, "%Y-%m").date(),
+        default=None,
+        help="detach every partition ending on or before this month",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="skip the verified-chain check"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if not is_partitioned(db):
+            print("authorization_audit_logs is not partitioned, nothing to do")
+            return 0
+
+        result = maintain_partitions(db)
+        if args.detach_before:
+            detached = detach_partitions_before(
+                db, args.detach_before, require_verified=not args.force
+            )
+            result.detached += detached.detached
+            result.skipped.update(detached.skipped)
+    finally:
+        db.close()
+
+    for name in result.created:
+        print(f"created  {name}")
+    for name in result.detached:
+        print(f"detached {name}")
+    for name, reason in result.skipped.items():
+        print(f"skipped  {name}: {reason}")
+
+    return 1 if result.skipped else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
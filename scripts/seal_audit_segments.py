@@ -0,0 +1,39 @@
+# scripts/seal_audit_segments.py
+"""
+Seal complete audit-chain segments under signed Merkle roots.
+
+Run periodically (cron); only segments that filled up since the last
+run are sealed.
+
+Usage:
+    python scripts/seal_audit_segments.py [--segment-size N]
+"""
+
+import argparse
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.services.audit_merkle import seal_all_segments  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--segment-size", type=int, default=None)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        sealed = seal_all_segments(db, segment_size=args.segment_size)
+    finally:
+        db.close()
+
+    for chain_key, count in sealed.items():
+        print(f"{chain_key:<24} sealed {count} segment(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# scripts/verify_audit_chains.py
+"""
+Verify the authorization audit hash chains.
+
+Streams authorization_audit_logs in ranges, re-checks HMACs in a
+process pool and resumes from signed checkpoints (only entries added
+since the last clean run are verified). Chains start from their
+archived prefix (signed segment anchors) where ranges were archived.
+
+Usage:
+    python scripts/verify_audit_chains.py [--full] [--workers N] [--range-size N]
+        [--archive-dir DIR]
+
+Exit code 1 if any chain fails verification.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.services.audit_verifier import verify_all_chains_streaming  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--full", action="store_true", help="ignore checkpoints, verify everything"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--range-size", type=int, default=None)
+    parser.add_argument("--archive-dir", default=None)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        results = verify_all_chains_streaming(
+            db,
+            workers=args.workers,
+            range_size=args.range_size,
+            resume=not args.full,
+            archive_dir=args.archive_dir,
+        )
+    finally:
+        db.close()
+
+    for result in results:
+        status = (
+            "ok" if result.ok else f"FAILED at {result.first_bad_id}: {result.reason}"
+        )
+        print(
+            f"{result.chain_key or 'legacy':<24} {status:<40} "
+            f"entries={result.entries_checked} "
+            f"(resumed {result.resumed_entries}, degraded {result.degraded_entries})"
+        )
+
+    print(f"verified {len(results)} chains in {time.perf_counter() - started:.1f}s")
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+# tests/auth/test_password_hashing.py
+
+import asyncio
+import threading
+import uuid
+
+import pytest
+
+from app.core.password_hashing import PasswordHasherBusy, PasswordHashingExecutor
+from app.core.security import get_password_hash, verify_password
+from app.services import auth_service
+
+
+def test_hash_and_verify_run_on_pool():
+    hashed = get_password_hash("s3cret-pass")
+
+    assert verify_password("s3cret-pass", hashed)
+    assert not verify_password("wrong", hashed)
+
+
+def test_executor_rejects_when_saturated():
+    executor = PasswordHashingExecutor(max_workers=1, max_pending=1)
+    gate = threading.Event()
+
+    running = executor.submit(gate.wait)
+    queued = executor.submit(gate.wait)
+
+    with pytest.raises(PasswordHasherBusy):
+        executor.submit(gate.wait)
+
+    gate.set()
+    running.result(timeout=5)
+    queued.result(timeout=5)
+
+    # Capacity is released once work completes
+    assert executor.submit(lambda: 42).result(timeout=5) == 42
+
+    stats = executor.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+
+
+def test_failed_submit_releases_its_slot():
+    executor = PasswordHashingExecutor(max_workers=1, max_pending=0)
+    executor._executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: 42)
+
+    assert executor.stats()["in_flight"] == 0
+    # The slot is free again: the next failure is the same error, not Busy
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: 42)
+
+
+def test_login_fast_fails_with_503_when_pool_is_full(client, monkeypatch):
+    email = f"{uuid.uuid4()}@example.com"
+    r = client.post("/auth/register", json={"email": email, "password": "Passw0rd!"})
+    assert r.status_code == 201
+
+    def busy(*args, **kwargs):
+        raise PasswordHasherBusy()
+
+    monkeypatch.setattr("app.core.password_hashing.password_hasher.submit", busy)
+
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    assert r.status_code == 503
+    assert r.headers["retry-after"] == "1"
+
+    r = client.post(
+        "/auth/register",
+        json={"email": f"{uuid.uuid4()}@example.com", "password": "Passw0rd!"},
+    )
+    assert r.status_code == 503
+
+
+def test_login_runs_session_work_off_the_event_loop(client, monkeypatch):
+    email = f"{uuid.uuid4()}@example.com"
+    r = client.post("/auth/register", json={"email": email, "password": "Passw0rd!"})
+    assert r.status_code == 201
+
+    on_loop = []
+    authenticate = auth_service.authenticate_user
+
+    def recording(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return authenticate(*args, **kwargs)
+
+    monkeypatch.setattr(auth_service, "authenticate_user", recording)
+
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    assert r.status_code == 200
+    assert on_loop == [False]
@@ -0,0 +1,129 @@
+# tests/auth/test_principal_cache.py
+
+import uuid
+
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.core.principal_cache import PrincipalCache, principal_cache
+from app.core.security import create_access_token
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services import user_service
+
+
+def create_user(db_session) -> tuple[str, User]:
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return create_access_token(subject=str(user.id)), user
+
+
+def count_user_selects(client, token: str) -> int:
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert response.status_code == 200
+    return sum(1 for s in statements if "FROM users" in s)
+
+
+def test_repeat_request_is_served_from_cache(client, db_session):
+    token, user = create_user(db_session)
+    db_session.expunge_all()
+
+    assert count_user_selects(client, token) == 1
+    hits_before = principal_cache.stats()["hits"]
+
+    assert count_user_selects(client, token) == 0
+    assert principal_cache.stats()["hits"] == hits_before + 1
+
+
+def test_role_grant_invalidates_cached_principal(client, db_session):
+    token, user = create_user(db_session)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/admin/dashboard", headers=headers).status_code == 403
+    assert principal_cache.get(user.id) is not None
+
+    user.roles.append(Role(name="admin", tenant_id=user.tenant_id))
+    db_session.commit()
+
+    assert principal_cache.get(user.id) is None
+    assert client.get("/admin/dashboard", headers=headers).status_code == 200
+
+
+def test_deactivation_invalidates_cached_principal(client, db_session):
+    token, user = create_user(db_session)
+
+    assert (
+        client.get(
+            "/users/me", headers={"Authorization": f"Bearer {token}"}
+        ).status_code
+        == 200
+    )
+    assert principal_cache.get(user.id) is not None
+
+    user.is_active = False
+    db_session.commit()
+
+    assert principal_cache.get(user.id) is None
+
+
+def test_email_and_tenant_changes_invalidate_cached_principal(client, db_session):
+    token, user = create_user(db_session)
+    headers = {"Authorization": f"Bearer {token}"}
+    old_tenant_id = user.tenant_id
+    user.roles.append(Role(name="admin", tenant_id=old_tenant_id))
+    db_session.commit()
+
+    assert client.get("/users/me", headers=headers).status_code == 200
+    url = f"/tenants/{old_tenant_id}/dashboard"
+    assert client.get(url, headers=headers).status_code == 200
+
+    new_email = f"{uuid.uuid4()}@example.com"
+    user_service.update_user_email(db_session, user.id, old_tenant_id, new_email)
+
+    assert principal_cache.get(user.id) is None
+    assert client.get("/users/me", headers=headers).json()["email"] == new_email
+
+    other = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(other)
+    db_session.commit()
+    user.tenant_id = other.id
+    db_session.commit()
+
+    assert principal_cache.get(user.id) is None
+    assert client.get("/users/me", headers=headers).json()["tenant_id"] == other.id
+    assert client.get(url, headers=headers).status_code == 403
+
+
+def test_version_map_is_bounded_by_max_entries():
+    cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+
+    stale = cache.version_of(1)
+    for user_id in (1, 2, 3, 4):
+        cache.bump_user(user_id)
+
+    assert cache.stats()["versions"] == 2
+    # User 1's version was pruned: the pre-bump key must stay stale
+    assert cache.version_of(1) != stale
+    cache.put(stale, object())
+    assert cache.get(1) is None
@@ -0,0 +1,114 @@
+# tests/auth/test_security_context.py
+
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy import event
+from starlette.requests import Request
+
+from app.core import deps
+from app.core.database import engine
+from app.core.principal_cache import principal_cache
+from app.core.security import create_access_token
+from app.core.tenant_cache import tenant_cache
+from app.core.token_epochs import token_epochs
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+
+
+def create_tenant_admin(db_session):
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    role = Role(name="admin", tenant_id=tenant.id)
+    role.users.append(user)
+    db_session.add_all([user, role])
+    db_session.commit()
+
+    return tenant.id, user.id, create_access_token(subject=str(user.id))
+
+
+def selects(action) -> list[str]:
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        # The audit write reads its hash-chain head; not part of auth
+        if statement.lstrip().startswith("SELECT") and "audit_" not in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return statements
+
+
+def clear_caches():
+    principal_cache.clear()
+    tenant_cache.clear()
+    token_epochs.clear()
+
+
+def test_protected_get_costs_one_select(client, db_session):
+    tenant_id, _, token = create_tenant_admin(db_session)
+    url = f"/tenants/{tenant_id}/dashboard"
+    headers = {"Authorization": f"Bearer {token}"}
+    db_session.expunge_all()
+    clear_caches()
+
+    def dashboard():
+        r = client.get(url, headers=headers)
+        assert r.status_code == 200
+
+    # get_current_tenant + require_permission: user, tenant and roles
+    # come from one joined query
+    cold = selects(dashboard)
+    assert len(cold) == 1
+    assert "FROM users" in cold[0] and "tenants" in cold[0]
+
+    assert selects(dashboard) == []
+
+
+def test_context_is_resolved_once_per_request(db_session):
+    _, user_id, token = create_tenant_admin(db_session)
+    db_session.expunge_all()
+    clear_caches()
+
+    request = Request({"type": "http", "state": {}})
+    first = deps.get_security_context(request, token=token, db=db_session)
+    second = deps.get_security_context(request, token="ignored", db=db_session)
+
+    assert second is first
+    assert first.user_id == user_id
+    assert first.role_names == ("admin",)
+    assert deps.get_current_user_tenant(first) is first.tenant
+
+
+def test_unknown_user_and_cross_tenant(client, db_session):
+    tenant_id, _, token = create_tenant_admin(db_session)
+    other_id, _, _ = create_tenant_admin(db_session)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    r = client.get(f"/tenants/{other_id}/dashboard", headers=headers)
+    assert r.status_code == 403
+
+    r = client.get(f"/tenants/{tenant_id + 10_000}/dashboard", headers=headers)
+    assert r.status_code == 404
+
+    request = Request({"type": "http", "state": {}})
+    ghost = create_access_token(subject="987654321")
+    try:
+        deps.get_security_context(request, token=ghost, db=db_session)
+    except HTTPException as exc:
+        assert exc.status_code == 401
+    else:
+        raise AssertionError("unknown user accepted")
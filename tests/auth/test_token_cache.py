@@ -0,0 +1,99 @@
+# tests/auth/test_token_cache.py
+
+import time
+
+import pytest
+
+from app.core import security
+from app.core.security import create_access_token, decode_token
+from app.core.token_cache import VerifiedTokenCache, token_cache
+
+
+@pytest.fixture
+def count_decodes(monkeypatch):
+    calls = []
+    original = security.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    token_cache.clear()
+    return calls
+
+
+def test_repeat_decode_skips_verification(count_decodes):
+    token = create_access_token(subject="42")
+
+    first = decode_token(token)
+    second = decode_token(token)
+
+    assert first["sub"] == second["sub"] == "42"
+    assert len(count_decodes) == 1
+
+
+def test_cached_claims_are_read_only(count_decodes):
+    claims = decode_token(create_access_token(subject="42"))
+
+    with pytest.raises(TypeError):
+        claims["sub"] = "1"
+
+
+def test_tampered_token_is_not_served_from_cache(count_decodes):
+    token = create_access_token(subject="42")
+    decode_token(token)
+
+    with pytest.raises(ValueError):
+        decode_token(token[:-2] + ("AA" if token[-2:] != "AA" else "BB"))
+
+
+def test_entry_expires_at_token_exp():
+    cache = VerifiedTokenCache(max_entries=10)
+
+    cache.put("expired", {"sub": "1", "exp": time.time() - 1})
+    cache.put("live", {"sub": "1", "exp": time.time() + 60})
+    cache.put("no-exp", {"sub": "1"})
+
+    assert cache.get("expired") is None
+    assert cache.get("live")["sub"] == "1"
+    assert cache.get("no-exp") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_lru_bound_and_revocation_hooks():
+    cache = VerifiedTokenCache(max_entries=2)
+    exp = time.time() + 60
+
+    cache.put("a", {"sub": "1", "exp": exp})
+    cache.put("b", {"sub": "1", "exp": exp})
+    cache.get("a")
+    cache.put("c", {"sub": "2", "exp": exp})
+
+    # "b" was least recently used
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+    cache.purge_subject(1)
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+
+    cache.purge_token("c")
+    assert cache.get("c") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_users_me_reuses_verified_claims(client, count_decodes):
+    r = client.post(
+        "/auth/register", json={"email": "cache@test.com", "password": "Passw0rd!"}
+    )
+    r = client.post(
+        "/auth/login", json={"email": "cache@test.com", "password": "Passw0rd!"}
+    )
+    headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+    for _ in range(3):
+        assert client.get("/users/me", headers=headers).status_code == 200
+
+    assert len(count_decodes) == 1
+    assert token_cache.stats()["hits"] >= 2
@@ -0,0 +1,144 @@
+# tests/auth/test_token_epoch.py
+
+import uuid
+
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.core.security import create_access_token
+from app.core.token_cache import token_cache
+from app.core.token_epochs import token_epochs
+from app.models.user import User
+from app.services import user_service
+
+PASSWORD = "password123"
+
+
+def register_and_login(client) -> tuple[str, dict]:
+    email = f"{uuid.uuid4()}@example.com"
+    r = client.post("/auth/register", json={"email": email, "password": PASSWORD})
+    assert r.status_code == 201
+
+    r = client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    assert r.status_code == 200
+    return email, r.json()
+
+
+def me(client, tokens: dict) -> int:
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    return client.get("/users/me", headers=headers).status_code
+
+
+def test_logout_everywhere_revokes_outstanding_tokens(client):
+    email, laptop = register_and_login(client)
+    r = client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    phone = r.json()
+
+    assert me(client, laptop) == 200 and me(client, phone) == 200
+
+    r = client.post(
+        "/auth/logout-all",
+        headers={"Authorization": f"Bearer {laptop['access_token']}"},
+    )
+    assert r.status_code == 204
+
+    # Access tokens die before they expire, refresh tokens with them
+    assert me(client, laptop) == 401
+    assert me(client, phone) == 401
+    for tokens in (laptop, phone):
+        r = client.post(
+            "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert r.status_code == 401
+
+    r = client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    assert me(client, r.json()) == 200
+
+
+def test_epoch_check_costs_no_query_when_cached(client):
+    _, tokens = register_and_login(client)
+    assert me(client, tokens) == 200  # warms principal + epoch caches
+
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        assert me(client, tokens) == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert not any("token_epoch" in s for s in statements)
+
+
+def test_password_change_keeps_only_the_new_session(client, db_session):
+    email, old = register_and_login(client)
+
+    r = client.post(
+        "/auth/password",
+        json={"current_password": "wrong", "new_password": "n3w-password"},
+        headers={"Authorization": f"Bearer {old['access_token']}"},
+    )
+    assert r.status_code == 401
+    assert me(client, old) == 200
+
+    r = client.post(
+        "/auth/password",
+        json={"current_password": PASSWORD, "new_password": "n3w-password"},
+        headers={"Authorization": f"Bearer {old['access_token']}"},
+    )
+    assert r.status_code == 200
+    new = r.json()
+
+    assert me(client, old) == 401
+    assert me(client, new) == 200
+
+    r = client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    assert r.status_code == 401
+    r = client.post("/auth/login", json={"email": email, "password": "n3w-password"})
+    assert r.status_code == 200
+
+
+def test_deactivation_revokes_sessions(client, db_session):
+    email, tokens = register_and_login(client)
+    user = db_session.query(User).filter(User.email == email).one()
+    assert me(client, tokens) == 200
+
+    assert user_service.deactivate_user(db_session, user.id, user.tenant_id)
+
+    assert me(client, tokens) == 401
+    r = client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    assert r.status_code == 401
+
+
+def test_bump_in_another_process_applies_after_cache_expiry(client, db_session):
+    email, tokens = register_and_login(client)
+    user = db_session.query(User).filter(User.email == email).one()
+    assert me(client, tokens) == 200
+
+    # Another worker bumped the epoch; this process still caches the old one
+    user.token_epoch += 1
+    db_session.commit()
+    token_cache.purge_subject(user.id)
+
+    token_epochs.clear()
+    assert me(client, tokens) == 401
+
+
+def test_newer_token_refreshes_stale_cached_epoch(client, db_session):
+    email, tokens = register_and_login(client)
+    user = db_session.query(User).filter(User.email == email).one()
+    assert me(client, tokens) == 200
+
+    user.token_epoch += 1
+    db_session.commit()
+
+    # Issued by another worker after its bump
+    fresh = create_access_token(
+        {"sub": str(user.id), "tenant_id": user.tenant_id, "epoch": 1}
+    )
+    assert me(client, {"access_token": fresh}) == 200
+    assert token_epochs.get(user.id) == 1
+    assert me(client, tokens) == 401
@@ -27,11 +27,6 @@ def test_refresh_flow_success_and_rotation(client):
     assert "refresh_token" in refreshed
     new_refresh = refreshed["refresh_token"]
 
-    # old refresh must now be invalid (revoked)
-    refresh_again = client.post("/auth/refresh", json={"refresh_token": refresh_token})
-    assert refresh_again.status_code == 401
-    assert refresh_again.json()["detail"] == "Invalid or expired refresh token"
-
     # new refresh must be valid
     refresh_new = client.post("/auth/refresh", json={"refresh_token": new_refresh})
     assert refresh_new.status_code == 200
@@ -39,6 +34,17 @@ def test_refresh_flow_success_and_rotation(client):
     assert "access_token" in refreshed_2
     assert "refresh_token" in refreshed_2
 
+    # old refresh must now be invalid (revoked)
+    refresh_again = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert refresh_again.status_code == 401
+    assert refresh_again.json()["detail"] == "Invalid or expired refresh token"
+
+    # replaying a rotated token revokes the family, including the latest
+    latest = client.post(
+        "/auth/refresh", json={"refresh_token": refreshed_2["refresh_token"]}
+    )
+    assert latest.status_code == 401
+
 
 def test_refresh_invalid_token(client):
     resp = client.post("/auth/refresh", json={"refresh_token": "non-existent-token"})
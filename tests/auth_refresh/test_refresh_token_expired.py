@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 
+from app.core.security import refresh_token_digest
 from app.models.refresh_token import RefreshToken
 
 
@@ -25,7 +26,7 @@ def test_refresh_token_expired(client, db_session):
     # منقضی کردن refresh token در DB
     rt = (
         db_session.query(RefreshToken)
-        .filter(RefreshToken.token == refresh_token)
+        .filter(RefreshToken.token_digest == refresh_token_digest(refresh_token))
         .first()
     )
     assert rt is not None
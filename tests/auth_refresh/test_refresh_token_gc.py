@@ -0,0 +1,145 @@
+# tests/auth_refresh/test_refresh_token_gc.py
+
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app.core.metrics import collect_metrics
+from app.core.refresh_families import new_family_id
+from app.core.security import refresh_token_digest
+from app.models.refresh_token import RefreshToken
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services.refresh_token_gc import RefreshTokenCollector
+
+
+def make_collector(**overrides) -> RefreshTokenCollector:
+    options = dict(
+        batch_size=2,
+        batch_pause=0,
+        max_batches=100,
+        interval=60,
+        revoked_retention=timedelta(hours=24),
+    )
+    options.update(overrides)
+    return RefreshTokenCollector(**options)
+
+
+def seed_tokens(db_session, *, expired: int, old_revoked: int, keep: int) -> None:
+    db_session.execute(text("DELETE FROM refresh_tokens"))
+    tenant = db_session.query(Tenant).first()
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    now = datetime.now(timezone.utc)
+
+    def token(**fields) -> RefreshToken:
+        return RefreshToken(
+            token_digest=refresh_token_digest(str(uuid.uuid4())),
+            family_id=new_family_id(),
+            user_id=user.id,
+            tenant_id=tenant.id,
+            **{"expires_at": now + timedelta(days=1), **fields},
+        )
+
+    db_session.add_all(
+        [token(expires_at=now - timedelta(minutes=1)) for _ in range(expired)]
+        + [
+            token(revoked=True, revoked_at=now - timedelta(days=2))
+            for _ in range(old_revoked)
+        ]
+        # live, and recently revoked (still needed for replay detection)
+        + [token() for _ in range(keep)]
+        + [token(revoked=True, revoked_at=now - timedelta(hours=1))]
+    )
+    db_session.commit()
+
+
+def test_collects_expired_and_long_revoked_in_batches(db_session):
+    seed_tokens(db_session, expired=5, old_revoked=3, keep=2)
+    collector = make_collector()
+
+    result = collector.collect()
+
+    assert (result.expired, result.revoked, result.complete) == (5, 3, True)
+    # expired: 2 + 2 + 1, revoked: 2 + 1, revoked without revoked_at: 0
+    assert result.batches == 6
+    assert db_session.query(RefreshToken).count() == 3
+
+    assert collector.collect().batches == 3  # nothing left: one probe per phase
+
+
+def test_revoked_tokens_outlive_expiry_until_retention(db_session):
+    seed_tokens(db_session, expired=0, old_revoked=0, keep=0)
+    now = datetime.now(timezone.utc)
+    user_id = db_session.query(RefreshToken.user_id).scalar()
+
+    def token(**fields):
+        return RefreshToken(
+            token_digest=refresh_token_digest(str(uuid.uuid4())),
+            family_id=new_family_id(),
+            user_id=user_id,
+            tenant_id=db_session.query(Tenant).first().id,
+            revoked=True,
+            **fields,
+        )
+
+    expired_recently_revoked = token(
+        expires_at=now - timedelta(days=3), revoked_at=now - timedelta(hours=1)
+    )
+    legacy_recent = token(expires_at=now - timedelta(hours=1), revoked_at=None)
+    legacy_old = token(expires_at=now - timedelta(days=2), revoked_at=None)
+    db_session.add_all([expired_recently_revoked, legacy_recent, legacy_old])
+    db_session.commit()
+    kept = {expired_recently_revoked.id, legacy_recent.id}
+    collected = legacy_old.id
+
+    result = make_collector().collect()
+
+    assert (result.expired, result.revoked) == (0, 1)
+    db_session.expire_all()
+    # the recently revoked token seeded above, plus the two kept here
+    remaining = {t.id for t in db_session.query(RefreshToken)}
+    assert kept < remaining and collected not in remaining
+    assert len(remaining) == 3
+
+
+def test_max_batches_bounds_a_pass(db_session):
+    seed_tokens(db_session, expired=7, old_revoked=0, keep=0)
+    collector = make_collector(max_batches=3)
+
+    first = collector.collect()
+    assert (first.expired, first.complete) == (6, False)
+
+    second = collector.collect()
+    assert (second.expired, second.complete) == (1, True)
+
+    stats = collector.stats()
+    assert stats["deleted_expired"] == 7
+    assert stats["backlogged_passes"] == 1
+
+
+def test_background_thread_and_metrics(db_session):
+    seed_tokens(db_session, expired=3, old_revoked=1, keep=1)
+    collector = make_collector(interval=0.01)
+
+    collector.start()
+    try:
+        for _ in range(200):
+            if collector.passes:
+                break
+            time.sleep(0.01)
+    finally:
+        collector.stop()
+
+    assert not collector.running
+    assert collector.deleted_expired == 3
+    assert collector.deleted_revoked == 1
+    assert "refresh_token_gc" in collect_metrics()
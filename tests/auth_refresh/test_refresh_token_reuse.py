@@ -1,5 +1,17 @@
 # tests/auth_refresh/test_refresh_token_reuse.py
 
+import threading
+
+from sqlalchemy import event
+
+from app.core.database import SessionLocal, engine
+from app.core.refresh_families import revoked_families
+from app.core.security import refresh_token_digest
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.services import auth_service
+from app.services.auth_service import AuthError
+
 
 def test_refresh_token_cannot_be_reused(client):
     # ثبت‌نام
@@ -25,3 +37,111 @@ def test_refresh_token_cannot_be_reused(client):
     # استفاده مجدد از refresh token قدیمی
     r2 = client.post("/auth/refresh", json={"refresh_token": refresh_token})
     assert r2.status_code == 401
+
+
+def login(client, email: str) -> str:
+    r = client.post("/auth/login", json={"email": email, "password": "password123"})
+    assert r.status_code == 200
+    return r.json()["refresh_token"]
+
+
+def rotate(client, refresh_token: str) -> str:
+    r = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert r.status_code == 200
+    return r.json()["refresh_token"]
+
+
+def test_reuse_revokes_whole_family_in_one_update(client, db_session):
+    email = "family@example.com"
+    r = client.post("/auth/register", json={"email": email, "password": "password123"})
+    assert r.status_code == 201
+
+    first = login(client, email)
+    lineage = [first]
+    for _ in range(5):
+        lineage.append(rotate(client, lineage[-1]))
+
+    other_session = login(client, email)
+
+    family_id = (
+        db_session.query(RefreshToken.family_id)
+        .filter(RefreshToken.token_digest == refresh_token_digest(first))
+        .scalar()
+    )
+
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        r = client.post("/auth/refresh", json={"refresh_token": first})
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert r.status_code == 401
+    assert sum(1 for s in statements if s.startswith("UPDATE refresh_tokens")) == 1
+    assert family_id in revoked_families
+
+    db_session.expire_all()
+    family = db_session.query(RefreshToken).filter(RefreshToken.family_id == family_id)
+    assert family.count() == 6
+    assert all(token.is_revoked for token in family)
+
+    # The attacker's (or victim's) newest token is dead too ...
+    r = client.post("/auth/refresh", json={"refresh_token": lineage[-1]})
+    assert r.status_code == 401
+
+    # ... while a separate login keeps working
+    rotate(client, other_session)
+
+
+def test_concurrent_refreshes_rotate_once(client, db_session, monkeypatch):
+    email = "race@example.com"
+    r = client.post("/auth/register", json={"email": email, "password": "password123"})
+    assert r.status_code == 201
+    refresh_token = login(client, email)
+    tenant = db_session.query(User).filter(User.email == email).one().tenant
+
+    # Both requests have read the (still valid) token before either
+    # of them rotates it
+    both_read = threading.Barrier(2, timeout=10)
+    original = auth_service._rotate_statement
+
+    def rotate_after_both_read(*args):
+        both_read.wait()
+        return original(*args)
+
+    monkeypatch.setattr(auth_service, "_rotate_statement", rotate_after_both_read)
+
+    outcomes = []
+
+    def refresh() -> None:
+        db = SessionLocal()
+        try:
+            outcomes.append(auth_service.refresh_tokens(db, tenant, refresh_token))
+        except AuthError as e:
+            outcomes.append(e)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=refresh) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(type(o).__name__ for o in outcomes) == ["AuthError", "dict"]
+
+    # The loser is treated as reuse: the winner's new token is dead too
+    db_session.expire_all()
+    family = (
+        db_session.query(RefreshToken)
+        .filter(RefreshToken.token_digest == refresh_token_digest(refresh_token))
+        .one()
+        .family_id
+    )
+    tokens = db_session.query(RefreshToken).filter(RefreshToken.family_id == family)
+    assert tokens.count() == 2
+    assert all(token.is_revoked for token in tokens)
@@ -1,5 +1,6 @@
 # tests/auth_refresh/test_refresh_token_revoked.py
 
+from app.core.security import refresh_token_digest
 from app.models.refresh_token import RefreshToken
 
 
@@ -23,7 +24,7 @@ def test_revoked_refresh_token_is_invalid(client, db_session):
     # revoke کردن refresh token
     rt = (
         db_session.query(RefreshToken)
-        .filter(RefreshToken.token == refresh_token)
+        .filter(RefreshToken.token_digest == refresh_token_digest(refresh_token))
         .first()
     )
     assert rt is not None
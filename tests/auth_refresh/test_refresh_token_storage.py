@@ -0,0 +1,37 @@
+# tests/auth_refresh/test_refresh_token_storage.py
+
+from app.core.security import refresh_token_digest
+from app.models.refresh_token import RefreshToken
+
+
+def test_only_digests_are_stored(client, db_session):
+    r = client.post(
+        "/auth/register",
+        json={"email": "digest@example.com", "password": "password123"},
+    )
+    assert r.status_code == 201
+
+    r = client.post(
+        "/auth/login",
+        json={"email": "digest@example.com", "password": "password123"},
+    )
+    refresh_token = r.json()["refresh_token"]
+
+    r = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert r.status_code == 200
+    new_refresh_token = r.json()["refresh_token"]
+
+    old = (
+        db_session.query(RefreshToken)
+        .filter(RefreshToken.token_digest == refresh_token_digest(refresh_token))
+        .one()
+    )
+    assert len(old.token_digest) == 32
+    assert old.replaced_by_digest == refresh_token_digest(new_refresh_token)
+
+    stored = b"".join(
+        row.token_digest + (row.replaced_by_digest or b"")
+        for row in db_session.query(RefreshToken)
+    )
+    assert refresh_token.encode() not in stored
+    assert new_refresh_token.encode() not in stored
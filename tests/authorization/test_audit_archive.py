@@ -0,0 +1,312 @@
+# tests/authorization/test_audit_archive.py
+
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+
+from app.core.audit_archive import (
+    ArchivedEntry,
+    ArchiveIntegrityError,
+    ArchiveSegment,
+    AuditArchive,
+)
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services import audit_service
+from app.services.audit_archiver import (
+    archive_detached_partition,
+    archive_range,
+    verify_all_chains_with_archive,
+    verify_chain_with_archive,
+)
+from app.services.audit_verifier import (
+    verify_all_chains_streaming,
+    verify_chain,
+    verify_chain_streaming,
+)
+
+TENANT_A, TENANT_B = 11, 12
+CHAIN_A = f"tenant:{TENANT_A}"
+
+
+def clear_audit_tables(db_session):
+    db_session.execute(text("DELETE FROM authorization_audit_logs"))
+    db_session.execute(text("DELETE FROM audit_chain_heads"))
+    db_session.commit()
+
+
+def log_decisions(db_session, count: int, tenant_id: int = TENANT_A):
+    for i in range(count):
+        audit_service.log_authorization_decision(
+            db=db_session,
+            user_id=i % 2 + 1,
+            tenant_id=tenant_id,
+            permission="users:read" if i % 2 else "users:delete",
+            allowed=bool(i % 2),
+            reason="permission granted" if i % 2 else "permission_denied",
+            context={"resource_owner_id": i},
+        )
+
+
+def live_entries(db_session) -> list[ArchivedEntry]:
+    rows = (
+        db_session.query(AuthorizationAuditLog).order_by(AuthorizationAuditLog.id).all()
+    )
+    return [
+        ArchivedEntry(*(getattr(row, field) for field in ArchivedEntry._fields))
+        for row in rows
+    ]
+
+
+def last_hour():
+    end = datetime.now(timezone.utc)
+    return end - timedelta(hours=1), end
+
+
+def test_segment_round_trip_and_filters(db_session, tmp_path):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 8, TENANT_A)
+    log_decisions(db_session, 8, TENANT_B)
+    entries = live_entries(db_session)
+
+    info = archive_range(
+        db_session, *last_hour(), archive_dir=tmp_path, row_group_size=4
+    )
+    assert (info.rows, info.chains) == (16, 2)
+    assert os.stat(info.path).st_mode & 0o222 == 0  # read-only
+
+    assert list(AuditArchive(tmp_path).scan()) == entries
+
+    with ArchiveSegment(info.path) as segment:
+        tenant_b = list(segment.scan(tenant_id=TENANT_B))
+        assert tenant_b == [e for e in entries if e.tenant_id == TENANT_B]
+        # Tenant A's row groups were skipped on their statistics alone
+        assert segment.chunks_read == 2 * len(ArchivedEntry._fields)
+
+        assert list(segment.scan(user_id=1, permission="users:delete")) == [
+            e for e in entries if e.user_id == 1 and e.permission == "users:delete"
+        ]
+
+        window = list(
+            segment.scan(start=entries[3].created_at, end=entries[5].created_at)
+        )
+        assert [e.id for e in window] == [entries[3].id, entries[4].id]
+
+        assert list(segment.scan(tenant_id=999)) == []
+
+
+def test_only_closed_ranges_and_no_overwrite(db_session, tmp_path):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 2)
+    start, end = last_hour()
+
+    with pytest.raises(ValueError):
+        archive_range(db_session, start, end + timedelta(hours=1), archive_dir=tmp_path)
+
+    archive_range(db_session, start, end, archive_dir=tmp_path)
+    with pytest.raises(FileExistsError):
+        archive_range(db_session, start, end, archive_dir=tmp_path)
+
+
+def test_verifier_crosses_archive_boundary(db_session, tmp_path):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 10)
+    entries = live_entries(db_session)
+
+    # Archive the first 6 entries, then drop them from the live table
+    # (what dropping an archived partition does)
+    cut = entries[6].created_at
+    info = archive_range(
+        db_session, cut - timedelta(hours=1), cut, archive_dir=tmp_path
+    )
+    assert info.rows == 6
+    db_session.execute(
+        text("DELETE FROM authorization_audit_logs WHERE id <= :id"),
+        {"id": entries[5].id},
+    )
+    db_session.commit()
+
+    assert verify_chain(db_session, CHAIN_A).reason == "broken_link"
+
+    result = verify_chain_with_archive(db_session, CHAIN_A, archive_dir=tmp_path)
+    assert result.ok
+    assert result.entries_checked == 10
+    assert result.last_hash == entries[-1].entry_hash
+
+    assert [
+        (r.chain_key, r.ok)
+        for r in verify_all_chains_with_archive(db_session, archive_dir=tmp_path)
+    ] == [(CHAIN_A, True)]
+
+
+def test_verify_endpoint_starts_from_archived_prefix(
+    client, db_session, tmp_path, monkeypatch
+):
+    # Far from real tenant ids: the admin's own decision is audited too
+    archived_tenant = 900_001
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 10, archived_tenant)
+    entries = live_entries(db_session)
+
+    cut = entries[6].created_at
+    archive_range(db_session, cut - timedelta(hours=1), cut, archive_dir=tmp_path)
+    db_session.execute(
+        text("DELETE FROM authorization_audit_logs WHERE id <= :id"),
+        {"id": entries[5].id},
+    )
+    db_session.commit()
+    monkeypatch.setattr(settings, "audit_archive_dir", str(tmp_path))
+
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+    admin = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    role = Role(name="admin", tenant_id=tenant.id)
+    role.users.append(admin)
+    db_session.add_all([admin, role])
+    db_session.commit()
+
+    token = create_access_token(subject=str(admin.id))
+    response = client.post(
+        "/admin/audit/verify",
+        params={"full": "true"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ok"] is True
+    chain = next(
+        c for c in body["chains"] if c["chain_key"] == f"tenant:{archived_tenant}"
+    )
+    assert chain["entries_checked"] == 10
+    assert chain["resumed_entries"] == 6
+    assert chain["last_hash"] == entries[-1].entry_hash
+
+
+def test_fully_archived_chains_are_still_verified(db_session, tmp_path):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 4, TENANT_A)
+    log_decisions(db_session, 3, TENANT_B)
+    archive_range(db_session, *last_hour(), archive_dir=tmp_path)
+
+    # No live rows left for either chain; B has lost its head too
+    db_session.execute(text("DELETE FROM authorization_audit_logs"))
+    db_session.execute(
+        text("DELETE FROM audit_chain_heads WHERE chain_key = :key"),
+        {"key": f"tenant:{TENANT_B}"},
+    )
+    db_session.commit()
+
+    results = verify_all_chains_streaming(
+        db_session, workers=1, resume=False, archive_dir=tmp_path
+    )
+
+    assert [(r.chain_key, r.ok, r.entries_checked) for r in results] == [
+        (CHAIN_A, True, 4),
+        (f"tenant:{TENANT_B}", True, 3),
+    ]
+
+
+def test_live_rows_must_link_to_archived_prefix(db_session, tmp_path):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 6)
+    entries = live_entries(db_session)
+
+    # Archive only the first 2 entries, then drop 4: entries 3-4 are
+    # neither archived nor live, so the live chain no longer links
+    cut = entries[2].created_at
+    archive_range(db_session, cut - timedelta(hours=1), cut, archive_dir=tmp_path)
+    db_session.execute(
+        text("DELETE FROM authorization_audit_logs WHERE id <= :id"),
+        {"id": entries[3].id},
+    )
+    db_session.commit()
+
+    result = verify_chain_streaming(
+        db_session, CHAIN_A, resume=False, archive_dir=tmp_path
+    )
+    assert (result.first_bad_id, result.reason) == (entries[4].id, "broken_link")
+
+
+def test_archived_and_live_copies_must_match(db_session, tmp_path):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 6)
+    archive_range(db_session, *last_hour(), archive_dir=tmp_path)
+
+    # Rows stay live (append-only table): each entry is walked once
+    result = verify_chain_with_archive(db_session, CHAIN_A, archive_dir=tmp_path)
+    assert result.ok and result.entries_checked == 6
+
+    tampered = live_entries(db_session)[2].id
+    db_session.execute(
+        text("UPDATE authorization_audit_logs SET reason = 'forged' WHERE id = :id"),
+        {"id": tampered},
+    )
+    db_session.commit()
+
+    result = verify_chain_with_archive(db_session, CHAIN_A, archive_dir=tmp_path)
+    assert (result.first_bad_id, result.reason) == (tampered, "archive_mismatch")
+
+
+def test_corrupted_segment_is_detected(db_session, tmp_path):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 4)
+    info = archive_range(db_session, *last_hour(), archive_dir=tmp_path)
+    db_session.execute(text("DELETE FROM authorization_audit_logs"))
+    db_session.commit()
+
+    os.chmod(info.path, 0o644)
+    with open(info.path, "r+b") as f:
+        f.seek(12)  # inside the first column chunk
+        byte = f.read(1)
+        f.seek(12)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    result = verify_chain_with_archive(db_session, CHAIN_A, archive_dir=tmp_path)
+    assert result.reason == "archive_corrupt"
+
+    with open(info.path, "r+b") as f:
+        data = bytearray(f.read())
+        data[data.index(b'"rows":4') + 7] = ord("5")  # forge the footer
+        f.seek(0)
+        f.write(data)
+
+    with pytest.raises(ArchiveIntegrityError, match="signature"):
+        ArchiveSegment(info.path)
+
+
+def test_detached_partition_is_archived_then_dropped(db_session, tmp_path):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 3)
+
+    name = "audit_log_ptest_2026_08"
+    db_session.execute(
+        text(f"CREATE TABLE {name} (LIKE authorization_audit_logs INCLUDING ALL)")
+    )
+    db_session.execute(
+        text(
+            f"INSERT INTO {name} SELECT * FROM authorization_audit_logs; "
+            f"UPDATE {name} SET created_at = '2026-08-15 12:00:00+00'"
+        )
+    )
+    db_session.commit()
+
+    info = archive_detached_partition(
+        db_session, name, archive_dir=tmp_path, table_name="audit_log_ptest"
+    )
+
+    assert info.rows == 3
+    assert info.path.endswith("20260801T000000Z-20260901T000000Z.aseg")
+    assert db_session.scalar(text("SELECT to_regclass(:name)"), {"name": name}) is None
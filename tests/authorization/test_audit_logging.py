@@ -157,3 +157,60 @@ def test_audit_failure_does_not_break_authorization(
     )
 
     assert response.status_code in (200, 403)
+
+
+def test_audit_write_does_not_expire_request_objects(client, db_session):
+    from sqlalchemy import event
+
+    from app.core.database import engine
+
+    token = login_and_get_token(
+        client,
+        email="admin3@test.com",
+        password="password123",
+    )
+    user_id = db_session.execute(
+        text("SELECT id FROM users WHERE email = :email"),
+        {"email": "admin3@test.com"},
+    ).scalar_one()
+    db_session.execute(
+        text(
+            """
+            INSERT INTO roles (name, tenant_id)
+            SELECT 'admin', tenant_id FROM users WHERE id = :user_id
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"user_id": user_id},
+    )
+    db_session.execute(
+        text(
+            """
+            INSERT INTO user_roles (user_id, role_id)
+            SELECT u.id, r.id FROM users u
+            JOIN roles r ON r.tenant_id = u.tenant_id AND r.name = 'admin'
+            WHERE u.id = :user_id
+            """
+        ),
+        {"user_id": user_id},
+    )
+    db_session.commit()
+
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/admin/dashboard", headers=headers).status_code == 200
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # Warm caches; the handler reads current_user.email after the
+    # decision was audited
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get("/admin/dashboard", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert response.json() == {"msg": "Welcome admin admin3@test.com"}
+    assert not [s for s in statements if "FROM users" in s]
@@ -0,0 +1,182 @@
+# tests/authorization/test_audit_merkle.py
+
+import uuid
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import text
+
+from app.core.merkle import inclusion_path, leaf_hash, merkle_root, verify_inclusion
+from app.core.security import create_access_token
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.audit_segment import AuditMerkleSegment
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services import audit_service
+from app.services.audit_merkle import (
+    ProofUnavailable,
+    inclusion_proof,
+    seal_all_segments,
+    seal_chain_segments,
+    verify_inclusion_proof,
+)
+
+TENANT_ID = 9
+CHAIN_KEY = f"tenant:{TENANT_ID}"
+
+
+def clear_audit_tables(db_session):
+    db_session.execute(text("DELETE FROM authorization_audit_logs"))
+    db_session.execute(text("DELETE FROM audit_chain_heads"))
+    db_session.execute(text("DELETE FROM audit_merkle_segments"))
+    db_session.commit()
+
+
+def log_decisions(db_session, count: int):
+    for i in range(count):
+        audit_service.log_authorization_decision(
+            db=db_session,
+            user_id=i,
+            tenant_id=TENANT_ID,
+            permission="users:read",
+            allowed=True,
+            reason="permission granted",
+            context={"resource_owner_id": i},
+        )
+
+
+def chain_ids(db_session) -> list[int]:
+    return [
+        row.id
+        for row in db_session.query(AuthorizationAuditLog.id)
+        .filter(AuthorizationAuditLog.chain_key == CHAIN_KEY)
+        .order_by(AuthorizationAuditLog.id)
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 8, 13])
+def test_rfc9162_inclusion_round_trip(size):
+    leaves = [leaf_hash(str(i).encode()) for i in range(size)]
+    root = merkle_root(leaves)
+
+    for index in range(size):
+        path = inclusion_path(leaves, index)
+        assert len(path) <= (size - 1).bit_length()
+        assert verify_inclusion(
+            leaf=leaves[index], index=index, tree_size=size, path=path, root=root
+        )
+        assert not verify_inclusion(
+            leaf=leaf_hash(b"forged"),
+            index=index,
+            tree_size=size,
+            path=path,
+            root=root,
+        )
+
+
+def test_only_complete_segments_are_sealed(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 10)
+
+    assert seal_chain_segments(db_session, CHAIN_KEY, segment_size=4) == 2
+    # Nothing new to seal; the 2-entry tail waits
+    assert seal_chain_segments(db_session, CHAIN_KEY, segment_size=4) == 0
+
+    log_decisions(db_session, 2)
+    assert seal_all_segments(db_session, segment_size=4) == {CHAIN_KEY: 1}
+
+    segments = (
+        db_session.query(AuditMerkleSegment)
+        .filter(AuditMerkleSegment.chain_key == CHAIN_KEY)
+        .order_by(AuditMerkleSegment.segment_index)
+        .all()
+    )
+    ids = chain_ids(db_session)
+    assert [(s.first_id, s.last_id) for s in segments] == [
+        (ids[0], ids[3]),
+        (ids[4], ids[7]),
+        (ids[8], ids[11]),
+    ]
+
+
+def test_inclusion_proof_for_single_entry(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 16)
+    seal_chain_segments(db_session, CHAIN_KEY, segment_size=8)
+
+    ids = chain_ids(db_session)
+    proof = inclusion_proof(db_session, ids[11])
+
+    assert proof.segment_index == 1
+    assert proof.leaf_index == 3
+    assert len(proof.path) == 3  # log2(8)
+    assert verify_inclusion_proof(proof)
+
+    assert not verify_inclusion_proof(replace(proof, entry_hash="0" * 64))
+    assert not verify_inclusion_proof(replace(proof, root="0" * 64))
+
+
+def test_proof_unavailable_reasons(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 6)
+    seal_chain_segments(db_session, CHAIN_KEY, segment_size=4)
+    ids = chain_ids(db_session)
+
+    with pytest.raises(ProofUnavailable, match="entry_not_found"):
+        inclusion_proof(db_session, ids[-1] + 1000)
+
+    with pytest.raises(ProofUnavailable, match="entry_not_sealed"):
+        inclusion_proof(db_session, ids[5])
+
+    db_session.execute(
+        text("UPDATE authorization_audit_logs SET entry_hash = 'x' WHERE id = :id"),
+        {"id": ids[1]},
+    )
+    db_session.commit()
+
+    with pytest.raises(ProofUnavailable, match="segment_mismatch"):
+        inclusion_proof(db_session, ids[2])
+
+
+def test_tampered_segment_is_not_sealed(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 8)
+    ids = chain_ids(db_session)
+
+    db_session.execute(
+        text("UPDATE authorization_audit_logs SET reason = 'forged' WHERE id = :id"),
+        {"id": ids[6]},
+    )
+    db_session.commit()
+
+    assert seal_chain_segments(db_session, CHAIN_KEY, segment_size=4) == 1
+
+
+def test_admin_proof_endpoint(client, db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 4)
+    seal_chain_segments(db_session, CHAIN_KEY, segment_size=4)
+    entry_id = chain_ids(db_session)[2]
+
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+    admin = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    role = Role(name="admin", tenant_id=tenant.id)
+    role.users.append(admin)
+    db_session.add_all([admin, role])
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(subject=str(admin.id))}"}
+
+    response = client.get(f"/admin/audit/proof/{entry_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["entry_id"] == entry_id
+    assert response.json()["tree_size"] == 4
+
+    response = client.get("/admin/audit/proof/999999999", headers=headers)
+    assert response.status_code == 404
@@ -0,0 +1,154 @@
+# tests/authorization/test_audit_partitions.py
+
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.services import audit_partitions
+from app.services.audit_partitions import (
+    create_partition,
+    detach_partitions_before,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+)
+
+# The test schema comes from create_all (plain table), so partition
+# management is exercised on a scratch partitioned copy of it.
+TABLE = "audit_log_ptest"
+
+
+@pytest.fixture
+def partitioned_table(db_session):
+    db_session.execute(
+        text(
+            f"""
+            CREATE OR REPLACE FUNCTION {audit_partitions.IMMUTABILITY_FUNCTION}()
+            RETURNS trigger AS $$
+            BEGIN
+                RAISE EXCEPTION 'authorization_audit_logs are immutable';
+            END;
+            $$ LANGUAGE plpgsql
+            """
+        )
+    )
+    db_session.execute(
+        text(
+            f"CREATE TABLE {TABLE} (LIKE authorization_audit_logs INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+    )
+    db_session.execute(
+        text(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+    )
+    db_session.commit()
+
+    yield TABLE
+
+    db_session.rollback()
+    leftovers = db_session.scalars(
+        text("SELECT tablename FROM pg_tables WHERE tablename LIKE :prefix"),
+        {"prefix": f"{TABLE}%"},
+    ).all()
+    for name in leftovers:
+        db_session.execute(text(f"DROP TABLE IF EXISTS {name} CASCADE"))
+    db_session.execute(
+        text(f"DROP FUNCTION IF EXISTS {audit_partitions.IMMUTABILITY_FUNCTION}()")
+    )
+    db_session.commit()
+
+
+def insert_entry(db_session, table: str, created_at: str, chain_key="tenant:77"):
+    return db_session.execute(
+        text(
+            f"INSERT INTO {table} "
+            "(permission, allowed, integrity_ok, entry_hash, signature, "
+            "chain_key, created_at) "
+            "VALUES ('users:read', true, true, 'h', 's', :chain_key, :created_at) "
+            "RETURNING tableoid::regclass::text"
+        ),
+        {"chain_key": chain_key, "created_at": created_at},
+    ).scalar_one()
+
+
+def test_noop_on_unpartitioned_table(db_session):
+    assert not is_partitioned(db_session)
+
+    result = ensure_partitions(db_session, months_ahead=2)
+    assert result.created == [] and result.skipped == {}
+
+
+def test_window_is_precreated_idempotently(db_session, partitioned_table):
+    result = ensure_partitions(
+        db_session, months_ahead=2, today=date(2026, 11, 20), table=partitioned_table
+    )
+    assert result.created == [
+        f"{TABLE}_2026_11",
+        f"{TABLE}_2026_12",
+        f"{TABLE}_2027_01",
+    ]
+
+    again = ensure_partitions(
+        db_session, months_ahead=2, today=date(2026, 11, 20), table=partitioned_table
+    )
+    assert again.created == []
+
+    assert insert_entry(db_session, TABLE, "2026-12-05") == f"{TABLE}_2026_12"
+    db_session.commit()
+
+    # Immutability triggers are installed on each partition
+    with pytest.raises(DBAPIError, match="immutable"):
+        db_session.execute(text(f"UPDATE {TABLE} SET reason = 'forged'"))
+    db_session.rollback()
+
+    with pytest.raises(DBAPIError, match="immutable"):
+        db_session.execute(text(f"DELETE FROM {TABLE}"))
+    db_session.rollback()
+
+
+def test_month_with_rows_in_default_partition_is_skipped(db_session, partitioned_table):
+    insert_entry(db_session, TABLE, "2027-01-02")
+    db_session.commit()
+
+    result = ensure_partitions(
+        db_session, months_ahead=2, today=date(2026, 11, 1), table=partitioned_table
+    )
+
+    assert result.created == [f"{TABLE}_2026_11", f"{TABLE}_2026_12"]
+    assert result.skipped == {f"{TABLE}_2027_01": "rows_in_default_partition"}
+
+
+def test_detach_waits_for_verified_chains(db_session, partitioned_table, monkeypatch):
+    for month in (date(2026, 8, 1), date(2026, 9, 1)):
+        create_partition(db_session, month, table=partitioned_table)
+    db_session.commit()
+    insert_entry(db_session, TABLE, "2026-08-10")
+    db_session.commit()
+
+    result = detach_partitions_before(
+        db_session, date(2026, 9, 1), table=partitioned_table
+    )
+    assert result.detached == []
+    assert result.skipped == {f"{TABLE}_2026_08": "unverified:tenant:77"}
+
+    monkeypatch.setattr(
+        audit_partitions, "verified_through", lambda db, chain_key: 10**9
+    )
+    result = detach_partitions_before(
+        db_session, date(2026, 9, 1), table=partitioned_table
+    )
+    assert result.detached == [f"{TABLE}_2026_08"]
+    assert list(list_partitions(db_session, partitioned_table)) == [f"{TABLE}_2026_09"]
+
+    # Detached partition keeps its rows and its own triggers
+    triggers = db_session.scalar(
+        text(
+            "SELECT COUNT(*) FROM pg_trigger "
+            "WHERE tgrelid = to_regclass(:name) AND NOT tgisinternal"
+        ),
+        {"name": f"{TABLE}_2026_08"},
+    )
+    assert triggers == 2
+    assert db_session.scalar(text(f"SELECT COUNT(*) FROM {TABLE}_2026_08")) == 1
@@ -0,0 +1,177 @@
+# tests/authorization/test_audit_verifier_streaming.py
+
+import uuid
+
+from sqlalchemy import text
+
+from app.core.security import create_access_token
+from app.models.audit_checkpoint import AuditVerificationCheckpoint
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services import audit_service
+from app.services.audit_verifier import (
+    verify_all_chains_streaming,
+    verify_chain,
+    verify_chain_streaming,
+)
+
+TENANT_ID = 7
+CHAIN_KEY = f"tenant:{TENANT_ID}"
+
+
+def clear_audit_tables(db_session):
+    db_session.execute(text("DELETE FROM authorization_audit_logs"))
+    db_session.execute(text("DELETE FROM audit_chain_heads"))
+    db_session.execute(text("DELETE FROM audit_verification_checkpoints"))
+    db_session.commit()
+
+
+def log_decisions(db_session, count: int, tenant_id: int | None = TENANT_ID):
+    for i in range(count):
+        audit_service.log_authorization_decision(
+            db=db_session,
+            user_id=i,
+            tenant_id=tenant_id,
+            permission="users:read",
+            allowed=bool(i % 2),
+            reason="permission granted" if i % 2 else "permission_denied",
+            context={"resource_owner_id": i},
+        )
+
+
+def chain_ids(db_session) -> list[int]:
+    return [
+        row.id
+        for row in db_session.query(AuthorizationAuditLog.id)
+        .filter(AuthorizationAuditLog.chain_key == CHAIN_KEY)
+        .order_by(AuthorizationAuditLog.id)
+    ]
+
+
+def test_streaming_matches_full_walk_and_resumes(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 23)
+
+    first = verify_chain_streaming(db_session, CHAIN_KEY, range_size=4)
+    reference = verify_chain(db_session, CHAIN_KEY)
+
+    assert first.ok and reference.ok
+    assert first.entries_checked == reference.entries_checked == 23
+    assert first.last_hash == reference.last_hash
+    assert first.resumed_entries == 0
+
+    checkpoint = db_session.get(AuditVerificationCheckpoint, CHAIN_KEY)
+    assert checkpoint.last_id == chain_ids(db_session)[-1]
+    assert checkpoint.entries_verified == 23
+
+    log_decisions(db_session, 5)
+
+    second = verify_chain_streaming(db_session, CHAIN_KEY, range_size=4)
+    assert second.ok
+    assert second.resumed_entries == 23
+    assert second.entries_checked == 28
+
+
+def test_tampered_row_fails_and_keeps_checkpoint(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 10)
+    assert verify_chain_streaming(db_session, CHAIN_KEY, range_size=3).ok
+
+    log_decisions(db_session, 6)
+    tampered = chain_ids(db_session)[12]
+    db_session.execute(
+        text("UPDATE authorization_audit_logs SET reason = 'forged' WHERE id = :id"),
+        {"id": tampered},
+    )
+    db_session.commit()
+
+    result = verify_chain_streaming(db_session, CHAIN_KEY, range_size=3)
+    assert not result.ok
+    assert (result.first_bad_id, result.reason) == (tampered, "bad_signature")
+
+    db_session.expire_all()
+    checkpoint = db_session.get(AuditVerificationCheckpoint, CHAIN_KEY)
+    assert checkpoint.entries_verified == 10
+
+
+def test_broken_link_at_range_boundary(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 9)
+
+    # First row of the third range (range_size=3) no longer links back
+    boundary = chain_ids(db_session)[6]
+    db_session.execute(
+        text("UPDATE authorization_audit_logs SET prev_hash = 'x' WHERE id = :id"),
+        {"id": boundary},
+    )
+    db_session.commit()
+
+    result = verify_chain_streaming(db_session, CHAIN_KEY, range_size=3)
+    assert (result.first_bad_id, result.reason) == (boundary, "broken_link")
+
+
+def test_forged_checkpoint_is_ignored(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 6)
+    assert verify_chain_streaming(db_session, CHAIN_KEY, range_size=4).ok
+
+    # Skip-ahead attempt: claim more rows were already verified
+    db_session.execute(
+        text(
+            "UPDATE audit_verification_checkpoints "
+            "SET last_id = last_id + 1000 WHERE chain_key = :key"
+        ),
+        {"key": CHAIN_KEY},
+    )
+    db_session.commit()
+
+    result = verify_chain_streaming(db_session, CHAIN_KEY, range_size=4)
+    assert result.ok
+    assert result.resumed_entries == 0
+    assert result.entries_checked == 6
+
+
+def test_process_pool_verifies_all_chains(db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 12)
+    log_decisions(db_session, 5, tenant_id=None)
+
+    results = verify_all_chains_streaming(
+        db_session, workers=2, range_size=5, resume=False
+    )
+
+    assert {r.chain_key: r.entries_checked for r in results} == {
+        "global": 5,
+        CHAIN_KEY: 12,
+    }
+    assert all(r.ok for r in results)
+
+
+def test_admin_verify_endpoint(client, db_session):
+    clear_audit_tables(db_session)
+    log_decisions(db_session, 4)
+
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+    admin = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    role = Role(name="admin", tenant_id=tenant.id)
+    role.users.append(admin)
+    db_session.add_all([admin, role])
+    db_session.commit()
+
+    token = create_access_token(subject=str(admin.id))
+    response = client.post(
+        "/admin/audit/verify", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ok"] is True
+    assert CHAIN_KEY in [chain["chain_key"] for chain in body["chains"]]
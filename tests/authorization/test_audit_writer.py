@@ -0,0 +1,202 @@
+# tests/authorization/test_audit_writer.py
+
+import asyncio
+import threading
+
+from sqlalchemy import text
+
+from app.core.audit_signing import compute_entry_hash
+from app.core.metrics import collect_metrics
+from app.models.audit_log import AuthorizationAuditLog
+from app.services import audit_service
+from app.services.audit_chain import ChainConflictError
+from app.services.audit_writer import AuditWriter
+
+
+def clear_audit_logs(db_session):
+    db_session.execute(text("DELETE FROM authorization_audit_logs"))
+    db_session.execute(text("DELETE FROM audit_chain_heads"))
+    db_session.commit()
+
+
+def make_writer(**overrides) -> AuditWriter:
+    options = dict(
+        sink=audit_service.persist_authorization_batch,
+        batch_size=10,
+        flush_interval=0.05,
+        queue_size=100,
+        enqueue_timeout=0.01,
+    )
+    options.update(overrides)
+    return AuditWriter(**options)
+
+
+def log_decision(db_session, index: int) -> None:
+    audit_service.log_authorization_decision(
+        db=db_session,
+        user_id=index,
+        tenant_id=1,
+        permission="users:read",
+        allowed=index % 2 == 0,
+        reason="permission_denied",
+        endpoint="/users/",
+        method="GET",
+    )
+
+
+def test_batched_entries_are_committed_as_one_chain(db_session, monkeypatch):
+    clear_audit_logs(db_session)
+    writer = make_writer()
+    monkeypatch.setattr(audit_service, "audit_writer", writer)
+    writer.start()
+
+    for i in range(25):
+        log_decision(db_session, i)
+
+    writer.stop()
+
+    logs = (
+        db_session.query(AuthorizationAuditLog).order_by(AuthorizationAuditLog.id).all()
+    )
+    assert [log.user_id for log in logs] == list(range(25))
+    assert writer.stats()["entries_written"] == 25
+    assert writer.stats()["batches_written"] < 25
+
+    prev_hash = None
+    for log in logs:
+        assert log.integrity_ok is True
+        assert log.prev_hash == prev_hash
+        assert log.entry_hash == compute_entry_hash(
+            prev_hash=prev_hash, signature=log.signature
+        )
+        prev_hash = log.entry_hash
+
+
+def test_full_queue_falls_back_to_inline_write(db_session, monkeypatch):
+    clear_audit_logs(db_session)
+    writer = make_writer(queue_size=1)
+    monkeypatch.setattr(audit_service, "audit_writer", writer)
+
+    # Worker "running" but stalled: the queue never drains
+    monkeypatch.setattr(AuditWriter, "running", property(lambda self: True))
+    writer.submit({"stalled": True})
+
+    log_decision(db_session, 7)
+
+    assert writer.stats()["rejected"] == 1
+    logs = db_session.query(AuthorizationAuditLog).all()
+    assert [log.user_id for log in logs] == [7]
+
+
+def test_async_fallback_never_blocks_the_event_loop(db_session, monkeypatch):
+    clear_audit_logs(db_session)
+    writer = make_writer(queue_size=1, enqueue_timeout=0.2)
+    monkeypatch.setattr(audit_service, "audit_writer", writer)
+    monkeypatch.setattr(AuditWriter, "running", property(lambda self: True))
+    writer.submit({"stalled": True})
+
+    threads = []
+    blocking_submit = writer.submit
+    append_batch = audit_service._append_batch
+
+    def record(fn):
+        def wrapper(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(writer, "submit", record(blocking_submit))
+    monkeypatch.setattr(audit_service, "_append_batch", record(append_batch))
+
+    async def main():
+        await audit_service.log_authorization_decision_async(
+            db=None,
+            user_id=9,
+            tenant_id=1,
+            permission="users:read",
+            allowed=True,
+            reason="ok",
+        )
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+
+    # Blocking put + inline append both ran, neither on the loop
+    assert len(threads) == 2
+    assert loop_thread not in threads
+    logs = db_session.query(AuthorizationAuditLog).all()
+    assert [log.user_id for log in logs] == [9]
+
+
+def test_inline_write_retries_a_chain_conflict(db_session, monkeypatch):
+    clear_audit_logs(db_session)
+    append_batch = audit_service._append_batch
+    calls = []
+
+    def conflict_once(db, payloads):
+        calls.append(1)
+        if len(calls) == 1:
+            raise ChainConflictError("tenant:1")
+        return append_batch(db, payloads)
+
+    monkeypatch.setattr(audit_service, "_append_batch", conflict_once)
+    retries = audit_service.inline_writes["retries"]
+
+    log_decision(db_session, 3)
+
+    assert len(calls) == 2
+    assert audit_service.inline_writes["retries"] == retries + 1
+    logs = db_session.query(AuthorizationAuditLog).all()
+    assert [log.user_id for log in logs] == [3]
+
+
+def test_inline_write_failure_is_logged_and_counted(db_session, monkeypatch, caplog):
+    clear_audit_logs(db_session)
+
+    def always_conflict(db, payloads):
+        raise ChainConflictError("tenant:1")
+
+    monkeypatch.setattr(audit_service, "_append_batch", always_conflict)
+    monkeypatch.setattr(audit_service.time, "sleep", lambda seconds: None)
+    dropped = audit_service.inline_writes["dropped_entries"]
+
+    log_decision(db_session, 5)
+
+    assert audit_service.inline_writes["dropped_entries"] == dropped + 1
+    assert collect_metrics()["audit_inline"]["dropped_entries"] == dropped + 1
+    assert "dropped authorization decision" in caplog.text
+    assert "'user_id': 5" in caplog.text
+
+
+def test_items_racing_stop_are_written_or_rejected():
+    written = []
+    writer = make_writer(sink=written.extend, queue_size=10_000)
+    writer.start()
+
+    accepted = []
+    started = threading.Barrier(5)
+
+    def produce(worker: int) -> None:
+        started.wait()
+        for i in range(2_000):
+            if writer.submit((worker, i)):
+                accepted.append((worker, i))
+
+    producers = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+    for producer in producers:
+        producer.start()
+    started.wait()
+    writer.stop()
+    for producer in producers:
+        producer.join()
+
+    # Nothing accepted is left stranded in the queue after the drain
+    assert sorted(written) == sorted(accepted)
+    stats = writer.stats()
+    assert stats["queue_depth"] == 0
+    assert stats["enqueued"] == stats["entries_written"] == len(accepted)
+    assert stats["rejected"] == 4 * 2_000 - len(accepted)
+
+    assert writer.submit("late") is False
+    assert writer.submit_nowait("late") is False
@@ -0,0 +1,169 @@
+# tests/authorization/test_bulk_authorization.py
+
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from app.core import authorization
+from app.core.authorization import (
+    AuthorizationError,
+    AuthorizationRequest,
+    resolve_permission,
+    resolve_permissions_bulk,
+)
+from app.core.database import engine, get_db
+from app.core.permissions import Permission
+from app.core.security import create_access_token
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.routers import users as tenant_users
+from app.services import user_service
+from app.services.audit_verifier import verify_chain
+
+
+def clear_audit_tables(db_session):
+    db_session.execute(text("DELETE FROM authorization_audit_logs"))
+    db_session.execute(text("DELETE FROM audit_chain_heads"))
+    db_session.commit()
+
+
+def create_tenant_with_users(db_session, count: int, role_name: str = "user"):
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    users = [
+        User(
+            email=f"{uuid.uuid4()}@example.com",
+            hashed_password="fakehashed",
+            tenant_id=tenant.id,
+        )
+        for _ in range(count)
+    ]
+    role = Role(name=role_name, tenant_id=tenant.id)
+    role.users.append(users[0])
+    db_session.add_all([*users, role])
+    db_session.commit()
+
+    return tenant, users
+
+
+def test_bulk_matches_single_resolver(db_session):
+    tenant, users = create_tenant_with_users(db_session, 3)
+    caller = users[0]
+
+    requests = [
+        AuthorizationRequest(Permission.USERS_READ, caller.id),
+        AuthorizationRequest(Permission.USERS_READ, users[1].id),
+        AuthorizationRequest(Permission.USERS_DELETE, caller.id),
+        AuthorizationRequest(Permission.ITEMS_READ),
+    ]
+
+    decisions = resolve_permissions_bulk(user=caller, tenant=tenant, requests=requests)
+
+    assert [d.allowed for d in decisions] == [True, False, False, True]
+    assert [d.resource_owner_id for d in decisions] == [
+        caller.id,
+        users[1].id,
+        caller.id,
+        None,
+    ]
+
+    for request, decision in zip(requests, decisions):
+        try:
+            resolve_permission(
+                user=caller,
+                tenant=tenant,
+                permission=request.permission,
+                resource_owner_id=request.resource_owner_id,
+            )
+            expected = "permission granted"
+        except AuthorizationError as e:
+            expected = str(e)
+
+        assert decision.reason == expected
+
+
+def test_bulk_compiles_role_mask_once(db_session, monkeypatch):
+    tenant, users = create_tenant_with_users(db_session, 1)
+    calls = []
+    original = authorization.mask_for_roles
+
+    def counting(role_names):
+        calls.append(1)
+        return original(role_names)
+
+    monkeypatch.setattr(authorization, "mask_for_roles", counting)
+
+    resolve_permissions_bulk(
+        user=users[0],
+        tenant=tenant,
+        requests=[AuthorizationRequest(Permission.USERS_READ, i) for i in range(50)],
+    )
+
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("role_name, visible", [("user", 1), ("nobody", 0)])
+def test_list_endpoint_filters_page_with_one_audit_batch(
+    client, db_session, role_name, visible
+):
+    clear_audit_tables(db_session)
+    tenant, users = create_tenant_with_users(db_session, 4, role_name=role_name)
+    token = create_access_token(subject=str(users[0].id))
+
+    commits = []
+
+    def on_commit(conn):
+        commits.append(1)
+
+    event.listen(engine, "commit", on_commit)
+    try:
+        response = client.get("/users/", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        event.remove(engine, "commit", on_commit)
+
+    assert response.status_code == 200
+    assert [u["id"] for u in response.json()] == [u.id for u in users[:visible]]
+
+    # Whole page audited as ONE decision, on the tenant's chain
+    assert len(commits) == 1
+
+    rows = (
+        db_session.query(AuthorizationAuditLog)
+        .filter(AuthorizationAuditLog.tenant_id == tenant.id)
+        .all()
+    )
+    assert [(r.allowed, r.context) for r in rows] == [
+        (bool(visible), str({"rows": len(users), "allowed_rows": visible}))
+    ]
+    assert verify_chain(db_session, f"tenant:{tenant.id}").ok
+
+
+def test_tenant_router_keeps_route_level_gate(db_session, monkeypatch):
+    _, users = create_tenant_with_users(db_session, 3, role_name="nobody")
+    token = create_access_token(subject=str(users[0].id))
+
+    app = FastAPI()
+    app.include_router(tenant_users.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    listed = []
+    original = user_service.list_users
+
+    def recording(*args, **kwargs):
+        listed.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(user_service, "list_users", recording)
+
+    with TestClient(app) as client:
+        response = client.get("/users/", headers={"Authorization": f"Bearer {token}"})
+
+    # Denied before the tenant's users are even read
+    assert response.status_code == 403
+    assert listed == []
@@ -0,0 +1,47 @@
+# tests/authorization/test_permission_masks.py
+
+import pytest
+
+from app.core import permission_masks
+from app.core.permissions import Permission
+from app.core.role_permissions import ROLE_PERMISSIONS
+from app.core.permission_masks import (
+    compile_permission_mask,
+    mask_allows,
+    mask_for_roles,
+    permission_matches,
+)
+
+
+@pytest.mark.parametrize("role_name", sorted(ROLE_PERMISSIONS))
+@pytest.mark.parametrize("required", list(Permission))
+def test_compiled_mask_matches_legacy_resolution(role_name, required):
+    granted = ROLE_PERMISSIONS[role_name]
+    expected = any(permission_matches(p, required) for p in granted)
+
+    assert mask_allows(mask_for_roles([role_name]), required) is expected
+
+
+def test_wildcard_is_expanded_at_compile_time():
+    mask = compile_permission_mask({Permission.USERS_ALL})
+
+    assert mask_allows(mask, Permission.USERS_READ)
+    assert mask_allows(mask, Permission.USERS_DELETE)
+    assert mask_allows(mask, Permission.USERS_ALL)
+    assert not mask_allows(mask, Permission.ITEMS_READ)
+
+
+def test_unknown_roles_grant_nothing():
+    assert mask_for_roles(["does-not-exist"]) == 0
+
+
+def test_role_table_can_be_recompiled(monkeypatch):
+    monkeypatch.setitem(ROLE_PERMISSIONS, "auditor", {Permission.TENANT_READ})
+    permission_masks.compile_role_masks()
+    try:
+        assert mask_allows(mask_for_roles(["auditor"]), Permission.TENANT_READ)
+    finally:
+        monkeypatch.undo()
+        permission_masks.compile_role_masks()
+
+    assert mask_for_roles(["auditor"]) == 0
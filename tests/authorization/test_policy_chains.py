@@ -0,0 +1,106 @@
+# tests/authorization/test_policy_chains.py
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import authorization
+from app.core.authorization import (
+    AuthorizationError,
+    POLICY_REGISTRY,
+    compile_policy_chains,
+    resolve_permission,
+)
+from app.core.permissions import Permission
+from app.core.policies.tenant_policy import BasePolicy, TenantIsolationPolicy
+
+
+class RecordingPolicy(BasePolicy):
+    def __init__(self, name: str, priority: int, allow: bool, calls: list[str]):
+        self.name = name
+        self.priority = priority
+        self.allow = allow
+        self.calls = calls
+
+    def allows(self, *, user, tenant, resource_owner_id=None) -> bool:
+        self.calls.append(self.name)
+        return self.allow
+
+
+def make_admin(tenant_id: int = 1):
+    return SimpleNamespace(
+        id=1,
+        tenant_id=tenant_id,
+        roles=[SimpleNamespace(name="admin")],
+    )
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Temporarily replace TENANT_READ's chain, restoring it afterwards."""
+    yield lambda policies: monkeypatch.setitem(
+        POLICY_REGISTRY, Permission.TENANT_READ, policies
+    )
+    monkeypatch.undo()
+    compile_policy_chains()
+
+
+def test_policies_run_in_declared_priority_order(registry):
+    calls: list[str] = []
+    registry(
+        [
+            RecordingPolicy("low", priority=1, allow=True, calls=calls),
+            RecordingPolicy("high", priority=50, allow=True, calls=calls),
+        ]
+    )
+    compile_policy_chains()
+
+    resolve_permission(
+        user=make_admin(),
+        tenant=SimpleNamespace(id=1),
+        permission=Permission.TENANT_READ,
+    )
+
+    assert calls == ["high", "low"]
+
+
+def test_chain_stops_at_first_denying_policy(registry):
+    calls: list[str] = []
+    registry(
+        [
+            RecordingPolicy("deny", priority=10, allow=False, calls=calls),
+            RecordingPolicy("never", priority=0, allow=True, calls=calls),
+        ]
+    )
+    compile_policy_chains()
+
+    with pytest.raises(AuthorizationError) as exc:
+        resolve_permission(
+            user=make_admin(),
+            tenant=SimpleNamespace(id=1),
+            permission=Permission.TENANT_READ,
+        )
+
+    assert exc.value.reason == "policy_denied"
+    assert exc.value.context["policy"] == "RecordingPolicy"
+    assert calls == ["deny"]
+
+
+def test_registry_changes_need_recompile(registry):
+    calls: list[str] = []
+    registry([RecordingPolicy("late", priority=0, allow=False, calls=calls)])
+
+    # Not compiled yet: the frozen chain still only has tenant isolation
+    resolve_permission(
+        user=make_admin(),
+        tenant=SimpleNamespace(id=1),
+        permission=Permission.TENANT_READ,
+    )
+    assert calls == []
+
+
+def test_compiled_chains_are_frozen():
+    assert TenantIsolationPolicy.priority > BasePolicy.priority
+
+    with pytest.raises(TypeError):
+        authorization.COMPILED_POLICY_CHAINS[Permission.TENANT_READ] = None
@@ -0,0 +1,113 @@
+# tests/authorization/test_principal_snapshots.py
+
+import dataclasses
+import uuid
+
+import pytest
+
+from app.core import authorization, permission_masks
+from app.core.authorization import AuthorizationError, as_principal, resolve_permission
+from app.core.permission_masks import mask_allows
+from app.core.permissions import Permission
+from app.core.principal import Principal, TenantRef
+from app.core.principal_cache import principal_cache
+from app.core.role_permissions import ROLE_PERMISSIONS
+from app.core.security_context import load_principal
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+
+
+def create_user(db_session, role_name: str = "user") -> tuple[int, int]:
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    role = Role(name=role_name, tenant_id=tenant.id)
+    role.users.append(user)
+    db_session.add_all([user, role])
+    db_session.commit()
+
+    return tenant.id, user.id
+
+
+def test_snapshots_are_slotted_and_immutable():
+    principal = Principal.build(id=1, tenant_id=2, role_names=["user"])
+    tenant = TenantRef(id=2, name="t", created_at=None)
+
+    for snapshot in (principal, tenant):
+        assert not hasattr(snapshot, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.id = 3
+
+
+def test_principal_is_built_from_one_core_row_load(db_session):
+    tenant_id, user_id = create_user(db_session, "admin")
+    db_session.expunge_all()
+    principal_cache.clear()
+
+    cached, tenant = load_principal(db_session, user_id)
+
+    assert cached.principal.id == user_id
+    assert cached.principal.tenant_id == tenant_id
+    assert cached.principal.role_names == ("admin",)
+    assert mask_allows(cached.principal.permission_mask, Permission.ADMIN_DASHBOARD)
+    assert tenant == TenantRef(
+        id=tenant_id, name=tenant.name, created_at=tenant.created_at
+    )
+
+    # Core rows only: nothing was added to the session's identity map
+    assert len(db_session.identity_map) == 0
+    assert principal_cache.get(user_id).principal is cached.principal
+
+
+def test_engine_uses_the_compiled_mask(monkeypatch):
+    principal = Principal.build(id=1, tenant_id=1, role_names=["admin"])
+
+    def never(role_names):
+        raise AssertionError("mask recompiled")
+
+    monkeypatch.setattr(authorization, "mask_for_roles", never)
+    monkeypatch.setattr(permission_masks, "mask_for_roles", never)
+
+    resolve_permission(
+        user=principal,
+        tenant=TenantRef(id=1, name="t", created_at=None),
+        permission=Permission.TENANT_ADMIN,
+    )
+
+    with pytest.raises(AuthorizationError):
+        resolve_permission(
+            user=principal,
+            tenant=TenantRef(id=2, name="other", created_at=None),
+            permission=Permission.TENANT_ADMIN,
+        )
+
+
+def test_orm_users_are_converted(db_session):
+    _, user_id = create_user(db_session)
+    user = db_session.get(User, user_id)
+
+    principal = as_principal(user)
+
+    assert isinstance(principal, Principal)
+    assert principal.role_names == ("user",)
+    assert as_principal(principal) is principal
+
+
+def test_role_table_recompile_reaches_cached_principals(monkeypatch):
+    principal = Principal.build(id=1, tenant_id=1, role_names=["auditor"])
+    assert principal.current_mask == 0
+
+    monkeypatch.setitem(ROLE_PERMISSIONS, "auditor", {Permission.TENANT_READ})
+    permission_masks.compile_role_masks()
+    try:
+        assert mask_allows(principal.current_mask, Permission.TENANT_READ)
+    finally:
+        monkeypatch.undo()
+        permission_masks.compile_role_masks()
@@ -0,0 +1,341 @@
+# tests/infrastructure/test_async_stack.py
+
+import asyncio
+import importlib
+import uuid
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from starlette.requests import Request
+
+pytest.importorskip("asyncpg")
+
+from app.core import deps_async
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.permissions import Permission
+from app.core.principal_cache import principal_cache
+from app.core.security import (
+    create_access_token,
+    decode_token,
+    get_password_hash,
+    verify_password,
+)
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.schemas.user import UserCreate
+from app.services import auth_service_async, user_service_async
+from app.services.auth_service import AuthError
+
+
+def run(coro_fn):
+    """
+    Run `coro_fn(session)` on a fresh loop + NullPool engine
+    (asyncpg connections are bound to the loop that opened them).
+    """
+
+    async def main():
+        engine = create_async_engine(
+            settings.effective_async_database_url, poolclass=NullPool
+        )
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        try:
+            async with factory() as db:
+                return await coro_fn(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def make_request(path: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "path_params": {},
+            "headers": [],
+            "query_string": b"",
+        }
+    )
+
+
+async def resolve(token: str, db):
+    return await deps_async.get_security_context(
+        request=make_request("/"), token=token, db=db
+    )
+
+
+@pytest.fixture
+def tenant_user(db_session):
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return tenant.id, user.id
+
+
+def test_async_get_current_user_and_cache(tenant_user):
+    tenant_id, user_id = tenant_user
+    token = create_access_token(subject=str(user_id))
+    principal_cache.clear()
+
+    async def scenario(db):
+        first = await resolve(token, db)
+        db.expunge_all()
+        second = await resolve(token, db)
+        return first.user.id, second.user.id, second.tenant_id
+
+    hits_before = principal_cache.stats()["hits"]
+    assert run(scenario) == (user_id, user_id, tenant_id)
+    assert principal_cache.stats()["hits"] == hits_before + 1
+
+
+def test_async_get_current_user_rejects_bad_token():
+    async def scenario(db):
+        await resolve("not-a-jwt", db)
+
+    with pytest.raises(HTTPException) as exc:
+        run(scenario)
+    assert exc.value.status_code == 401
+
+
+def test_async_require_permission_allows_and_audits(tenant_user, db_session):
+    tenant_id, user_id = tenant_user
+    role = Role(name="admin", tenant_id=tenant_id)
+    role.users.append(db_session.get(User, user_id))
+    db_session.add(role)
+    db_session.commit()
+
+    token = create_access_token(subject=str(user_id))
+    checker = deps_async.require_permission(Permission.ADMIN_DASHBOARD)
+
+    async def scenario(db):
+        context = await resolve(token, db)
+        tenant = await deps_async.get_current_user_tenant(context=context)
+        await checker(
+            request=make_request("/admin/dashboard"),
+            context=context,
+            tenant=tenant,
+            db=db,
+        )
+        rows = await db.scalars(
+            select(AuthorizationAuditLog).where(
+                AuthorizationAuditLog.tenant_id == tenant_id
+            )
+        )
+        return [(row.permission, row.allowed) for row in rows]
+
+    assert run(scenario) == [(Permission.ADMIN_DASHBOARD.value, True)]
+
+
+def test_async_require_permission_denies(tenant_user):
+    _, user_id = tenant_user
+    token = create_access_token(subject=str(user_id))
+    checker = deps_async.require_permission(Permission.ADMIN_DASHBOARD)
+
+    async def scenario(db):
+        context = await resolve(token, db)
+        tenant = await deps_async.get_current_user_tenant(context=context)
+        await checker(
+            request=make_request("/admin/dashboard"),
+            context=context,
+            tenant=tenant,
+            db=db,
+        )
+
+    with pytest.raises(HTTPException) as exc:
+        run(scenario)
+    assert exc.value.status_code == 403
+
+
+def test_async_auth_service_flow(tenant_user):
+    tenant_id, _ = tenant_user
+    email = f"{uuid.uuid4()}@example.com"
+
+    async def scenario(db):
+        tenant = await db.get(Tenant, tenant_id)
+        user = await auth_service_async.register_user(
+            db, tenant, UserCreate(email=email, password="Passw0rd!")
+        )
+
+        with pytest.raises(AuthError):
+            await auth_service_async.authenticate_user(db, tenant, email, "wrong")
+
+        tokens = await auth_service_async.authenticate_user(
+            db, tenant, email, "Passw0rd!"
+        )
+        rotated = await auth_service_async.refresh_tokens(
+            db, tenant, tokens.refresh_token
+        )
+
+        with pytest.raises(AuthError):
+            await auth_service_async.refresh_tokens(db, tenant, tokens.refresh_token)
+        # the replay revoked the family, rotated token included
+        with pytest.raises(AuthError):
+            await auth_service_async.refresh_tokens(
+                db, tenant, rotated["refresh_token"]
+            )
+
+        # logout everywhere bumps the epoch embedded in new access tokens
+        assert await auth_service_async.invalidate_sessions(db, user.id) == 1
+        relogin = await auth_service_async.authenticate_user(
+            db, tenant, email, "Passw0rd!"
+        )
+        assert decode_token(relogin.access_token)["epoch"] == 1
+
+        listed = await user_service_async.list_users(db, tenant_id)
+        return user.id, rotated["refresh_token"], [u.email for u in listed]
+
+    user_id, new_refresh, emails = run(scenario)
+
+    assert user_id
+    assert new_refresh
+    assert email in emails
+
+
+def mount_async(monkeypatch, router_module):
+    """
+    `router_module`'s router as mounted under DATABASE_ASYNC_ENABLED
+    (deps re-imported with the flag on), on a NullPool async engine
+    owned by the client's loop. Yields (client, async statements).
+    """
+    from app.core import deps
+
+    monkeypatch.setattr(settings, "database_async_enabled", True)
+    importlib.reload(deps)
+    importlib.reload(router_module)
+
+    engine = create_async_engine(
+        settings.effective_async_database_url, poolclass=NullPool
+    )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def get_db_override():
+        async with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(router_module.router)
+    app.dependency_overrides[get_async_db] = get_db_override
+
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with TestClient(app) as client:
+            yield client, statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        asyncio.run(engine.dispose())
+        monkeypatch.undo()
+        importlib.reload(deps)
+        importlib.reload(router_module)
+
+
+@pytest.fixture
+def async_users_client(monkeypatch):
+    from app.api.v1 import users as users_api
+
+    yield from mount_async(monkeypatch, users_api)
+
+
+@pytest.fixture
+def async_auth_client(monkeypatch):
+    from app.api.v1 import auth_async
+
+    yield from mount_async(monkeypatch, auth_async)
+
+
+def test_async_listing_endpoint_resolves_caller_once(
+    tenant_user, db_session, async_users_client
+):
+    tenant_id, user_id = tenant_user
+    role = Role(name="user", tenant_id=tenant_id)
+    role.users.append(db_session.get(User, user_id))
+    db_session.add(role)
+    db_session.commit()
+
+    client, statements = async_users_client
+    principal_cache.clear()
+    headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+
+    r = client.get("/users/", params={"limit": 1}, headers=headers)
+
+    assert r.status_code == 200
+    assert [u["id"] for u in r.json()] == [user_id]
+    assert "X-Next-Cursor" not in r.headers
+
+    # Context (user, tenant, roles) from ONE async SELECT, shared by
+    # get_current_user and authorize_page
+    selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+    assert len(selects) == 1
+    assert "FROM users" in selects[0] and "tenants" in selects[0]
+
+    # The page's decisions were audited on the caller's tenant chain
+    logs = (
+        db_session.query(AuthorizationAuditLog)
+        .filter(AuthorizationAuditLog.tenant_id == tenant_id)
+        .all()
+    )
+    assert [(log.permission, log.allowed) for log in logs] == [
+        (Permission.USERS_READ.value, True)
+    ]
+
+
+def test_async_change_password_with_cached_principal(
+    tenant_user, db_session, async_auth_client
+):
+    tenant_id, user_id = tenant_user
+    user = db_session.get(User, user_id)
+    user.hashed_password = get_password_hash("Passw0rd!")
+    db_session.commit()
+    client, _ = async_auth_client
+    principal_cache.clear()
+
+    headers = {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+    # Warm the principal cache: the next request's User is merged
+    # from the snapshot, with token_epoch / hashed_password unloaded
+    r = client.post(
+        "/auth/password",
+        json={"current_password": "wrong-pass", "new_password": "N3wPassw0rd!"},
+        headers=headers,
+    )
+    assert r.status_code == 401
+
+    r = client.post(
+        "/auth/password",
+        json={"current_password": "Passw0rd!", "new_password": "N3wPassw0rd!"},
+        headers=headers,
+    )
+
+    assert r.status_code == 200
+    new_access = r.json()["access_token"]
+    assert decode_token(new_access)["epoch"] == 1
+
+    # The old token was ended with the other sessions; the new one works
+    assert client.post("/auth/logout-all", headers=headers).status_code == 401
+    fresh = {"Authorization": f"Bearer {new_access}"}
+    assert client.post("/auth/logout-all", headers=fresh).status_code == 204
+
+    db_session.expire_all()
+    assert verify_password(
+        "N3wPassw0rd!", db_session.get(User, user_id).hashed_password
+    )
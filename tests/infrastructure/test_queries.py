@@ -0,0 +1,84 @@
+# tests/infrastructure/test_queries.py
+
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT
+
+from app.core.database import engine
+from app.core.principal import TenantRef
+from app.core.utils import get_scoped_resource_or_forbid
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services import auth_service, user_service
+
+
+def create_user(db_session) -> tuple[Tenant, User]:
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    role = Role(name="user", tenant_id=tenant.id)
+    role.users.append(user)
+    db_session.add_all([user, role])
+    db_session.commit()
+    return tenant, user
+
+
+def executions(action) -> list:
+    contexts = []
+
+    def before_cursor_execute(conn, cursor, statement, params, context, many):
+        contexts.append(context)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return contexts
+
+
+def test_hot_lookups_are_one_cached_statement_each(db_session):
+    tenant, user = create_user(db_session)
+    tenant_id, user_id, email = tenant.id, user.id, user.email
+    ref = TenantRef(id=tenant_id, name=tenant.name, created_at=None)
+    db_session.expunge_all()
+
+    lookups = (
+        lambda: auth_service._find_user(db_session, ref, email),
+        lambda: user_service.get_user_by_id(db_session, user_id, tenant_id),
+        lambda: get_scoped_resource_or_forbid(db_session, ref, User, user_id),
+    )
+
+    for lookup in lookups:
+        lookup()  # compiled on first use
+        db_session.expunge_all()
+
+        contexts = executions(lookup)
+        db_session.expunge_all()
+
+        # No User.roles selectin round trip, compiled form reused
+        assert len(contexts) == 1
+        assert contexts[0].cache_hit == CACHE_HIT
+
+
+def test_login_lookup_returns_a_core_row(db_session):
+    tenant, user = create_user(db_session)
+    ref = TenantRef(id=tenant.id, name=tenant.name, created_at=None)
+    user_id, email = user.id, user.email
+    db_session.expunge_all()
+
+    row = auth_service._find_user(db_session, ref, email)
+
+    assert row.id == user_id
+    assert row.hashed_password == "fakehashed"
+    assert row.token_epoch == 0
+    assert not any(isinstance(obj, User) for obj in db_session.identity_map.values())
@@ -0,0 +1,186 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.main import app
+from app.core.security import create_access_token
+from app.models.audit_log import AuthorizationAuditLog
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services import audit_service
+from app.services.audit_query import list_tenant_audit
+
+client = TestClient(app)
+
+
+def clear_audit_tables(db_session):
+    db_session.execute(text("DELETE FROM authorization_audit_logs"))
+    db_session.execute(text("DELETE FROM audit_chain_heads"))
+    db_session.commit()
+
+
+def create_tenant_admin(db_session, role_name: str = "admin"):
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    role = Role(name=role_name, tenant_id=tenant.id)
+    role.users.append(user)
+    db_session.add_all([user, role])
+    db_session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token(subject=str(user.id))}"}
+    return tenant, user, headers
+
+
+def log_decisions(db_session, tenant_id: int, count: int):
+    for i in range(count):
+        audit_service.log_authorization_decision(
+            db=db_session,
+            user_id=i % 2 + 1,
+            tenant_id=tenant_id,
+            permission="users:read",
+            allowed=bool(i % 2),
+            reason="permission granted" if i % 2 else "permission_denied",
+            context={"resource_owner_id": i},
+        )
+
+
+def expected_ids(db_session, tenant_id: int, **filters) -> list[int]:
+    query = db_session.query(AuthorizationAuditLog).filter(
+        AuthorizationAuditLog.tenant_id == tenant_id,
+        AuthorizationAuditLog.permission == "users:read",
+    )
+    for name, value in filters.items():
+        query = query.filter(getattr(AuthorizationAuditLog, name) == value)
+
+    return [
+        row.id
+        for row in query.order_by(
+            AuthorizationAuditLog.created_at.desc(), AuthorizationAuditLog.id.desc()
+        )
+    ]
+
+
+def walk(headers, tenant_id: int, **params) -> list[dict]:
+    items, cursor = [], None
+    while True:
+        response = client.get(
+            f"/tenants/{tenant_id}/audit",
+            params={**params, **({"cursor": cursor} if cursor else {})},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= params.get("limit", 50)
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_pages_walk_history_newest_first(db_session):
+    clear_audit_tables(db_session)
+    tenant, _, headers = create_tenant_admin(db_session)
+    log_decisions(db_session, tenant.id, 7)
+    log_decisions(db_session, tenant.id + 1000, 3)  # other tenant
+
+    # Each request also audits its own tenant:admin check, so filter
+    items = walk(headers, tenant.id, permission="users:read", limit=2)
+
+    assert [item["id"] for item in items] == expected_ids(db_session, tenant.id)
+    assert len(items) == 7
+    assert "signature" not in items[0] and "entry_hash" not in items[0]
+
+
+def test_filters(db_session):
+    clear_audit_tables(db_session)
+    tenant, _, headers = create_tenant_admin(db_session)
+    log_decisions(db_session, tenant.id, 8)
+
+    denied = walk(headers, tenant.id, permission="users:read", allowed=False, limit=3)
+    assert [item["id"] for item in denied] == expected_ids(
+        db_session, tenant.id, allowed=False
+    )
+
+    user_two = walk(headers, tenant.id, permission="users:read", user_id=2)
+    assert [item["id"] for item in user_two] == expected_ids(
+        db_session, tenant.id, user_id=2
+    )
+
+    ids = expected_ids(db_session, tenant.id)
+    entries = {
+        row.id: row.created_at
+        for row in db_session.query(AuthorizationAuditLog).filter(
+            AuthorizationAuditLog.id.in_(ids)
+        )
+    }
+    window = walk(
+        headers,
+        tenant.id,
+        permission="users:read",
+        since=entries[ids[5]].isoformat(),
+        until=entries[ids[1]].isoformat(),
+    )
+    assert [item["id"] for item in window] == ids[2:6]
+
+
+def test_ties_on_created_at_are_paged_by_id(db_session):
+    clear_audit_tables(db_session)
+    tenant, _, _ = create_tenant_admin(db_session)
+
+    moment = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    db_session.add_all(
+        AuthorizationAuditLog(
+            tenant_id=tenant.id,
+            user_id=1,
+            permission="users:read",
+            allowed=True,
+            signature="s",
+            entry_hash="h",
+            created_at=moment,
+        )
+        for _ in range(5)
+    )
+    db_session.commit()
+
+    seen, cursor = [], None
+    while True:
+        page = list_tenant_audit(db_session, tenant.id, cursor=cursor, limit=2)
+        seen += [row.id for row in page.items]
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == len(set(seen)) == 5
+
+
+@pytest.mark.parametrize("role_name", ["user", "nobody"])
+def test_requires_tenant_admin(db_session, role_name):
+    tenant, _, headers = create_tenant_admin(db_session, role_name=role_name)
+
+    response = client.get(f"/tenants/{tenant.id}/audit", headers=headers)
+    assert response.status_code == 403
+
+
+def test_cross_tenant_and_bad_cursor(db_session):
+    tenant_a, _, _ = create_tenant_admin(db_session)
+    tenant_b, _, headers_b = create_tenant_admin(db_session)
+
+    response = client.get(f"/tenants/{tenant_a.id}/audit", headers=headers_b)
+    assert response.status_code == 403
+
+    response = client.get(
+        f"/tenants/{tenant_b.id}/audit", params={"cursor": "!!"}, headers=headers_b
+    )
+    assert response.status_code == 400
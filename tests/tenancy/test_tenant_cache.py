@@ -0,0 +1,113 @@
+# tests/tenancy/test_tenant_cache.py
+
+import dataclasses
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.core.security import create_access_token
+from app.core.tenant_cache import get_tenant, tenant_cache
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+
+
+def create_tenant_admin(db_session):
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    user = User(
+        email=f"{uuid.uuid4()}@example.com",
+        hashed_password="fakehashed",
+        tenant_id=tenant.id,
+    )
+    role = Role(name="admin", tenant_id=tenant.id)
+    role.users.append(user)
+    db_session.add_all([user, role])
+    db_session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token(subject=str(user.id))}"}
+    return tenant, headers
+
+
+def tenant_selects(action) -> int:
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    # Cold principals load their tenant through a join (security_context)
+    return sum(1 for s in statements if "FROM tenants" in s or "JOIN tenants" in s)
+
+
+def test_dashboard_loads_tenant_once_then_never(client, db_session):
+    tenant, headers = create_tenant_admin(db_session)
+    url = f"/tenants/{tenant.id}/dashboard"
+    db_session.expunge_all()
+    tenant_cache.clear()
+
+    def dashboard():
+        r = client.get(url, headers=headers)
+        assert r.status_code == 200
+
+    # get_current_tenant and get_current_user_tenant share one load
+    assert tenant_selects(dashboard) == 1
+    assert tenant_selects(dashboard) == 0
+
+
+def test_login_and_refresh_reuse_default_tenant(client):
+    email = f"{uuid.uuid4()}@example.com"
+    body = {"email": email, "password": "password123"}
+    assert client.post("/auth/register", json=body).status_code == 201
+
+    def login_and_refresh():
+        r = client.post("/auth/login", json=body)
+        assert r.status_code == 200
+        r = client.post(
+            "/auth/refresh", json={"refresh_token": r.json()["refresh_token"]}
+        )
+        assert r.status_code == 200
+
+    assert tenant_selects(login_and_refresh) == 0
+
+
+def test_tenant_writes_invalidate(client, db_session):
+    tenant, headers = create_tenant_admin(db_session)
+    assert get_tenant(db_session, tenant.id).name == tenant.name
+
+    tenant.name = f"renamed-{uuid.uuid4()}"
+    db_session.commit()
+    assert get_tenant(db_session, tenant.id).name == tenant.name
+
+    db_session.delete(tenant)
+    db_session.commit()
+    r = client.get(f"/tenants/{tenant.id}/dashboard", headers=headers)
+    assert r.status_code in (401, 404)  # the user went with the tenant
+    assert get_tenant(db_session, tenant.id) is None
+
+
+def test_snapshots_are_immutable_and_races_are_not_stored(db_session):
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+    tenant_cache.clear()
+
+    stale_generation = tenant_cache.generation
+    snapshot = get_tenant(db_session, tenant.id)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.name = "changed"
+
+    # A load started before an invalidation must not repopulate the cache
+    tenant_cache.clear()
+    tenant_cache.invalidate()
+    tenant_cache.put(stale_generation, tenant.id, snapshot)
+    assert tenant_cache.get(tenant.id) is None
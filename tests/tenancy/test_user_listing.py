@@ -0,0 +1,110 @@
+# tests/tenancy/test_user_listing.py
+
+import json
+import uuid
+
+import pytest
+
+from app.core.security import create_access_token
+from app.models.role import Role
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services import user_service
+
+
+def create_tenant_with_users(db_session, count: int):
+    tenant = Tenant(name=f"tenant-{uuid.uuid4()}")
+    db_session.add(tenant)
+    db_session.commit()
+
+    users = [
+        User(
+            email=f"{uuid.uuid4()}@example.com",
+            hashed_password="fakehashed",
+            tenant_id=tenant.id,
+        )
+        for _ in range(count)
+    ]
+    role = Role(name="user", tenant_id=tenant.id)
+    role.users.append(users[0])
+    db_session.add_all([*users, role])
+    db_session.commit()
+
+    return tenant, users
+
+
+def test_keyset_pages_cover_tenant_in_id_order(db_session):
+    tenant, users = create_tenant_with_users(db_session, 5)
+    create_tenant_with_users(db_session, 2)  # other tenant: never listed
+
+    seen, cursor = [], None
+    while True:
+        page = user_service.list_users(db_session, tenant.id, cursor=cursor, limit=2)
+        assert len(page.items) <= 2
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert [row.id for row in seen] == sorted(u.id for u in users)
+    # Public columns only
+    assert set(seen[0]._fields) == {"id", "email", "tenant_id"}
+
+
+def test_stream_yields_every_row_in_batches(db_session):
+    tenant, users = create_tenant_with_users(db_session, 5)
+
+    batches = list(user_service.stream_users(db_session, tenant.id, batch_size=2))
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [row.id for b in batches for row in b] == sorted(u.id for u in users)
+
+
+def test_invalid_cursor_is_rejected(client, db_session):
+    _, users = create_tenant_with_users(db_session, 1)
+    headers = {"Authorization": f"Bearer {create_access_token(str(users[0].id))}"}
+
+    with pytest.raises(user_service.InvalidCursor):
+        user_service.stream_users(db_session, users[0].tenant_id, cursor="nope")
+
+    for params in ({"cursor": "nope"}, {"cursor": "nope", "stream": "true"}):
+        r = client.get("/users/", params=params, headers=headers)
+        assert r.status_code == 400
+
+
+def test_endpoint_pages_through_next_cursor_header(client, db_session):
+    _, users = create_tenant_with_users(db_session, 5)
+    caller = users[0]
+    headers = {"Authorization": f"Bearer {create_access_token(str(caller.id))}"}
+
+    bodies, params = [], {"limit": 2}
+    while True:
+        r = client.get("/users/", params=params, headers=headers)
+        assert r.status_code == 200
+        bodies.append(r.json())
+        if "X-Next-Cursor" not in r.headers:
+            break
+        params = {"limit": 2, "cursor": r.headers["X-Next-Cursor"]}
+
+    assert len(bodies) == 3
+    # The "user" role reads itself only; other rows are filtered per page
+    visible = [u for body in bodies for u in body]
+    assert visible == [
+        {"id": caller.id, "email": caller.email, "tenant_id": caller.tenant_id}
+    ]
+
+
+def test_endpoint_streams_ndjson(client, db_session):
+    _, users = create_tenant_with_users(db_session, 3)
+    caller = users[0]
+    headers = {"Authorization": f"Bearer {create_access_token(str(caller.id))}"}
+
+    r = client.get("/users/", params={"stream": "true"}, headers=headers)
+
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert lines == [
+        {"id": caller.id, "email": caller.email, "tenant_id": caller.tenant_id}
+    ]
+    assert "hashed_password" not in r.text